@@ -0,0 +1,152 @@
+"""Repeatable query latency benchmarks with percentile summaries.
+
+Each query gets warmup runs (plan cache, page cache) before N timed
+repetitions. Client time is wall time around the call, measured with
+``perf_counter_ns``; server time is the execution time FalkorDB reports for
+the same call, so the difference is network and result decoding.
+"""
+from __future__ import annotations
+
+import json
+import math
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+DEFAULT_REPORT = Path("data/reports/query_benchmark.json")
+DEFAULT_WARMUP = 3
+DEFAULT_REPEAT = 30
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Linearly interpolated percentile (``q`` in 0-100) of ``samples``."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * q / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+@dataclass
+class LatencySummary:
+    count: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+    @classmethod
+    def from_samples(cls, samples_ms: Sequence[float]) -> "LatencySummary":
+        return cls(
+            count=len(samples_ms),
+            mean_ms=sum(samples_ms) / len(samples_ms) if samples_ms else 0.0,
+            p50_ms=percentile(samples_ms, 50),
+            p95_ms=percentile(samples_ms, 95),
+            p99_ms=percentile(samples_ms, 99),
+            max_ms=max(samples_ms, default=0.0),
+        )
+
+
+@dataclass
+class QueryBenchmark:
+    name: str
+    query: str
+    rows: int
+    cached_ratio: float
+    client: LatencySummary
+    server: LatencySummary
+    client_samples_ms: List[float]
+    server_samples_ms: List[float]
+
+    def to_dict(self, samples: bool = True) -> Dict[str, Any]:
+        data = asdict(self)
+        data["query"] = " ".join(self.query.split())
+        if not samples:
+            data.pop("client_samples_ms")
+            data.pop("server_samples_ms")
+        return data
+
+
+def benchmark_query(
+    graph,
+    name: str,
+    query: str,
+    params: Optional[Dict[str, Any]] = None,
+    warmup: int = DEFAULT_WARMUP,
+    repeat: int = DEFAULT_REPEAT,
+) -> QueryBenchmark:
+    """Time ``repeat`` read-only executions of ``query`` after ``warmup`` runs."""
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1")
+    for _ in range(warmup):
+        graph.ro_query(query, params=params)
+
+    client: List[float] = []
+    server: List[float] = []
+    cached = 0
+    rows = 0
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        result = graph.ro_query(query, params=params)
+        client.append((time.perf_counter_ns() - start) / 1e6)
+        server.append(float(getattr(result, "run_time_ms", 0.0) or 0.0))
+        cached += bool(getattr(result, "cached_execution", False))
+        rows = len(result.result_set)
+
+    return QueryBenchmark(
+        name=name,
+        query=query,
+        rows=rows,
+        cached_ratio=cached / repeat,
+        client=LatencySummary.from_samples(client),
+        server=LatencySummary.from_samples(server),
+        client_samples_ms=client,
+        server_samples_ms=server,
+    )
+
+
+def run_benchmark(
+    graph,
+    queries: Iterable[Dict[str, Any]],
+    warmup: int = DEFAULT_WARMUP,
+    repeat: int = DEFAULT_REPEAT,
+) -> List[QueryBenchmark]:
+    """Benchmark ``{"name", "query"[, "params"]}`` entries one after another."""
+    return [
+        benchmark_query(graph, q["name"], q["query"], q.get("params"), warmup=warmup, repeat=repeat)
+        for q in queries
+    ]
+
+
+def write_report(
+    results: Sequence[QueryBenchmark],
+    path: Path = DEFAULT_REPORT,
+    warmup: int = DEFAULT_WARMUP,
+    repeat: int = DEFAULT_REPEAT,
+    **metadata: Any,
+) -> Dict[str, Any]:
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "warmup": warmup,
+        "repeat": repeat,
+        **metadata,
+        "queries": [result.to_dict() for result in results],
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+    return report
+
+
+def load_report(path: Path = DEFAULT_REPORT) -> Optional[Dict[str, Any]]:
+    """The last written report, or None if no benchmark has been run yet."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    with path.open("r", encoding="utf-8") as handle:
+        return json.load(handle)
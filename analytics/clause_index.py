@@ -0,0 +1,156 @@
+"""Token-level inverted index over clause text, ranked with BM25.
+
+Clauses are indexed by the lowercase alphanumeric tokens of their title,
+category and text preview. A query token matches every indexed term it is a
+prefix of, so "indemnit" finds "indemnity" and "indemnities" like the old
+``CONTAINS`` filter did for word starts. Fields are weighted before BM25
+saturation (BM25F-style), so a term in the title counts for more than the
+same term in the body text.
+
+The index is keyed by graph node id and can be kept in step with the graph
+through ``sync``, which only re-tokenizes clauses that were added, changed or
+removed since the last call.
+"""
+from __future__ import annotations
+
+import bisect
+import math
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Indexed clause properties and their term-frequency weights
+FIELD_WEIGHTS: Dict[str, float] = {"title": 3.0, "category": 2.0, "text_preview": 1.0}
+
+# Prefix queries shorter than this match the term exactly (FalkorDB's full-text
+# index refuses shorter prefixes too)
+MIN_PREFIX = 2
+
+
+def tokenize(text: Any) -> List[str]:
+    if not isinstance(text, str):
+        return []
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def fulltext_query(keyword: str) -> str:
+    """FalkorDB full-text query matching the same word prefixes as ClauseIndex.search."""
+    terms = [f"{token}*" if len(token) >= MIN_PREFIX else token for token in tokenize(keyword)]
+    return " | ".join(terms)
+
+
+class ClauseIndex:
+    """Inverted index of clause nodes: term -> {node id: weighted term frequency}."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75,
+                 field_weights: Mapping[str, float] = FIELD_WEIGHTS) -> None:
+        self.k1 = k1
+        self.b = b
+        self.field_weights = dict(field_weights)
+        self.postings: Dict[str, Dict[int, float]] = {}
+        self.lengths: Dict[int, float] = {}
+        self.total_length = 0.0
+        self._fields: Dict[int, Tuple[Any, ...]] = {}
+        self._terms: Dict[int, Tuple[str, ...]] = {}
+        self._vocabulary: Optional[List[str]] = None
+
+    @classmethod
+    def from_nodes(cls, nodes: Mapping[int, Mapping[str, Any]], **kwargs: Any) -> "ClauseIndex":
+        index = cls(**kwargs)
+        index.sync(nodes)
+        return index
+
+    def copy(self) -> "ClauseIndex":
+        """Independent copy, for updating without disturbing readers of this one."""
+        index = ClauseIndex(self.k1, self.b, self.field_weights)
+        index.postings = {term: dict(postings) for term, postings in self.postings.items()}
+        index.lengths = dict(self.lengths)
+        index.total_length = self.total_length
+        index._fields = dict(self._fields)
+        index._terms = dict(self._terms)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def __contains__(self, node_id: int) -> bool:
+        return node_id in self.lengths
+
+    def add(self, node_id: int, props: Mapping[str, Any]) -> None:
+        """Index (or re-index) one clause."""
+        if node_id in self:
+            self.remove(node_id)
+        frequencies: Dict[str, float] = defaultdict(float)
+        for field, weight in self.field_weights.items():
+            for token in tokenize(props.get(field)):
+                frequencies[token] += weight
+        for term, frequency in frequencies.items():
+            if term not in self.postings:
+                self.postings[term] = {}
+                self._vocabulary = None
+            self.postings[term][node_id] = frequency
+        length = sum(frequencies.values())
+        self.lengths[node_id] = length
+        self.total_length += length
+        self._fields[node_id] = tuple(props.get(field) for field in self.field_weights)
+        self._terms[node_id] = tuple(frequencies)
+
+    def remove(self, node_id: int) -> None:
+        if node_id not in self:
+            return
+        for term in self._terms.pop(node_id):
+            postings = self.postings.get(term)
+            if postings is not None:
+                postings.pop(node_id, None)
+                if not postings:
+                    del self.postings[term]
+                    self._vocabulary = None
+        self.total_length -= self.lengths.pop(node_id)
+        del self._fields[node_id]
+
+    def sync(self, nodes: Mapping[int, Mapping[str, Any]]) -> int:
+        """Bring the index in line with ``nodes``; returns how many clauses changed."""
+        changed = 0
+        for node_id in [node_id for node_id in self.lengths if node_id not in nodes]:
+            self.remove(node_id)
+            changed += 1
+        for node_id, props in nodes.items():
+            if self._fields.get(node_id) != tuple(props.get(field) for field in self.field_weights):
+                self.add(node_id, props)
+                changed += 1
+        return changed
+
+    def expand(self, token: str) -> List[str]:
+        """Indexed terms ``token`` matches: those it prefixes, or itself if too short."""
+        if len(token) < MIN_PREFIX:
+            return [token] if token in self.postings else []
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        start = bisect.bisect_left(self._vocabulary, token)
+        end = bisect.bisect_left(self._vocabulary, token + "\uffff")
+        return self._vocabulary[start:end]
+
+    def idf(self, term: str) -> float:
+        document_count = len(self.postings.get(term, ()))
+        return math.log(1 + (len(self) - document_count + 0.5) / (document_count + 0.5))
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """(node id, BM25 score) of clauses matching any query token, best first."""
+        if not self.lengths:
+            return []
+        average_length = self.total_length / len(self) or 1.0
+        scores: Dict[int, float] = defaultdict(float)
+        for term in {term for token in tokenize(query) for term in self.expand(token)}:
+            idf = self.idf(term)
+            for node_id, frequency in self.postings[term].items():
+                norm = self.k1 * (1 - self.b + self.b * self.lengths[node_id] / average_length)
+                scores[node_id] += idf * frequency * (self.k1 + 1) / (frequency + norm)
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit] if limit is not None else ranked
+
+    def candidates(self, query: str) -> Iterable[int]:
+        """Node ids matching any query token, unranked."""
+        return {node_id for token in tokenize(query) for term in self.expand(token)
+                for node_id in self.postings[term]}
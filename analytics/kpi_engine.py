@@ -0,0 +1,353 @@
+"""Set-based KPI computations shared by the live graph and offline snapshots.
+
+Each KPI is split into a small number of grouped row fetches, answered either
+by FalkorDB (GraphSource) or by an exported GraphSnapshot (SnapshotSource),
+and a pure-Python reduction over those rows. Results match the original
+per-matter query loops in scripts/measure_kpis.py.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Tuple
+
+from analytics.snapshot import GraphSnapshot
+
+# (matter_id, clause_number, version, title, node_count)
+ClauseGroup = Tuple[Any, Any, Any, Any, int]
+# (matter_id, clause_number, version, issue_type, classification)
+AppliedRecommendation = Tuple[Any, Any, Any, Any, Any]
+# (matter_id, clause_number, issue_type, latest clause version)
+IssueVersion = Tuple[Any, Any, Any, Any]
+# (label, matter_id, version, distinct node count); Party rows have no version
+ElementCount = Tuple[str, Any, Any, int]
+
+# KPI #3 element kinds, in the order they appear in the completeness report
+ELEMENT_LABELS: Dict[str, str] = {
+    "Matter": "matter",
+    "Party": "parties",
+    "Clause": "clauses",
+    "Recommendation": "recommendations",
+    "Decision": "decisions",
+    "Concession": "concessions",
+}
+
+MATTER_IDS_QUERY = """
+MATCH (m:Matter)
+RETURN DISTINCT m.matter_id
+"""
+
+CLAUSE_GROUPS_QUERY = """
+MATCH (c:Clause)
+RETURN c.matter_id, c.clause_number, c.version, c.title, COUNT(c)
+"""
+
+# One row per Clause -> Recommendation -> 'apply' Decision path
+APPLIED_RECOMMENDATIONS_QUERY = """
+MATCH (c:Clause)-[:HAS_RECOMMENDATION]->(r:Recommendation)-[:HAS_DECISION]->(:Decision {decision_type: 'apply'})
+RETURN c.matter_id, c.clause_number, c.version, r.issue_type, r.classification
+"""
+
+LATEST_ISSUE_VERSIONS_QUERY = """
+MATCH (c:Clause)-[:HAS_RECOMMENDATION]->(r:Recommendation)
+RETURN c.matter_id, c.clause_number, r.issue_type, MAX(c.version)
+"""
+
+# Each branch is grouped on its own, so counts never multiply across labels
+# the way a chain of OPTIONAL MATCHes does before COUNT(DISTINCT ...).
+ELEMENT_COUNTS_QUERY = """
+MATCH (m:Matter)
+RETURN 'Matter' AS label, m.matter_id AS matter_id, m.version AS version, COUNT(m) AS n
+UNION ALL
+MATCH (p:Party)
+RETURN 'Party' AS label, p.matter_id AS matter_id, null AS version, COUNT(p) AS n
+UNION ALL
+MATCH (c:Clause)
+RETURN 'Clause' AS label, c.matter_id AS matter_id, c.version AS version, COUNT(c) AS n
+UNION ALL
+MATCH (c:Clause)-[:HAS_RECOMMENDATION]->(r:Recommendation)
+RETURN 'Recommendation' AS label, c.matter_id AS matter_id, c.version AS version, COUNT(DISTINCT r) AS n
+UNION ALL
+MATCH (c:Clause)-[:HAS_RECOMMENDATION]->(:Recommendation)-[:HAS_DECISION]->(d:Decision)
+RETURN 'Decision' AS label, c.matter_id AS matter_id, c.version AS version, COUNT(DISTINCT d) AS n
+UNION ALL
+MATCH (c:Clause)-[:HAS_RECOMMENDATION]->(:Recommendation)-[:HAS_DECISION]->(:Decision)-[:RESULTED_IN_CONCESSION]->(con:Concession)
+RETURN 'Concession' AS label, c.matter_id AS matter_id, c.version AS version, COUNT(DISTINCT con) AS n
+"""
+
+
+class GraphSource:
+    """Row fetches answered by FalkorDB, one grouped query each."""
+
+    def __init__(self, graph) -> None:
+        self.graph = graph
+
+    def matter_ids(self) -> List[Any]:
+        return [row[0] for row in self.graph.ro_query(MATTER_IDS_QUERY).result_set]
+
+    def clause_groups(self) -> List[ClauseGroup]:
+        return [tuple(row) for row in self.graph.ro_query(CLAUSE_GROUPS_QUERY).result_set]
+
+    def applied_recommendations(self) -> List[AppliedRecommendation]:
+        return [tuple(row) for row in self.graph.ro_query(APPLIED_RECOMMENDATIONS_QUERY).result_set]
+
+    def latest_issue_versions(self) -> List[IssueVersion]:
+        return [tuple(row) for row in self.graph.ro_query(LATEST_ISSUE_VERSIONS_QUERY).result_set]
+
+    def element_counts(self) -> List[ElementCount]:
+        return [tuple(row) for row in self.graph.ro_query(ELEMENT_COUNTS_QUERY).result_set]
+
+
+class SnapshotSource:
+    """The same row fetches computed in memory from a GraphSnapshot."""
+
+    def __init__(self, snapshot: GraphSnapshot) -> None:
+        self.snapshot = snapshot
+
+    def matter_ids(self) -> List[Any]:
+        return list(dict.fromkeys(props.get("matter_id") for _, props in self.snapshot.iter_nodes("Matter")))
+
+    def clause_groups(self) -> List[ClauseGroup]:
+        counts: Dict[Tuple[Any, ...], int] = defaultdict(int)
+        for _, props in self.snapshot.iter_nodes("Clause"):
+            key = (props.get("matter_id"), props.get("clause_number"), props.get("version"), props.get("title"))
+            counts[key] += 1
+        return [key + (count,) for key, count in counts.items()]
+
+    def _recommendation_paths(self) -> Iterable[Tuple[Dict[str, Any], int, Dict[str, Any]]]:
+        snapshot = self.snapshot
+        for clause_id, clause in snapshot.iter_nodes("Clause"):
+            for rec_id in snapshot.targets("HAS_RECOMMENDATION", clause_id):
+                yield clause, rec_id, snapshot.node("Recommendation", rec_id)
+
+    def applied_recommendations(self) -> List[AppliedRecommendation]:
+        rows = []
+        for clause, rec_id, rec in self._recommendation_paths():
+            for decision_id in self.snapshot.targets("HAS_DECISION", rec_id):
+                if self.snapshot.node("Decision", decision_id).get("decision_type") == "apply":
+                    rows.append((clause.get("matter_id"), clause.get("clause_number"), clause.get("version"),
+                                 rec.get("issue_type"), rec.get("classification")))
+        return rows
+
+    def latest_issue_versions(self) -> List[IssueVersion]:
+        latest: Dict[Tuple[Any, Any, Any], Any] = {}
+        for clause, _, rec in self._recommendation_paths():
+            key = (clause.get("matter_id"), clause.get("clause_number"), rec.get("issue_type"))
+            version = clause.get("version")
+            if version is not None and (latest.get(key) is None or version > latest[key]):
+                latest[key] = version
+            else:
+                latest.setdefault(key, None)
+        return [key + (version,) for key, version in latest.items()]
+
+    def element_counts(self) -> List[ElementCount]:
+        snapshot = self.snapshot
+        counts: Dict[Tuple[str, Any, Any], int] = defaultdict(int)
+        for _, props in snapshot.iter_nodes("Matter"):
+            counts[("Matter", props.get("matter_id"), props.get("version"))] += 1
+        for _, props in snapshot.iter_nodes("Party"):
+            counts[("Party", props.get("matter_id"), None)] += 1
+
+        reached: Dict[Tuple[str, Any, Any], set] = defaultdict(set)
+        for clause_id, props in snapshot.iter_nodes("Clause"):
+            group = (props.get("matter_id"), props.get("version"))
+            counts[("Clause",) + group] += 1
+            for rec_id in snapshot.targets("HAS_RECOMMENDATION", clause_id):
+                reached[("Recommendation",) + group].add(rec_id)
+                for decision_id in snapshot.targets("HAS_DECISION", rec_id):
+                    reached[("Decision",) + group].add(decision_id)
+                    for concession_id in snapshot.targets("RESULTED_IN_CONCESSION", decision_id):
+                        reached[("Concession",) + group].add(concession_id)
+        counts.update({key: len(ids) for key, ids in reached.items()})
+        return [key + (count,) for key, count in counts.items()]
+
+
+def _sort_key(value: Any) -> Tuple[bool, Any]:
+    # FalkorDB orders nulls last
+    return (value is None, value if value is not None else "")
+
+
+def _mismatched_title_pairs(titles_by_version: Dict[Any, set]) -> int:
+    """Ordered pairs of distinct titles seen on two different versions.
+
+    Equivalent to grouping the ``c1.title <> c2.title AND c1.version <>
+    c2.version`` self-join by (title1, title2), without building it.
+    """
+    versions_by_title: Dict[Any, set] = defaultdict(set)
+    for version, titles in titles_by_version.items():
+        for title in titles:
+            versions_by_title[title].add(version)
+    titles = list(versions_by_title)
+    pairs = 0
+    for t1 in titles:
+        for t2 in titles:
+            if t1 == t2:
+                continue
+            v1, v2 = versions_by_title[t1], versions_by_title[t2]
+            # Only fails when both titles occur in one and the same version
+            if not (len(v1) == 1 and v1 == v2):
+                pairs += 1
+    return pairs
+
+
+def compute_clause_linkage(matter_ids: Iterable[Any], clause_groups: Iterable[ClauseGroup]) -> Dict[str, Any]:
+    """KPI #1 counts from one matter list and one grouped clause fetch.
+
+    True positives come from clauses of matters that have a Matter node;
+    false positives, like the original self-join, consider every clause.
+    """
+    matters = set(matter_ids)
+    versions_found: Dict[Tuple[Any, Any], int] = defaultdict(int)
+    titles: Dict[Tuple[Any, Any], Dict[Any, set]] = defaultdict(lambda: defaultdict(set))
+
+    for matter_id, clause_number, version, title, count in clause_groups:
+        if matter_id in matters:
+            # A null clause_number never matches the per-number lookup
+            versions_found[(matter_id, clause_number)] += count if clause_number is not None else 0
+        if None not in (matter_id, clause_number, version, title):
+            titles[(matter_id, clause_number)][version].add(title)
+
+    details: List[Dict[str, Any]] = []
+    true_positives = 0
+    for matter_id, clause_number in sorted(versions_found, key=lambda k: (_sort_key(k[0]), _sort_key(k[1]))):
+        found = versions_found[(matter_id, clause_number)]
+        if found > 1:
+            true_positives += found - 1
+            details.append({
+                "matter_id": matter_id,
+                "clause_number": clause_number,
+                "versions_found": found,
+                "linkable": True,
+                "links": found - 1,
+            })
+        else:
+            details.append({
+                "matter_id": matter_id,
+                "clause_number": clause_number,
+                "versions_found": 1,
+                "linkable": False,
+            })
+
+    false_positives = sum(_mismatched_title_pairs(by_version) for by_version in titles.values())
+    return {
+        "true_positives": true_positives,
+        "false_positives": false_positives,
+        "linkable_clauses": sum(1 for d in details if d["linkable"]),
+        "linked_clauses": sum(d["links"] for d in details if d["linkable"]),
+        "linkage_details": details,
+    }
+
+
+def clause_linkage(source) -> Dict[str, Any]:
+    return compute_clause_linkage(source.matter_ids(), source.clause_groups())
+
+
+def compute_recommendation_suppression(
+    matter_ids: Iterable[Any],
+    applied: Iterable[AppliedRecommendation],
+    latest_versions: Iterable[IssueVersion],
+) -> Dict[str, Any]:
+    """KPI #2 as a hash join of applied recommendations on the latest version
+    each (matter, clause_number, issue_type) was recommended in.
+
+    An applied recommendation counts as repeated when that issue comes back
+    on the same clause number in any later version.
+    """
+    matters = set(matter_ids)
+    latest = {(m, n, issue): version for m, n, issue, version in latest_versions}
+
+    rows = sorted(
+        (row for row in applied if row[0] in matters),
+        key=lambda row: (_sort_key(row[0]), _sort_key(row[1]), _sort_key(row[2])),
+    )
+    details: List[Dict[str, Any]] = []
+    repeated_count = 0
+    for matter_id, clause_number, version, issue_type, classification in rows:
+        later = latest.get((matter_id, clause_number, issue_type))
+        # Null keys never match the original property-map lookup
+        repeated = (
+            None not in (clause_number, version, issue_type, later)
+            and later > version
+        )
+        repeated_count += repeated
+        details.append({
+            "matter_id": matter_id,
+            "clause_number": clause_number,
+            "version": version,
+            "issue_type": issue_type,
+            "classification": classification,
+            "repeated_in_later_versions": repeated,
+        })
+
+    return {
+        "applied_recommendations": len(details),
+        "not_repeated": len(details) - repeated_count,
+        "repeated": repeated_count,
+        "suppression_details": details,
+    }
+
+
+def recommendation_suppression(source) -> Dict[str, Any]:
+    return compute_recommendation_suppression(
+        source.matter_ids(), source.applied_recommendations(), source.latest_issue_versions()
+    )
+
+
+def completeness_score(elements: Dict[str, int]) -> float:
+    """Share of the six required handover elements present for one version.
+
+    Recommendations, decisions and concessions may legitimately be absent
+    (later versions, rare concessions), so they always count as present.
+    """
+    present = 0
+    if elements["matter"] > 0:
+        present += 1
+    if elements["parties"] >= 2:
+        present += 1
+    if elements["clauses"] > 0:
+        present += 1
+    present += 3
+    return present / len(ELEMENT_LABELS)
+
+
+def compute_handover_completeness(element_counts: Iterable[ElementCount]) -> Dict[str, Any]:
+    """KPI #3 scores for every Matter node from one set of per-label counts.
+
+    Produces one score per Matter node, ordered by (matter_id, version), as
+    the original per-version query did; a matter version with a null key
+    matched nothing there and scores on all-zero counts here.
+    """
+    counts: Dict[Tuple[str, Any, Any], int] = {}
+    matter_nodes: Dict[Tuple[Any, Any], int] = defaultdict(int)
+    for label, matter_id, version, count in element_counts:
+        counts[(label, matter_id, version)] = count
+        if label == "Matter":
+            matter_nodes[(matter_id, version)] += count
+
+    scores: List[Dict[str, Any]] = []
+    for matter_id, version in sorted(matter_nodes, key=lambda k: (_sort_key(k[0]), _sort_key(k[1]))):
+        if None in (matter_id, version):
+            elements = {name: 0 for name in ELEMENT_LABELS.values()}
+        else:
+            elements = {
+                name: counts.get((label, matter_id, None if label == "Party" else version), 0)
+                for label, name in ELEMENT_LABELS.items()
+            }
+        score = {
+            "matter_id": matter_id,
+            "version": version,
+            "completeness": completeness_score(elements),
+            "elements": elements,
+        }
+        # Duplicate Matter nodes each got their own row before
+        scores.extend(dict(score, elements=dict(elements)) for _ in range(matter_nodes[(matter_id, version)]))
+
+    average = sum(s["completeness"] for s in scores) / len(scores) if scores else 0
+    return {
+        "versions_measured": len(scores),
+        "average_completeness": average,
+        "completeness_scores": scores,
+    }
+
+
+def handover_completeness(source) -> Dict[str, Any]:
+    return compute_handover_completeness(source.element_counts())
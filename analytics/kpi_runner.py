@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Sequence
+
+from analytics.kpi_queries import Query
+
+PARAMETER_PATTERN = re.compile(r"\$(\w+)")
+
+
+def required_parameters(query: Query) -> List[str]:
+    return list(dict.fromkeys(PARAMETER_PATTERN.findall(query.cypher)))
+
+
+def missing_parameters(query: Query) -> List[str]:
+    return [name for name in required_parameters(query) if name not in query.parameters]
+
+
+def result_bytes(rows: Sequence[Sequence[Any]]) -> int:
+    """Size of the result set as JSON, a stable proxy for bytes returned."""
+    return len(json.dumps(rows, default=str).encode("utf-8"))
+
+
+def execute_query(graph, query: Query, iteration: int = 0) -> Dict[str, Any]:
+    """Run ``query`` once and describe the outcome as one metrics record."""
+    record: Dict[str, Any] = {
+        "query": query.name,
+        "iteration": iteration,
+        "parameters": query.parameters,
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "worker": threading.current_thread().name,
+    }
+    missing = missing_parameters(query)
+    if missing:
+        record.update(status="skipped", error=f"missing parameters: {', '.join(missing)}")
+        return record
+
+    start = time.perf_counter_ns()
+    try:
+        result = graph.ro_query(query.cypher, params=query.parameters or None)
+    except Exception as exc:  # recorded, so one bad query does not end the run
+        record.update(
+            status="error",
+            latency_ms=(time.perf_counter_ns() - start) / 1e6,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+        return record
+    latency_ms = (time.perf_counter_ns() - start) / 1e6
+
+    rows = result.result_set
+    record.update(
+        status="ok",
+        latency_ms=latency_ms,
+        server_ms=float(getattr(result, "run_time_ms", 0.0) or 0.0),
+        cached=bool(getattr(result, "cached_execution", False)),
+        rows=len(rows),
+        bytes=result_bytes(rows),
+    )
+    return record
+
+
+def stream_executions(
+    graph_factory: Callable[[], Any],
+    queries: Sequence[Query],
+    repeat: int = 1,
+    concurrency: int = 1,
+) -> Iterator[Dict[str, Any]]:
+    """Yield a record as each of ``repeat`` x ``queries`` executions finishes.
+
+    Executions run on ``concurrency`` threads, each with its own graph handle
+    from ``graph_factory``; records arrive in completion order.
+    """
+    if repeat < 1 or concurrency < 1:
+        raise ValueError("repeat and concurrency must be at least 1")
+    local = threading.local()
+
+    def run(query: Query, iteration: int) -> Dict[str, Any]:
+        graph = getattr(local, "graph", None)
+        if graph is None:
+            graph = local.graph = graph_factory()
+        return execute_query(graph, query, iteration)
+
+    jobs = [(query, iteration) for iteration in range(repeat) for query in queries]
+    if concurrency == 1:
+        for query, iteration in jobs:
+            yield run(query, iteration)
+        return
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="kpi") as pool:
+        futures = [pool.submit(run, query, iteration) for query, iteration in jobs]
+        for future in as_completed(futures):
+            yield future.result()
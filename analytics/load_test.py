@@ -0,0 +1,253 @@
+"""Closed-loop load generator for the graph behind the Streamlit app.
+
+K client threads, each with its own connection, repeatedly pick an
+operation from a weighted mix (natural-language questions and KPI #5
+queries) and run it back to back. One run per concurrency level gives the
+throughput, tail latency and error rate curves.
+"""
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from analytics.benchmark import LatencySummary
+
+DEFAULT_REPORT = Path("data/reports/load_test.json")
+DEFAULT_CHART = Path("data/reports/load_test.html")
+DEFAULT_LEVELS = (1, 5, 10, 25, 50)
+
+
+@dataclass(frozen=True)
+class Operation:
+    """One request type in the mix; ``run(client)`` raises or returns False on error."""
+
+    name: str
+    kind: str
+    weight: float
+    run: Callable[[Any], Any]
+
+
+def nl_operation(question: str, weight: float) -> Operation:
+    def run(client) -> bool:
+        return bool(client.nl.execute_query(question).get("success"))
+
+    return Operation(name=question, kind="nl", weight=weight, run=run)
+
+
+def cypher_operation(name: str, query: str, weight: float, params: Optional[Dict[str, Any]] = None) -> Operation:
+    def run(client) -> bool:
+        client.graph.ro_query(query, params=params)
+        return True
+
+    return Operation(name=name, kind="kpi", weight=weight, run=run)
+
+
+def build_mix(
+    questions: Sequence[str],
+    kpi_queries: Sequence[Dict[str, Any]],
+    nl_share: float = 0.7,
+) -> List[Operation]:
+    """Spread ``nl_share`` evenly over the questions and the rest over KPI queries."""
+    if not 0 <= nl_share <= 1:
+        raise ValueError("nl_share must be between 0 and 1")
+    ops = [nl_operation(q, nl_share / len(questions)) for q in questions] if questions else []
+    if kpi_queries:
+        share = (1 - nl_share) / len(kpi_queries)
+        ops += [cypher_operation(q["name"], q["query"], share, q.get("params")) for q in kpi_queries]
+    return [op for op in ops if op.weight > 0]
+
+
+@dataclass
+class Sample:
+    operation: str
+    kind: str
+    latency_ms: float
+    ok: bool
+    error: Optional[str] = None
+
+
+@dataclass
+class OperationStats:
+    requests: int
+    errors: int
+    latency: LatencySummary
+
+
+@dataclass
+class LevelResult:
+    concurrency: int
+    requests: int
+    errors: int
+    wall_seconds: float
+    throughput_rps: float
+    error_rate: float
+    latency: LatencySummary
+    by_kind: Dict[str, OperationStats] = field(default_factory=dict)
+    by_operation: Dict[str, OperationStats] = field(default_factory=dict)
+    top_errors: List[List[Any]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _stats(samples: Sequence[Sample]) -> OperationStats:
+    return OperationStats(
+        requests=len(samples),
+        errors=sum(1 for s in samples if not s.ok),
+        latency=LatencySummary.from_samples([s.latency_ms for s in samples]),
+    )
+
+
+def summarize_level(concurrency: int, samples: Sequence[Sample], wall_seconds: float) -> LevelResult:
+    errors = sum(1 for s in samples if not s.ok)
+    grouped: Dict[str, Dict[str, List[Sample]]] = {"kind": {}, "operation": {}}
+    for sample in samples:
+        grouped["kind"].setdefault(sample.kind, []).append(sample)
+        grouped["operation"].setdefault(sample.operation, []).append(sample)
+    return LevelResult(
+        concurrency=concurrency,
+        requests=len(samples),
+        errors=errors,
+        wall_seconds=wall_seconds,
+        throughput_rps=len(samples) / wall_seconds if wall_seconds > 0 else 0.0,
+        error_rate=errors / len(samples) if samples else 0.0,
+        latency=LatencySummary.from_samples([s.latency_ms for s in samples]),
+        by_kind={kind: _stats(group) for kind, group in grouped["kind"].items()},
+        by_operation={name: _stats(group) for name, group in grouped["operation"].items()},
+        top_errors=[[message, count] for message, count in
+                    Counter(s.error for s in samples if s.error).most_common(5)],
+    )
+
+
+def run_level(
+    client_factory: Callable[[], Any],
+    operations: Sequence[Operation],
+    concurrency: int,
+    duration: Optional[float] = None,
+    requests_per_client: Optional[int] = None,
+    seed: int = 0,
+) -> LevelResult:
+    """Run ``concurrency`` clients until ``duration`` seconds or N requests each.
+
+    Clients connect before the clock starts, so connection setup is not
+    counted as load. A client with a ``close()`` method is closed when its
+    loop finishes.
+    """
+    if (duration is None) == (requests_per_client is None):
+        raise ValueError("pass exactly one of duration or requests_per_client")
+    weights = [op.weight for op in operations]
+    samples: List[Sample] = []
+    lock = threading.Lock()
+    clock: List[float] = []
+
+    def start_clock() -> None:
+        # Runs once, before any party is released, so every client sees the deadline
+        now = time.perf_counter()
+        clock.append(now)
+        if duration is not None:
+            clock.append(now + duration)
+
+    ready = threading.Barrier(concurrency + 1, action=start_clock)
+
+    def client_loop(index: int) -> None:
+        try:
+            client = client_factory()
+        except Exception as exc:
+            ready.wait()
+            with lock:
+                samples.append(Sample("connect", "connect", 0.0, False, f"{type(exc).__name__}: {exc}"))
+            return
+        try:
+            ready.wait()
+            rng = random.Random(seed * 10_007 + index)
+            local: List[Sample] = []
+            while True:
+                if requests_per_client is not None and len(local) >= requests_per_client:
+                    break
+                if duration is not None and time.perf_counter() >= clock[1]:
+                    break
+                op = rng.choices(operations, weights=weights)[0]
+                start = time.perf_counter_ns()
+                error = None
+                try:
+                    ok = op.run(client) is not False
+                    if not ok:
+                        error = f"{op.kind}: unsuccessful"
+                except Exception as exc:  # errors are part of the measurement
+                    ok, error = False, f"{type(exc).__name__}: {exc}"
+                local.append(Sample(op.name, op.kind, (time.perf_counter_ns() - start) / 1e6, ok, error))
+            with lock:
+                samples.extend(local)
+        finally:
+            close = getattr(client, "close", None)
+            if close is not None:
+                close()
+
+    threads = [threading.Thread(target=client_loop, args=(i,), daemon=True) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    ready.wait()
+    for thread in threads:
+        thread.join()
+    return summarize_level(concurrency, samples, time.perf_counter() - clock[0])
+
+
+def run_load_test(
+    client_factory: Callable[[], Any],
+    operations: Sequence[Operation],
+    levels: Sequence[int] = DEFAULT_LEVELS,
+    duration: Optional[float] = None,
+    requests_per_client: Optional[int] = None,
+    seed: int = 0,
+    on_level: Optional[Callable[[LevelResult], None]] = None,
+) -> List[LevelResult]:
+    results = []
+    for level in levels:
+        result = run_level(client_factory, operations, level, duration, requests_per_client, seed)
+        results.append(result)
+        if on_level is not None:
+            on_level(result)
+    return results
+
+
+def write_report(results: Sequence[LevelResult], operations: Sequence[Operation],
+                 path: Path = DEFAULT_REPORT, **metadata: Any) -> Dict[str, Any]:
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        **metadata,
+        "mix": [{"name": op.name, "kind": op.kind, "weight": op.weight} for op in operations],
+        "levels": [result.to_dict() for result in results],
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+    return report
+
+
+def write_chart(results: Sequence[LevelResult], path: Path = DEFAULT_CHART) -> Path:
+    """Throughput, latency percentiles and error rate against concurrency, as HTML."""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    levels = [r.concurrency for r in results]
+    fig = make_subplots(rows=1, cols=3, subplot_titles=("Throughput (req/s)", "Latency (ms)", "Error rate"))
+    fig.add_trace(go.Scatter(x=levels, y=[r.throughput_rps for r in results], name="throughput"), row=1, col=1)
+    for pct in ("p50", "p95", "p99"):
+        fig.add_trace(go.Scatter(x=levels, y=[getattr(r.latency, f"{pct}_ms") for r in results], name=pct),
+                      row=1, col=2)
+    fig.add_trace(go.Scatter(x=levels, y=[r.error_rate for r in results], name="error rate"), row=1, col=3)
+    fig.update_xaxes(title_text="Concurrent clients")
+    fig.update_layout(title="Load test: throughput vs concurrency", height=450)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fig.write_html(str(path))
+    return path
@@ -0,0 +1,180 @@
+"""EXPLAIN / PROFILE capture for registered queries, with plan smell detection.
+
+FalkorDB returns plans as indented operator lines; the falkordb client parses
+them into an operator tree (``ExecutionPlan.structured_plan``). Here that
+tree becomes plain data with per-operator record counts and timings (PROFILE
+only) and is checked for full scans, label scans and Cartesian products.
+"""
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+DEFAULT_OUTPUT_DIR = Path("data/reports/plans")
+PARAMETER_PATTERN = re.compile(r"\$(\w+)")
+LABEL_PATTERN = re.compile(r":(\w+)")
+
+ALL_NODE_SCAN = "All Node Scan"
+LABEL_SCAN = "Node By Label Scan"
+CARTESIAN_PRODUCT = "Cartesian Product"
+
+
+@dataclass
+class PlanNode:
+    operator: str
+    args: Optional[str] = None
+    records: Optional[int] = None
+    time_ms: Optional[float] = None
+    children: List["PlanNode"] = field(default_factory=list)
+
+    def walk(self, ancestors: Tuple["PlanNode", ...] = ()) -> Iterator[Tuple["PlanNode", Tuple["PlanNode", ...]]]:
+        """Depth-first (node, ancestors) pairs, root first."""
+        yield self, ancestors
+        for child in self.children:
+            yield from child.walk(ancestors + (self,))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def plan_tree(plan: Any) -> PlanNode:
+    """Convert a falkordb ``ExecutionPlan`` into a PlanNode tree."""
+
+    def convert(op) -> PlanNode:
+        stats = getattr(op, "profile_stats", None)
+        return PlanNode(
+            operator=op.name,
+            args=op.args,
+            records=stats.records_produced if stats else None,
+            time_ms=stats.execution_time if stats else None,
+            children=[convert(child) for child in op.children],
+        )
+
+    return convert(plan.structured_plan)
+
+
+@dataclass
+class PlanFinding:
+    kind: str
+    operator: str
+    args: Optional[str]
+    message: str
+    records: Optional[int] = None
+
+
+def find_issues(root: PlanNode) -> List[PlanFinding]:
+    """Flag operators that usually mean a missing index or a missing join."""
+    findings: List[PlanFinding] = []
+    for node, ancestors in root.walk():
+        if node.operator == ALL_NODE_SCAN:
+            findings.append(PlanFinding(
+                "all_node_scan", node.operator, node.args,
+                "scans every node in the graph; add a label to the pattern", node.records,
+            ))
+        elif node.operator == LABEL_SCAN:
+            label = LABEL_PATTERN.search(node.args or "")
+            label_name = label.group(1) if label else "?"
+            filtered = any(a.operator == "Filter" for a in ancestors)
+            message = f"scans every :{label_name} node"
+            if filtered:
+                message += "; its results are filtered, so an index on the filtered property could seek instead"
+            findings.append(PlanFinding("label_scan", node.operator, node.args, message, node.records))
+        elif node.operator == CARTESIAN_PRODUCT:
+            findings.append(PlanFinding(
+                "cartesian_product", node.operator, node.args,
+                f"joins {len(node.children)} unconnected branches; connect the patterns or split the query",
+                node.records,
+            ))
+    return findings
+
+
+@dataclass
+class QueryProfile:
+    name: str
+    source: str
+    cypher: str
+    params: Dict[str, Any]
+    explain: Optional[PlanNode] = None
+    profile: Optional[PlanNode] = None
+    findings: List[PlanFinding] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def total_time_ms(self) -> Optional[float]:
+        if self.profile is None:
+            return None
+        return sum(node.time_ms or 0.0 for node, _ in self.profile.walk())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "source": self.source,
+            "cypher": self.cypher.strip(),
+            "params": self.params,
+            "explain": self.explain.to_dict() if self.explain else None,
+            "profile": self.profile.to_dict() if self.profile else None,
+            "profile_time_ms": self.total_time_ms,
+            "findings": [asdict(f) for f in self.findings],
+            "error": self.error,
+        }
+
+
+def fill_parameters(cypher: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """``params`` plus null for every other ``$name`` the query references."""
+    return {name: params.get(name) for name in dict.fromkeys(PARAMETER_PATTERN.findall(cypher))}
+
+
+def profile_query(
+    graph,
+    name: str,
+    source: str,
+    cypher: str,
+    params: Optional[Dict[str, Any]] = None,
+    run_profile: bool = True,
+) -> QueryProfile:
+    """EXPLAIN (and unless ``run_profile`` is False, PROFILE) one query.
+
+    PROFILE executes the query, so only profile read-only queries.
+    """
+    filled = fill_parameters(cypher, params or {})
+    result = QueryProfile(name=name, source=source, cypher=cypher, params=filled)
+    try:
+        result.explain = plan_tree(graph.explain(cypher, params=filled or None))
+        if run_profile:
+            result.profile = plan_tree(graph.profile(cypher, params=filled or None))
+    except Exception as exc:  # keep going so one bad query does not hide the rest
+        result.error = f"{type(exc).__name__}: {exc}"
+    tree = result.profile or result.explain
+    if tree is not None:
+        result.findings = find_issues(tree)
+    return result
+
+
+def report_path(directory: Path, profile: QueryProfile) -> Path:
+    return Path(directory) / f"{profile.source}__{profile.name}.json"
+
+
+def write_reports(profiles: Sequence[QueryProfile], directory: Path = DEFAULT_OUTPUT_DIR) -> Path:
+    """One JSON file per query plus an ``index.json`` summary; returns the index path."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    index = []
+    for profile in profiles:
+        path = report_path(directory, profile)
+        with path.open("w", encoding="utf-8") as handle:
+            json.dump(profile.to_dict(), handle, indent=2)
+        index.append({
+            "name": profile.name,
+            "source": profile.source,
+            "report": path.name,
+            "findings": sorted({f.kind for f in profile.findings}),
+            "profile_time_ms": profile.total_time_ms,
+            "error": profile.error,
+        })
+    index_path = directory / "index.json"
+    with index_path.open("w", encoding="utf-8") as handle:
+        json.dump({"queries": index}, handle, indent=2)
+    return index_path
@@ -0,0 +1,425 @@
+"""In-process read model of the negotiation_continuity graph.
+
+A GraphSnapshot of the basic schema plus the lookup indexes the dashboard
+queries need (forward and reverse adjacency per relationship type, clauses by
+number, decisions by actor, a BM25 clause text index). Each registered query is answered by a plain
+Python function that returns the same rows FalkorDB would, including the
+keyset columns of paged NL patterns, since snapshot node ids are graph ids.
+
+ReadReplica wraps a graph handle: registered read queries are answered from
+the model, which is rebuilt when the graph's write epoch changes; every
+other query goes to the graph.
+"""
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from analytics.clause_index import ClauseIndex
+from analytics.snapshot import GraphSnapshot
+from graphdb.epoch import GraphEpoch
+
+Row = List[Any]
+Handler = Callable[["ReadModel", Dict[str, Any]], List[Row]]
+
+
+def _coalesce(value: Any, default: Any) -> Any:
+    return default if value is None else value
+
+
+def _round(value: float) -> float:
+    """Cypher ``ROUND``: half away from zero, returned as a float."""
+    return float(math.copysign(math.floor(abs(value) + 0.5), value))
+
+
+def _null_last(value: Any) -> Tuple[bool, Any]:
+    return value is None, value
+
+
+def _distinct(rows: Iterable[Row]) -> List[Row]:
+    seen = set()
+    unique = []
+    for row in rows:
+        key = tuple(row)
+        if key not in seen:
+            seen.add(key)
+            unique.append(row)
+    return unique
+
+
+def keyset_page(rows: Iterable[Row], params: Dict[str, Any]) -> List[Row]:
+    """Order, cursor-filter and limit rows of a ``keyset_query`` pattern.
+
+    The key columns are the trailing ``$after_N`` columns; a null
+    ``$after_0`` means the first page and a null ``$limit`` no limit.
+    """
+    key_count = sum(1 for name in params if name.startswith("after_"))
+    rows = list(rows)
+    if key_count:
+        rows.sort(key=lambda row: row[-key_count:])
+        after = [params[f"after_{i}"] for i in range(key_count)]
+        if after[0] is not None:
+            rows = [row for row in rows if row[-key_count:] > after]
+    limit = params.get("limit")
+    return rows[:limit] if limit is not None else rows
+
+
+class ReadModel:
+    """Lookup indexes over a GraphSnapshot, and the queries answered from them."""
+
+    def __init__(self, snapshot: GraphSnapshot, clause_index: Optional[ClauseIndex] = None) -> None:
+        """``clause_index`` from a previous model is copied and synced, re-indexing only changed clauses."""
+        self.snapshot = snapshot
+        self.nodes = snapshot.nodes
+        self.out: Dict[str, Dict[int, List[int]]] = {}
+        self.into: Dict[str, Dict[int, List[int]]] = {}
+        for rel_type, pairs in snapshot.edges.items():
+            out: Dict[int, List[int]] = defaultdict(list)
+            into: Dict[int, List[int]] = defaultdict(list)
+            for src, dst in pairs:
+                out[src].append(dst)
+                into[dst].append(src)
+            self.out[rel_type], self.into[rel_type] = out, into
+
+        self.clauses_by_number: Dict[Any, List[int]] = defaultdict(list)
+        self.clauses_by_matter: Dict[Any, List[int]] = defaultdict(list)
+        self.clauses_by_matter_version: Dict[Tuple[Any, Any], List[int]] = defaultdict(list)
+        for clause_id, clause in self.iter_nodes("Clause"):
+            self.clauses_by_number[clause.get("clause_number")].append(clause_id)
+            self.clauses_by_matter[clause.get("matter_id")].append(clause_id)
+            self.clauses_by_matter_version[(clause.get("matter_id"), clause.get("version"))].append(clause_id)
+        self.decisions_by_actor: Dict[Any, List[int]] = defaultdict(list)
+        for decision_id, decision in self.iter_nodes("Decision"):
+            self.decisions_by_actor[decision.get("actor")].append(decision_id)
+
+        clauses = self.nodes.get("Clause", {})
+        if clause_index is None:
+            self.clause_index = ClauseIndex.from_nodes(clauses)
+        else:
+            self.clause_index = clause_index.copy()
+            self.clause_index.sync(clauses)
+
+    def iter_nodes(self, label: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        return iter(self.nodes.get(label, {}).items())
+
+    def node(self, label: str, node_id: Optional[int]) -> Dict[str, Any]:
+        """Properties of ``node_id``; empty for an unmatched OPTIONAL MATCH."""
+        if node_id is None:
+            return {}
+        return self.nodes[label][node_id]
+
+    def linked(self, rel_type: str, node_id: int, label: str, reverse: bool = False) -> List[int]:
+        """``label`` nodes one ``rel_type`` hop from ``node_id``."""
+        adjacency = self.into if reverse else self.out
+        nodes = self.nodes.get(label, {})
+        return [other for other in adjacency.get(rel_type, {}).get(node_id, []) if other in nodes]
+
+    def optional(self, rel_type: str, node_id: Optional[int], label: str) -> List[Optional[int]]:
+        """OPTIONAL MATCH semantics: the linked nodes, or a single null."""
+        if node_id is None:
+            return [None]
+        return self.linked(rel_type, node_id, label) or [None]
+
+    def recommendation_decisions(self, clause_id: int) -> Iterator[Tuple[Optional[int], Optional[int]]]:
+        """(recommendation, decision) pairs of the two OPTIONAL MATCH hops below a clause."""
+        for rec_id in self.optional("HAS_RECOMMENDATION", clause_id, "Recommendation"):
+            for decision_id in self.optional("HAS_DECISION", rec_id, "Decision"):
+                yield rec_id, decision_id
+
+    # ------------------------------------------------------------------
+    # nl_query intents (rows match the pattern's Cypher, key columns last)
+    # ------------------------------------------------------------------
+
+    def concessions(self, params: Dict[str, Any]) -> List[Row]:
+        rows = []
+        for decision_id, _ in self.iter_nodes("Decision"):
+            d = self.node("Decision", decision_id)
+            for con_id in self.linked("RESULTED_IN_CONCESSION", decision_id, "Concession"):
+                con = self.node("Concession", con_id)
+                rows.append([
+                    con.get("concession_id"), con.get("matter_id"), con.get("clause_id"), d.get("actor"),
+                    con.get("description"), con.get("impact"), con.get("rationale"), d.get("timestamp"),
+                    _coalesce(d.get("timestamp"), ""), con_id, decision_id,
+                ])
+        return keyset_page(_distinct(rows), params)
+
+    def round_decisions(self, params: Dict[str, Any]) -> List[Row]:
+        version = params.get("version")
+        rows = []
+        for matter_id, m in self.iter_nodes("Matter"):
+            if version is None or m.get("version") != version or m.get("matter_id") is None:
+                continue
+            for clause_id in self.clauses_by_matter_version.get((m["matter_id"], version), []):
+                c = self.node("Clause", clause_id)
+                for rec_id, decision_id in self.recommendation_decisions(clause_id):
+                    r, d = self.node("Recommendation", rec_id), self.node("Decision", decision_id)
+                    rows.append([
+                        m.get("matter_id"), m.get("version"), c.get("clause_number"), c.get("title"),
+                        r.get("classification"), d.get("decision_type"), d.get("actor"), d.get("notes"),
+                        _coalesce(c.get("clause_number"), ""), matter_id, clause_id,
+                        _coalesce(rec_id, -1), _coalesce(decision_id, -1),
+                    ])
+        return keyset_page(rows, params)
+
+    def clause_search(self, params: Dict[str, Any]) -> List[Row]:
+        terms = params.get("terms")
+        rows = []
+        for clause_id, score in self.clause_index.search(terms) if terms is not None else []:
+            c = self.node("Clause", clause_id)
+            rows.append([c.get("matter_id"), c.get("version"), c.get("clause_number"), c.get("title"),
+                         c.get("category"), -score, clause_id])
+        return keyset_page(rows, params)
+
+    def actor_decisions(self, params: Dict[str, Any]) -> List[Row]:
+        actor = params.get("actor")
+        rows = []
+        for decision_id in self.decisions_by_actor.get(actor, []) if actor is not None else []:
+            d = self.node("Decision", decision_id)
+            notes = d.get("notes")
+            for rec_id in self.linked("HAS_DECISION", decision_id, "Recommendation", reverse=True):
+                r = self.node("Recommendation", rec_id)
+                for clause_id in self.linked("HAS_RECOMMENDATION", rec_id, "Clause", reverse=True):
+                    c = self.node("Clause", clause_id)
+                    rows.append([
+                        d.get("matter_id"), c.get("clause_number"), c.get("title"), r.get("classification"),
+                        d.get("decision_type"), d.get("timestamp"), notes[:100] if notes is not None else None,
+                        _coalesce(d.get("timestamp"), ""), decision_id, rec_id, clause_id,
+                    ])
+        return keyset_page(rows, params)
+
+    def unfavorable_terms(self, params: Dict[str, Any]) -> List[Row]:
+        rows = []
+        for clause_id, c in self.iter_nodes("Clause"):
+            for rec_id in self.linked("HAS_RECOMMENDATION", clause_id, "Recommendation"):
+                r = self.node("Recommendation", rec_id)
+                if r.get("classification") != "unfavorable":
+                    continue
+                for decision_id in self.optional("HAS_DECISION", rec_id, "Decision"):
+                    d = self.node("Decision", decision_id)
+                    rows.append([
+                        c.get("matter_id"), c.get("version"), c.get("clause_number"), c.get("title"),
+                        r.get("issue_type"), d.get("decision_type"), d.get("actor"),
+                        _coalesce(c.get("matter_id"), ""), _coalesce(c.get("version"), -1),
+                        _coalesce(c.get("clause_number"), ""), clause_id, rec_id, _coalesce(decision_id, -1),
+                    ])
+        return keyset_page(rows, params)
+
+    def matter_overview(self, params: Dict[str, Any]) -> List[Row]:
+        matter_id = params.get("matter_id")
+        groups: Dict[Tuple[Any, ...], Tuple[set, set, set, set]] = {}
+        for _, m in self.iter_nodes("Matter"):
+            if matter_id is None or m.get("matter_id") != matter_id:
+                continue
+            key = (m.get("matter_id"), m.get("version"), m.get("matter_type"), m.get("timestamp"))
+            clauses, recs, decisions, concessions = groups.setdefault(key, (set(), set(), set(), set()))
+            version = m.get("version")
+            for clause_id in self.clauses_by_matter_version.get((matter_id, version), []) if version is not None else []:
+                clauses.add(clause_id)
+                for rec_id, decision_id in self.recommendation_decisions(clause_id):
+                    recs.add(rec_id)
+                    decisions.add(decision_id)
+                    for con_id in self.optional("RESULTED_IN_CONCESSION", decision_id, "Concession"):
+                        concessions.add(con_id)
+        rows = [
+            list(key) + [len(ids - {None}) for ids in counted]
+            for key, counted in groups.items()
+        ]
+        return sorted(rows, key=lambda row: _null_last(row[1]))
+
+    def clause_history(self, params: Dict[str, Any]) -> List[Row]:
+        clause_number = params.get("clause_number")
+        rows = []
+        for clause_id in self.clauses_by_number.get(clause_number, []) if clause_number is not None else []:
+            c = self.node("Clause", clause_id)
+            for rec_id, decision_id in self.recommendation_decisions(clause_id):
+                r, d = self.node("Recommendation", rec_id), self.node("Decision", decision_id)
+                rows.append([
+                    c.get("matter_id"), c.get("version"), c.get("clause_number"), c.get("title"),
+                    r.get("classification"), r.get("issue_type"), d.get("decision_type"),
+                    _coalesce(c.get("matter_id"), ""), _coalesce(c.get("version"), -1), clause_id,
+                    _coalesce(rec_id, -1), _coalesce(decision_id, -1),
+                ])
+        return keyset_page(rows, params)
+
+    def ingested_matter_ids(self) -> set:
+        """matter_ids the summary views (graphdb.summary) count: those of Matter nodes."""
+        return {m.get("matter_id") for _, m in self.iter_nodes("Matter")} - {None}
+
+    def statistics(self, params: Dict[str, Any]) -> List[Row]:
+        # GraphSummary counts nodes whose matter_id belongs to an ingested matter
+        matter_ids = self.ingested_matter_ids()
+        if not matter_ids:
+            return []
+        return [[
+            sum(1 for _, n in self.iter_nodes(label) if n.get("matter_id") in matter_ids)
+            for label in ("Matter", "Party", "Clause", "Recommendation", "Decision", "Concession")
+        ]]
+
+    def decision_distribution(self, params: Dict[str, Any]) -> List[Row]:
+        # DecisionTypeSummary leaves out decisions without a type
+        matter_ids = self.ingested_matter_ids()
+        counts: Dict[Any, int] = defaultdict(int)
+        for _, d in self.iter_nodes("Decision"):
+            if d.get("decision_type") is not None and d.get("matter_id") in matter_ids:
+                counts[d["decision_type"]] += 1
+        total = sum(counts.values())
+        rows = [[decision_type, count, _round(100.0 * count / total)] for decision_type, count in counts.items()]
+        return sorted(rows, key=lambda row: -row[1])
+
+    # ------------------------------------------------------------------
+    # KPI #5 queries (scripts/measure_kpis.py KPI5_QUERIES)
+    # ------------------------------------------------------------------
+
+    def cross_version_clause_tracking(self, params: Dict[str, Any]) -> List[Row]:
+        rows = [
+            [c.get("version"), c.get("title"), c.get("category")]
+            for clause_id in self.clauses_by_number.get("1.1", [])
+            for c in [self.node("Clause", clause_id)]
+            if c.get("matter_id") == "matter_001"
+        ]
+        return sorted(rows, key=lambda row: _null_last(row[0]))
+
+    def all_unfavorable_recommendations(self, params: Dict[str, Any]) -> List[Row]:
+        rows = []
+        for clause_id, c in self.iter_nodes("Clause"):
+            for rec_id in self.linked("HAS_RECOMMENDATION", clause_id, "Recommendation"):
+                r = self.node("Recommendation", rec_id)
+                if r.get("classification") == "unfavorable":
+                    rows.append([c.get("matter_id"), c.get("clause_number"), c.get("title"), r.get("issue_type")])
+        rows.sort(key=lambda row: (_null_last(row[0]), _null_last(row[1])))
+        return rows[:10]
+
+    def decisions_by_actor(self, params: Dict[str, Any]) -> List[Row]:
+        rows = [
+            [d.get("matter_id"), d.get("decision_type"), d.get("role"), d.get("notes")]
+            for decision_id in self.decisions_by_actor.get("Jessica Martinez", [])
+            for d in [self.node("Decision", decision_id)]
+        ]
+        return sorted(rows, key=lambda row: _null_last(row[0]))
+
+    def cross_matter_precedent_search(self, params: Dict[str, Any]) -> List[Row]:
+        rows = [
+            [c.get("matter_id"), c.get("version"), c.get("clause_number"), c.get("title"), c.get("category")]
+            for clause_id in self.clause_index.candidates("Liability")
+            for c in [self.node("Clause", clause_id)]
+            if isinstance(c.get("title"), str) and "Liability" in c["title"]
+        ]
+        return sorted(rows, key=lambda row: (_null_last(row[0]), _null_last(row[1])))
+
+    def recommendation_coverage(self, params: Dict[str, Any]) -> List[Row]:
+        groups: Dict[Tuple[Any, Any], List[Any]] = {}
+        for _, m in self.iter_nodes("Matter"):
+            key = (m.get("matter_id"), m.get("version"))
+            clauses, recs = groups.setdefault(key, [set(), 0])
+            if m.get("matter_id") is None:
+                continue
+            for clause_id in self.clauses_by_matter.get(m["matter_id"], []):
+                linked = self.linked("HAS_RECOMMENDATION", clause_id, "Recommendation")
+                if linked:
+                    clauses.add(clause_id)
+                    groups[key][1] += len(linked)
+        rows = [[matter_id, version, len(clauses), recs] for (matter_id, version), (clauses, recs) in groups.items()]
+        return sorted(rows, key=lambda row: (_null_last(row[0]), _null_last(row[1])))
+
+    def decision_type_distribution(self, params: Dict[str, Any]) -> List[Row]:
+        counts: Dict[Any, int] = defaultdict(int)
+        for _, d in self.iter_nodes("Decision"):
+            counts[d.get("decision_type")] += 1
+        return sorted(([decision_type, count] for decision_type, count in counts.items()), key=lambda row: -row[1])
+
+
+# nl_query pattern intent -> handler
+NL_INTENTS: Dict[str, Handler] = {
+    "concessions": ReadModel.concessions,
+    "round_decisions": ReadModel.round_decisions,
+    "clause_search": ReadModel.clause_search,
+    "actor_decisions": ReadModel.actor_decisions,
+    "unfavorable_terms": ReadModel.unfavorable_terms,
+    "matter_overview": ReadModel.matter_overview,
+    "clause_history": ReadModel.clause_history,
+    "statistics": ReadModel.statistics,
+    "decision_distribution": ReadModel.decision_distribution,
+}
+
+# KPI5_QUERIES name -> handler
+KPI5_HANDLERS: Dict[str, Handler] = {
+    "Cross-Version Clause Tracking": ReadModel.cross_version_clause_tracking,
+    "All Unfavorable Recommendations": ReadModel.all_unfavorable_recommendations,
+    "Decisions by Actor": ReadModel.decisions_by_actor,
+    "Cross-Matter Precedent Search": ReadModel.cross_matter_precedent_search,
+    "Recommendation Coverage": ReadModel.recommendation_coverage,
+    "Decision Type Distribution": ReadModel.decision_type_distribution,
+}
+
+
+def normalise_query(q: str) -> str:
+    return " ".join(q.split())
+
+
+@dataclass
+class LocalResult:
+    """QueryResult stand-in for rows answered by the read model."""
+
+    result_set: List[Row]
+    run_time_ms: float
+    cached_execution: bool = False
+
+
+class ReadReplica:
+    """Graph handle answering registered read queries from an in-process ReadModel.
+
+    ``queries`` maps Cypher text (compared whitespace-insensitively) to its
+    handler. The model is loaded from ``graph`` on first use and reloaded
+    whenever the write epoch differs from the one it was loaded at; other
+    queries, and all writes, go to ``graph``.
+    """
+
+    def __init__(self, graph: Any, queries: Dict[str, Handler], epoch: Optional[GraphEpoch] = None) -> None:
+        self.graph = graph
+        self.queries = {normalise_query(q): handler for q, handler in queries.items()}
+        self.epoch = epoch or GraphEpoch(graph)
+        self.loads = 0
+        self._model: Optional[ReadModel] = None
+        self._model_epoch: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def handles(self, q: str) -> bool:
+        return normalise_query(q) in self.queries
+
+    def is_current(self, epoch: int) -> bool:
+        return self._model is not None and self._model_epoch == epoch
+
+    def model(self, epoch: Optional[int] = None) -> ReadModel:
+        """The model for ``epoch`` (default: the graph's current epoch), loading it if needed."""
+        epoch = self.epoch.current() if epoch is None else epoch
+        with self._lock:
+            if not self.is_current(epoch):
+                previous = self._model.clause_index if self._model is not None else None
+                self._model = ReadModel(GraphSnapshot.from_graph(self.graph), previous)
+                self._model_epoch = epoch
+                self.loads += 1
+            return self._model
+
+    def answer(self, q: str, params: Optional[Dict[str, Any]] = None, epoch: Optional[int] = None) -> List[Row]:
+        return self.queries[normalise_query(q)](self.model(epoch), params or {})
+
+    def query(self, q: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[int] = None) -> Any:
+        kwargs = {"timeout": timeout} if timeout is not None else {}
+        return self.graph.query(q, params=params, **kwargs)
+
+    def ro_query(self, q: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[int] = None) -> Any:
+        if not self.handles(q):
+            kwargs = {"timeout": timeout} if timeout is not None else {}
+            return self.graph.ro_query(q, params=params, **kwargs)
+        start = time.perf_counter()
+        rows = self.answer(q, params)
+        return LocalResult(rows, (time.perf_counter() - start) * 1000)
+
+
+def kpi5_queries(queries: Sequence[Dict[str, str]]) -> Dict[str, Handler]:
+    """Handlers for the KPI #5 query list, keyed by query text."""
+    return {query["query"]: KPI5_HANDLERS[query["name"]] for query in queries}
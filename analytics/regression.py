@@ -0,0 +1,169 @@
+"""Compare latency samples and KPI results between a baseline and a new run.
+
+Latency regressions use a one-sided Mann-Whitney U test (is the current run
+stochastically slower?) with a normal approximation, tie correction and
+continuity correction, plus a minimum median slowdown so statistically
+significant but negligible shifts do not fail a build.
+"""
+from __future__ import annotations
+
+import json
+import math
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from analytics.benchmark import percentile
+
+DEFAULT_ALPHA = 0.01
+DEFAULT_MIN_SLOWDOWN = 0.10
+MIN_SAMPLES = 5
+
+
+def _ranks(values: Sequence[float]) -> Tuple[List[float], float]:
+    """Average ranks (1-based) of ``values`` and the tie term sum(t^3 - t)."""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    ties = 0.0
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        rank = (i + j) / 2 + 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = rank
+        t = j - i + 1
+        ties += t ** 3 - t
+        i = j + 1
+    return ranks, ties
+
+
+def mann_whitney_greater(baseline: Sequence[float], current: Sequence[float]) -> Tuple[float, float]:
+    """U statistic of ``current`` and the p-value for "current is slower".
+
+    U counts (baseline, current) pairs where current is larger, ties
+    counting one half, so ``U / (n1 * n2)`` is the probability that a
+    random current sample exceeds a random baseline one.
+    """
+    n1, n2 = len(baseline), len(current)
+    if not n1 or not n2:
+        raise ValueError("both samples must be non-empty")
+    ranks, ties = _ranks(list(baseline) + list(current))
+    u = sum(ranks[n1:]) - n2 * (n2 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1))) if n > 1 else 0.0
+    if variance <= 0:
+        return u, 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+@dataclass
+class LatencyComparison:
+    query: str
+    baseline_n: int
+    current_n: int
+    baseline_p50_ms: float
+    current_p50_ms: float
+    slowdown: float
+    prob_slower: float
+    p_value: float
+    regressed: bool
+    note: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def compare_latency(
+    query: str,
+    baseline: Sequence[float],
+    current: Sequence[float],
+    alpha: float = DEFAULT_ALPHA,
+    min_slowdown: float = DEFAULT_MIN_SLOWDOWN,
+) -> LatencyComparison:
+    base_p50, cur_p50 = percentile(baseline, 50), percentile(current, 50)
+    slowdown = cur_p50 / base_p50 - 1 if base_p50 > 0 else 0.0
+    if len(baseline) < MIN_SAMPLES or len(current) < MIN_SAMPLES:
+        return LatencyComparison(query, len(baseline), len(current), base_p50, cur_p50, slowdown,
+                                 0.0, 1.0, False, f"fewer than {MIN_SAMPLES} samples")
+    u, p_value = mann_whitney_greater(baseline, current)
+    return LatencyComparison(
+        query=query,
+        baseline_n=len(baseline),
+        current_n=len(current),
+        baseline_p50_ms=base_p50,
+        current_p50_ms=cur_p50,
+        slowdown=slowdown,
+        prob_slower=u / (len(baseline) * len(current)),
+        p_value=p_value,
+        regressed=p_value < alpha and slowdown >= min_slowdown,
+    )
+
+
+def compare_samples(
+    baseline: Dict[str, Sequence[float]],
+    current: Dict[str, Sequence[float]],
+    alpha: float = DEFAULT_ALPHA,
+    min_slowdown: float = DEFAULT_MIN_SLOWDOWN,
+) -> List[LatencyComparison]:
+    """Compare every query present in both runs, in the current run's order."""
+    return [
+        compare_latency(query, baseline[query], samples, alpha, min_slowdown)
+        for query, samples in current.items()
+        if query in baseline
+    ]
+
+
+def _load_json(path: Path) -> Optional[Dict[str, Any]]:
+    path = Path(path)
+    if not path.exists():
+        return None
+    with path.open("r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def benchmark_samples(path: Path) -> Optional[Dict[str, List[float]]]:
+    """Client latency samples per query from a query_benchmark.json report."""
+    report = _load_json(path)
+    if report is None:
+        return None
+    return {q["name"]: q["client_samples_ms"] for q in report["queries"]}
+
+
+def metrics_runs(path: Path) -> Dict[str, Dict[str, List[float]]]:
+    """Successful latencies per query, per run_id, from a run_kpis JSONL file.
+
+    Runs are returned in the order they appear in the file.
+    """
+    runs: Dict[str, Dict[str, List[float]]] = {}
+    path = Path(path)
+    if not path.exists():
+        return runs
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record.get("status") != "ok" or "run_id" not in record:
+                continue
+            runs.setdefault(record["run_id"], defaultdict(list))[record["query"]].append(record["latency_ms"])
+    return {run_id: dict(samples) for run_id, samples in runs.items()}
+
+
+def kpi_results(path: Path) -> Optional[Dict[str, bool]]:
+    """Pass/fail per KPI from a kpi_report.json."""
+    report = _load_json(path)
+    if report is None:
+        return None
+    return {
+        name: bool(kpi.get("overall_pass", kpi.get("pass")))
+        for name, kpi in report.get("kpis", {}).items()
+    }
+
+
+def kpi_regressions(baseline: Dict[str, bool], current: Dict[str, bool]) -> List[str]:
+    """KPIs that passed in the baseline and fail (or are missing) now."""
+    return [name for name, passed in baseline.items() if passed and not current.get(name, False)]
@@ -0,0 +1,106 @@
+"""Portable copy of the negotiation_continuity graph for offline KPI runs."""
+from __future__ import annotations
+
+import json
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+LABELS: Tuple[str, ...] = ("Matter", "Party", "Clause", "Recommendation", "Decision", "Concession")
+
+# child label -> (parent label, join keys, relationship type), as created by
+# the basic ingestion CREATE/MATCH statements
+RELATIONSHIPS: Dict[str, Tuple[str, Tuple[str, ...], str]] = {
+    "Recommendation": ("Clause", ("clause_id", "matter_id"), "HAS_RECOMMENDATION"),
+    "Decision": ("Recommendation", ("recommendation_id", "matter_id"), "HAS_DECISION"),
+    "Concession": ("Decision", ("decision_id", "matter_id"), "RESULTED_IN_CONCESSION"),
+}
+
+
+@dataclass
+class GraphSnapshot:
+    """Nodes and relationships of the basic schema, keyed by node id.
+
+    Relationships are stored explicitly rather than re-derived from ids,
+    because what the graph links depends on the order matters were ingested.
+    """
+
+    nodes: Dict[str, Dict[int, Dict[str, Any]]] = field(default_factory=dict)
+    edges: Dict[str, List[Tuple[int, int]]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self._adjacency: Dict[str, Dict[int, List[int]]] = {}
+
+    @classmethod
+    def from_graph(cls, graph) -> "GraphSnapshot":
+        snapshot = cls()
+        for label in LABELS:
+            result = graph.query(f"MATCH (n:{label}) RETURN ID(n), properties(n)")
+            snapshot.nodes[label] = {node_id: dict(props) for node_id, props in result.result_set}
+        for _, _, rel_type in RELATIONSHIPS.values():
+            result = graph.query(f"MATCH (a)-[:{rel_type}]->(b) RETURN ID(a), ID(b)")
+            snapshot.edges[rel_type] = [(src, dst) for src, dst in result.result_set]
+        return snapshot
+
+    @classmethod
+    def from_matter_files(cls, paths: Iterable[Path]) -> "GraphSnapshot":
+        """Replay batched ingestion of ``paths`` (in order) without a database.
+
+        Child nodes are linked to every parent node already present with the
+        same join keys, and to nothing if none exists yet, exactly as the
+        CREATE ... MATCH ... CREATE batches behave.
+        """
+        from scripts.ingest.basic_ingestion import build_batch_rows
+
+        snapshot = cls(nodes={label: {} for label in LABELS},
+                       edges={rel: [] for _, _, rel in RELATIONSHIPS.values()})
+        index: Dict[Tuple[str, Tuple[Any, ...]], List[int]] = defaultdict(list)
+        next_id = 0
+        for path in paths:
+            with Path(path).open() as handle:
+                rows = build_batch_rows(json.load(handle))
+            for label in LABELS:
+                for row in rows[label]:
+                    node_id, next_id = next_id, next_id + 1
+                    snapshot.nodes[label][node_id] = dict(row)
+                    if label in RELATIONSHIPS:
+                        parent, keys, rel_type = RELATIONSHIPS[label]
+                        for parent_id in index[(parent, tuple(row.get(k) for k in keys))]:
+                            snapshot.edges[rel_type].append((parent_id, node_id))
+                    for parent, keys, _ in RELATIONSHIPS.values():
+                        if parent == label:
+                            index[(label, tuple(row.get(k) for k in keys))].append(node_id)
+        return snapshot
+
+    @classmethod
+    def load(cls, path: Path) -> "GraphSnapshot":
+        with Path(path).open() as handle:
+            raw = json.load(handle)
+        nodes = {
+            label: {int(node_id): props for node_id, props in by_id.items()}
+            for label, by_id in raw["nodes"].items()
+        }
+        edges = {rel: [tuple(pair) for pair in pairs] for rel, pairs in raw["edges"].items()}
+        return cls(nodes=nodes, edges=edges)
+
+    def save(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w") as handle:
+            json.dump({"nodes": self.nodes, "edges": self.edges}, handle)
+
+    def iter_nodes(self, label: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        return iter(self.nodes.get(label, {}).items())
+
+    def targets(self, rel_type: str, node_id: int) -> List[int]:
+        """Ids reachable from ``node_id`` over one ``rel_type`` relationship."""
+        if rel_type not in self._adjacency:
+            adjacency: Dict[int, List[int]] = defaultdict(list)
+            for src, dst in self.edges.get(rel_type, []):
+                adjacency[src].append(dst)
+            self._adjacency[rel_type] = adjacency
+        return self._adjacency[rel_type].get(node_id, [])
+
+    def node(self, label: str, node_id: int) -> Dict[str, Any]:
+        return self.nodes[label][node_id]
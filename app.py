@@ -21,6 +21,8 @@ load_dotenv()
 # Import the natural language query interface
 import sys
 sys.path.append(str(Path(__file__).parent))
+from graphdb import QueryRunner, graph_summary
+from analytics.benchmark import load_report
 try:
     from scripts.nl_query import NaturalLanguageQueryInterface
     NL_QUERY_AVAILABLE = True
@@ -123,8 +125,58 @@ def init_nl_interface():
     """Initialize Natural Language Query Interface"""
     return NaturalLanguageQueryInterface()
 
+def load_next_nl_page(nl_interface):
+    """Fetch the page after the last one shown for the current question"""
+    pages = st.session_state.nl_pages
+    pages.append(nl_interface.execute_query(st.session_state.nl_question,
+                                            page_token=pages[-1]['next_token']))
+
+def render_nl_pages(pages):
+    """Show the pages fetched so far for the current question"""
+    if not pages:
+        return
+    result = pages[0]
+
+    if not result.get('success'):
+        st.error(f"❌ Query failed: {result.get('error', 'Unknown error')}")
+
+        if 'suggestions' in result:
+            st.info("💡 Try questions like:")
+            for suggestion in result['suggestions'][:5]:
+                st.write(f"• {suggestion}")
+        return
+
+    st.success(f"✅ Query completed successfully")
+
+    # Display interpretation
+    st.info(f"💡 **Interpretation:** {result.get('description', 'Query executed')}")
+
+    # Display results
+    st.markdown("### Results")
+
+    # Results are pre-formatted text, one block per page
+    shown = 0
+    for page in pages:
+        if not page.get('success'):
+            st.error(f"❌ Query failed: {page.get('error', 'Unknown error')}")
+            break
+        st.text(page.get('results', 'No results'))
+        shown += page.get('results_count', 0)
+
+    more = " (more available)" if pages[-1].get('next_token') else ""
+    st.caption(f"Showing {shown} result(s){more}")
+
+    # Show Cypher query in expander
+    with st.expander("🔧 View Cypher Query"):
+        st.code(result.get('cypher', ''), language='cypher')
+
 def get_graph_stats(graph):
     """Get system statistics"""
+    # Node counts maintained by ingestion; scan only if the views were never built
+    summary = graph_summary(graph)
+    if summary:
+        return dict(sorted(summary.items(), key=lambda item: -item[1]))
+
     result = graph.query("""
         MATCH (n)
         RETURN labels(n)[0] as type, COUNT(n) as count
@@ -142,24 +194,26 @@ def build_graph_visualization(graph, matter_id=None, max_nodes=100):
 
     # Query for graph data
     if matter_id:
-        query = f"""
-            MATCH (m:Matter {{matter_id: '{matter_id}'}})
-            OPTIONAL MATCH (c:Clause {{matter_id: '{matter_id}'}})-[r1:HAS_RECOMMENDATION]->(rec:Recommendation)
+        query = """
+            MATCH (m:Matter {matter_id: $matter_id})
+            OPTIONAL MATCH (c:Clause {matter_id: $matter_id})-[r1:HAS_RECOMMENDATION]->(rec:Recommendation)
             OPTIONAL MATCH (rec)-[r2:HAS_DECISION]->(d:Decision)
             OPTIONAL MATCH (d)-[r3:RESULTED_IN_CONCESSION]->(con:Concession)
             RETURN m, c, r1, rec, r2, d, r3, con
-            LIMIT {max_nodes}
+            LIMIT $max_nodes
         """
+        params = {"matter_id": matter_id, "max_nodes": max_nodes}
     else:
-        query = f"""
+        query = """
             MATCH (c:Clause)-[r1:HAS_RECOMMENDATION]->(rec:Recommendation)
             OPTIONAL MATCH (rec)-[r2:HAS_DECISION]->(d:Decision)
             OPTIONAL MATCH (d)-[r3:RESULTED_IN_CONCESSION]->(con:Concession)
             RETURN c, r1, rec, r2, d, r3, con
-            LIMIT {max_nodes}
+            LIMIT $max_nodes
         """
+        params = {"max_nodes": max_nodes}
 
-    result = graph.query(query)
+    result = graph.ro_query(query, params=params)
 
     # Create network
     net = Network(height="600px", width="100%", bgcolor="#ffffff", font_color="black")
@@ -231,7 +285,7 @@ def build_graph_visualization(graph, matter_id=None, max_nodes=100):
                         added_nodes.add(node_id)
 
     # Add edges from query results
-    result = graph.query(query)
+    result = graph.ro_query(query, params=params)
     for row in result.result_set:
         if matter_id:
             # Matter visualization: m, c, r1, rec, r2, d, r3, con
@@ -282,7 +336,7 @@ def main():
     # Initialize connections
     try:
         db = init_connection()
-        graph = db.select_graph('negotiation_continuity')
+        graph = QueryRunner(db.select_graph('negotiation_continuity'))
         nl_interface = init_nl_interface() if NL_QUERY_AVAILABLE else None
     except Exception as e:
         st.error(f"❌ Failed to connect to FalkorDB: {e}")
@@ -374,37 +428,19 @@ def main():
         if run_query and query:
             with st.spinner("Processing query..."):
                 try:
-                    result = nl_interface.execute_query(query)
-
-                    if result.get('success'):
-                        st.success(f"✅ Query completed successfully")
-
-                        # Display interpretation
-                        st.info(f"💡 **Interpretation:** {result.get('description', 'Query executed')}")
-
-                        # Display results
-                        st.markdown("### Results")
-
-                        # Results are pre-formatted text, display directly
-                        st.text(result.get('results', 'No results'))
-
-                        st.caption(f"Found {result.get('results_count', 0)} result(s)")
-
-                        # Show Cypher query in expander
-                        with st.expander("🔧 View Cypher Query"):
-                            st.code(result.get('cypher', ''), language='cypher')
-                    else:
-                        st.error(f"❌ Query failed: {result.get('error', 'Unknown error')}")
-
-                        if 'suggestions' in result:
-                            st.info("💡 Try questions like:")
-                            for suggestion in result['suggestions'][:5]:
-                                st.write(f"• {suggestion}")
-
+                    st.session_state.nl_question = query
+                    st.session_state.nl_pages = [nl_interface.execute_query(query)]
                 except Exception as e:
+                    st.session_state.nl_pages = []
                     st.error(f"❌ Query failed: {e}")
                     st.exception(e)
 
+        render_nl_pages(st.session_state.get("nl_pages", []))
+
+        pages = st.session_state.get("nl_pages", [])
+        if pages and pages[-1].get('next_token'):
+            st.button("⏬ Load more results", on_click=load_next_nl_page, args=(nl_interface,))
+
     with tab2:
         st.header("Interactive Graph Visualization")
 
@@ -467,6 +503,7 @@ def main():
         st.header("Key Performance Indicators")
 
         # Load KPI data
+        benchmark = load_report()
         col1, col2, col3 = st.columns(3)
 
         with col1:
@@ -477,8 +514,13 @@ def main():
 
         with col2:
             st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            st.metric("Query Performance", "1.2ms", "✅ 4,166x faster")
-            st.caption("Average query response time")
+            if benchmark and benchmark.get("queries"):
+                avg_p50 = sum(q["client"]["p50_ms"] for q in benchmark["queries"]) / len(benchmark["queries"])
+                st.metric("Query Performance", f"{avg_p50:.1f}ms", f"✅ {5000 / max(avg_p50, 0.001):,.0f}x faster")
+                st.caption("Average p50 query response time (measured)")
+            else:
+                st.metric("Query Performance", "1.2ms", "✅ 4,166x faster")
+                st.caption("Average query response time")
             st.markdown('</div>', unsafe_allow_html=True)
 
         with col3:
@@ -504,12 +546,19 @@ def main():
         kg_times = [0.36, 1.41, 0.48, 2.83, 1.81, 0.32]
         sql_times = [150, 250, 75, 400, 200, 50]
 
+        # Prefer measured medians from the KPI #5 benchmark (same query order)
+        kg_p95 = None
+        if benchmark and len(benchmark.get("queries", [])) == len(query_types):
+            kg_times = [q["client"]["p50_ms"] for q in benchmark["queries"]]
+            kg_p95 = [q["client"]["p95_ms"] - q["client"]["p50_ms"] for q in benchmark["queries"]]
+
         fig = go.Figure()
 
         fig.add_trace(go.Bar(
             name='Knowledge Graph',
             x=query_types,
             y=kg_times,
+            error_y=dict(type='data', array=kg_p95, symmetric=False, arrayminus=[0] * len(kg_p95)) if kg_p95 else None,
             marker_color='#1f77b4'
         ))
 
@@ -531,22 +580,37 @@ def main():
 
         st.plotly_chart(fig, use_container_width=True)
 
-        st.caption("Note: SQL times are estimates based on typical JOIN performance")
+        if kg_p95:
+            st.caption(f"Knowledge graph bars are measured p50 (whiskers to p95) over {benchmark['repeat']} runs "
+                       f"after {benchmark['warmup']} warmups, {benchmark['timestamp'][:19]}. "
+                       "SQL times are estimates based on typical JOIN performance")
+        else:
+            st.caption("Note: SQL times are estimates based on typical JOIN performance. "
+                       "Run scripts/measure_kpis.py to replace the knowledge graph figures with measured ones")
 
         st.divider()
 
         # Multi-version continuity proof
         st.subheader("Multi-Version Continuity")
 
-        result = graph.query("""
-            MATCH (m:Matter {matter_id: 'matter_001'})
-            OPTIONAL MATCH (c:Clause {matter_id: 'matter_001', version: m.version})
-            OPTIONAL MATCH (c)-[:HAS_RECOMMENDATION]->(r:Recommendation)
-            RETURN m.version as version,
-                   COUNT(DISTINCT c) as clauses,
-                   COUNT(DISTINCT r) as recommendations
-            ORDER BY m.version
+        result = graph.ro_query("""
+            MATCH (s:MatterSummary {matter_id: 'matter_001'})
+            RETURN s.version as version,
+                   s.clauses as clauses,
+                   s.recommendations as recommendations
+            ORDER BY s.version
         """)
+        if not result.result_set:
+            # Summary views not built yet (see bootstrap_schema.py --rebuild-summaries)
+            result = graph.ro_query("""
+                MATCH (m:Matter {matter_id: 'matter_001'})
+                OPTIONAL MATCH (c:Clause {matter_id: 'matter_001', version: m.version})
+                OPTIONAL MATCH (c)-[:HAS_RECOMMENDATION]->(r:Recommendation)
+                RETURN m.version as version,
+                       COUNT(DISTINCT c) as clauses,
+                       COUNT(DISTINCT r) as recommendations
+                ORDER BY m.version
+            """)
 
         df = pd.DataFrame(result.result_set, columns=['Version', 'Clauses', 'Recommendations'])
 
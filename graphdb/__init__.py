@@ -0,0 +1,29 @@
+"""Shared FalkorDB query execution helpers for the negotiation continuity graph."""
+
+from .async_runner import AsyncQueryRunner, BackgroundLoop, connect_async_graph
+from .cache import ResultCache, cache_key
+from .epoch import GraphEpoch, bump_epoch, read_epoch, read_epoch_async
+from .runner import QueryRunner, QueryStats
+from .schema import SCHEMA_INDEXES, IndexSpec, ensure_indexes, existing_indexes
+from .summary import graph_summary, rebuild_summaries, refresh_matter_summary
+
+__all__ = [
+    "AsyncQueryRunner",
+    "BackgroundLoop",
+    "connect_async_graph",
+    "ResultCache",
+    "cache_key",
+    "GraphEpoch",
+    "bump_epoch",
+    "read_epoch",
+    "read_epoch_async",
+    "QueryRunner",
+    "QueryStats",
+    "SCHEMA_INDEXES",
+    "IndexSpec",
+    "ensure_indexes",
+    "existing_indexes",
+    "graph_summary",
+    "rebuild_summaries",
+    "refresh_matter_summary",
+]
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Dict, Optional, TypeVar
+
+from .runner import QueryRunner
+
+T = TypeVar("T")
+
+
+def connect_async_graph(host: str, port: int, graph_name: str, max_connections: int = 8):
+    """A falkordb.asyncio graph backed by a pool of at most ``max_connections`` sockets.
+
+    The pool blocks, rather than fails, when every connection is checked out.
+    """
+    from falkordb.asyncio import FalkorDB
+    from redis.asyncio import BlockingConnectionPool
+
+    pool = BlockingConnectionPool(host=host, port=port, max_connections=max_connections, decode_responses=True)
+    return FalkorDB(connection_pool=pool).select_graph(graph_name)
+
+
+class AsyncQueryRunner(QueryRunner):
+    """QueryRunner for a falkordb.asyncio graph, with a timeout and an in-flight cap.
+
+    ``query`` / ``ro_query`` are coroutines. At most ``max_in_flight`` queries
+    run at once; the rest wait their turn. ``timeout_ms`` bounds each call
+    including that wait: it is sent to FalkorDB as the server-side query
+    timeout and enforced on the client with ``asyncio.wait_for``, which raises
+    ``asyncio.TimeoutError``.
+    """
+
+    def __init__(self, graph: Any, max_in_flight: int = 8, timeout_ms: Optional[int] = None) -> None:
+        super().__init__(graph)
+        self.max_in_flight = max_in_flight
+        self.timeout_ms = timeout_ms
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def _run(self, method: str, q: str, params: Optional[Dict[str, Any]], timeout: Optional[int]) -> Any:
+        timeout = timeout if timeout is not None else self.timeout_ms
+        kwargs = {"timeout": timeout} if timeout is not None else {}
+
+        async def call() -> Any:
+            async with self._slots:
+                self._in_flight += 1
+                try:
+                    return await getattr(self.graph, method)(q, params=params, **kwargs)
+                finally:
+                    self._in_flight -= 1
+
+        result = await (asyncio.wait_for(call(), timeout / 1000) if timeout is not None else call())
+        self._record(q, result)
+        return result
+
+    async def aclose(self) -> None:
+        """Disconnect the graph's connection pool."""
+        await self.graph.client.connection.connection_pool.disconnect()
+
+    async def query(  # type: ignore[override]
+        self,
+        q: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+    ) -> Any:
+        return await self._run("query", q, params, timeout)
+
+    async def ro_query(  # type: ignore[override]
+        self,
+        q: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+    ) -> Any:
+        return await self._run("ro_query", q, params, timeout)
+
+
+class BackgroundLoop:
+    """An event loop on a daemon thread, so synchronous code can run coroutines on it.
+
+    Async connections belong to the loop that opened them; running every
+    call on this one loop lets a single pool serve callers from any thread.
+    """
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="graphdb-loop", daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def run(self, coro: Awaitable[T]) -> T:
+        """Run ``coro`` on the background loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def close(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Optional
+
+
+def epoch_key(graph_name: str) -> str:
+    """Redis key holding the write epoch of ``graph_name``, next to the graph itself."""
+    return f"{graph_name}:write_epoch"
+
+
+def _target(graph: Any) -> Any:
+    # QueryRunner wraps the falkordb Graph; the epoch lives beside the graph
+    return getattr(graph, "graph", graph)
+
+
+def bump_epoch(graph: Any) -> int:
+    """Advance the graph's write epoch after a write; returns the new epoch."""
+    target = _target(graph)
+    return int(target.execute_command("INCR", epoch_key(target.name)))
+
+
+def read_epoch(graph: Any) -> int:
+    """Current write epoch of the graph; 0 if it was never written by ingestion."""
+    target = _target(graph)
+    value = target.execute_command("GET", epoch_key(target.name))
+    return int(value) if value is not None else 0
+
+
+async def read_epoch_async(graph: Any) -> int:
+    """``read_epoch`` for a falkordb.asyncio graph (or an AsyncQueryRunner over one)."""
+    target = _target(graph)
+    value = await target.execute_command("GET", epoch_key(target.name))
+    return int(value) if value is not None else 0
+
+
+class GraphEpoch:
+    """Write epoch of one graph, re-read from the server at most every ``refresh_seconds``.
+
+    Reading the epoch is a round trip, so a cache lookup that checked it on
+    every call would cost as much as a cheap query. Between refreshes the
+    last value is reused: results may be served for up to ``refresh_seconds``
+    after ingestion bumps the epoch. ``refresh_seconds=0`` reads every time.
+    Use ``current`` with a synchronous graph and ``current_async`` with an
+    asyncio one.
+    """
+
+    def __init__(
+        self,
+        graph: Any,
+        refresh_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.graph = graph
+        self.refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._value: Optional[int] = None
+        self._read_at = 0.0
+        self._lock = threading.Lock()
+
+    def _fresh(self, now: float) -> Optional[int]:
+        with self._lock:
+            if self._value is not None and now - self._read_at < self.refresh_seconds:
+                return self._value
+        return None
+
+    def _store(self, value: int, now: float) -> int:
+        with self._lock:
+            self._value, self._read_at = value, now
+        return value
+
+    def current(self) -> int:
+        now = self._clock()
+        value = self._fresh(now)
+        return value if value is not None else self._store(read_epoch(self.graph), now)
+
+    async def current_async(self) -> int:
+        now = self._clock()
+        value = self._fresh(now)
+        return value if value is not None else self._store(await read_epoch_async(self.graph), now)
+
+    def invalidate(self) -> None:
+        """Force the next ``current()`` to read the server."""
+        with self._lock:
+            self._value = None
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class QueryStats:
+    """Plan-cache counters for one distinct query text."""
+
+    query: str
+    calls: int = 0
+    cached: int = 0
+    server_ms: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.cached / self.calls if self.calls else 0.0
+
+    @property
+    def avg_server_ms(self) -> float:
+        return self.server_ms / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "query": " ".join(self.query.split()),
+            "calls": self.calls,
+            "cached": self.cached,
+            "hit_rate": self.hit_rate,
+            "avg_server_ms": self.avg_server_ms,
+        }
+
+
+class QueryRunner:
+    """Run constant Cypher text with ``params=`` and record plan-cache hits.
+
+    FalkorDB caches execution plans by query text, so every call site should
+    pass literals as parameters instead of formatting them into the query.
+    The runner mirrors ``Graph.query`` / ``Graph.ro_query`` so it can stand in
+    wherever a graph handle is used.
+    """
+
+    def __init__(self, graph: Any) -> None:
+        self.graph = graph
+        self._stats: Dict[str, QueryStats] = {}
+        self._lock = threading.Lock()
+
+    def query(
+        self,
+        q: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+    ) -> Any:
+        kwargs = {"timeout": timeout} if timeout is not None else {}
+        result = self.graph.query(q, params=params, **kwargs)
+        self._record(q, result)
+        return result
+
+    def ro_query(
+        self,
+        q: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+    ) -> Any:
+        kwargs = {"timeout": timeout} if timeout is not None else {}
+        result = self.graph.ro_query(q, params=params, **kwargs)
+        self._record(q, result)
+        return result
+
+    def explain(self, q: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        return self.graph.explain(q, params=params)
+
+    def profile(self, q: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        return self.graph.profile(q, params=params)
+
+    def _record(self, q: str, result: Any) -> None:
+        cached = bool(getattr(result, "cached_execution", False))
+        server_ms = float(getattr(result, "run_time_ms", 0.0) or 0.0)
+        with self._lock:
+            stats = self._stats.get(q)
+            if stats is None:
+                stats = self._stats[q] = QueryStats(query=q)
+            stats.calls += 1
+            stats.cached += int(cached)
+            stats.server_ms += server_ms
+
+    @property
+    def distinct_queries(self) -> int:
+        return len(self._stats)
+
+    @property
+    def hit_rate(self) -> float:
+        with self._lock:
+            calls = sum(s.calls for s in self._stats.values())
+            cached = sum(s.cached for s in self._stats.values())
+        return cached / calls if calls else 0.0
+
+    def cache_report(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            stats = sorted(self._stats.values(), key=lambda s: s.calls, reverse=True)
+            return [s.to_dict() for s in stats]
+
+    def merge(self, other: "QueryRunner") -> None:
+        """Fold another runner's counters into this one, e.g. from worker threads."""
+        with other._lock:
+            incoming = [QueryStats(s.query, s.calls, s.cached, s.server_ms) for s in other._stats.values()]
+        with self._lock:
+            for theirs in incoming:
+                stats = self._stats.get(theirs.query)
+                if stats is None:
+                    self._stats[theirs.query] = theirs
+                    continue
+                stats.calls += theirs.calls
+                stats.cached += theirs.cached
+                stats.server_ms += theirs.server_ms
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def print_cache_report(self, limit: int = 10) -> None:
+        report = self.cache_report()
+        total_calls = sum(row["calls"] for row in report)
+        print(f"\n🗂️  Plan cache: {len(report)} distinct queries, "
+              f"{total_calls} calls, {self.hit_rate*100:.1f}% cached")
+        for row in report[:limit]:
+            preview = row["query"][:60]
+            print(f"   {row['calls']:>6} calls  {row['hit_rate']*100:5.1f}% hit  "
+                  f"{row['avg_server_ms']:8.2f}ms  {preview}")
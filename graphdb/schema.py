@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Literal, Set, Tuple
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """One index on a node label.
+
+    Range indexes in FalkorDB are per attribute, so a multi-property range
+    spec such as ``Clause(matter_id, clause_number, version)`` is created as
+    one index per property. Full-text specs cover all properties together.
+    """
+
+    label: str
+    properties: Tuple[str, ...]
+    kind: Literal["range", "fulltext"] = "range"
+
+    def describe(self) -> str:
+        prefix = "FULLTEXT " if self.kind == "fulltext" else ""
+        return f"{prefix}{self.label}({', '.join(self.properties)})"
+
+
+# Join keys used by ingestion relationship MATCHes and the KPI queries.
+SCHEMA_INDEXES: List[IndexSpec] = [
+    IndexSpec("Matter", ("matter_id",)),
+    IndexSpec("Party", ("matter_id",)),
+    IndexSpec("Clause", ("clause_id",)),
+    IndexSpec("Clause", ("matter_id", "clause_number", "version")),
+    IndexSpec("Recommendation", ("recommendation_id",)),
+    IndexSpec("Decision", ("decision_id",)),
+    IndexSpec("Decision", ("actor",)),
+    IndexSpec("Concession", ("concession_id",)),
+    # Keyword search: seeds clause_search and precedent search instead of CONTAINS scans
+    IndexSpec("Clause", ("title", "category", "text_preview"), kind="fulltext"),
+]
+
+# Summary views (graphdb.summary), MERGEd and read by key
+SCHEMA_INDEXES += [
+    IndexSpec("MatterSummary", ("matter_id", "key")),
+    IndexSpec("MatterTotals", ("matter_id",)),
+    IndexSpec("DecisionTypeSummary", ("decision_type",)),
+]
+
+# Upsert ingestion MERGEs every label on canonical_id
+SCHEMA_INDEXES += [
+    IndexSpec(label, ("canonical_id",))
+    for label in ("Matter", "Party", "Clause", "Recommendation", "Decision", "Concession")
+]
+
+
+def existing_indexes(graph: Any) -> Set[Tuple[str, str, str]]:
+    """Return ``(kind, label, property)`` triples already indexed in the graph."""
+    result = graph.query("CALL db.indexes()")
+    found: Set[Tuple[str, str, str]] = set()
+    for row in result.result_set:
+        label, properties = row[0], row[1]
+        types = row[2] if len(row) > 2 and isinstance(row[2], dict) else {}
+        for prop in properties:
+            kinds = types.get(prop) or ["RANGE"]
+            for kind in kinds:
+                found.add((str(kind).lower(), label, prop))
+    return found
+
+
+def _is_already_indexed(error: Exception) -> bool:
+    message = str(error).lower()
+    return "already indexed" in message or "already exists" in message
+
+
+def ensure_indexes(graph: Any, specs: Iterable[IndexSpec] = SCHEMA_INDEXES) -> List[str]:
+    """Create any missing indexes and return descriptions of those created.
+
+    Safe to run repeatedly: present indexes are skipped, and a concurrent
+    creator racing us is tolerated via the "already indexed" error.
+    """
+    present = existing_indexes(graph)
+    created: List[str] = []
+
+    for spec in specs:
+        if spec.kind == "fulltext":
+            # A label has one full-text index; creating it again adds the missing fields
+            missing = [prop for prop in spec.properties if ("fulltext", spec.label, prop) not in present]
+            if not missing:
+                continue
+            props = ", ".join(f"n.{prop}" for prop in missing)
+            statements = [(spec.describe(), f"CREATE FULLTEXT INDEX FOR (n:{spec.label}) ON ({props})")]
+        else:
+            statements = [
+                (f"{spec.label}({prop})", f"CREATE INDEX FOR (n:{spec.label}) ON (n.{prop})")
+                for prop in spec.properties
+                if ("range", spec.label, prop) not in present
+            ]
+
+        for description, statement in statements:
+            try:
+                graph.query(statement)
+            except Exception as exc:
+                if not _is_already_indexed(exc):
+                    raise
+                continue
+            created.append(description)
+
+    return created
@@ -0,0 +1,215 @@
+"""Materialized summary views of the basic negotiation_continuity schema.
+
+Overview questions (per-version matter counts, label totals, the decision
+type histogram) read small summary nodes instead of re-aggregating the graph:
+
+- ``MatterSummary``: one per matter version, with clause, recommendation,
+  decision, concession and unfavorable-recommendation counts.
+- ``MatterTotals``: per-matter node counts by label and decision type. It
+  records what this matter last contributed to the graph-wide views.
+- ``GraphSummary`` (a single node) and ``DecisionTypeSummary`` (one per
+  decision type): graph-wide totals.
+
+After each matter file is written, ``refresh_matter_summary`` recounts that
+matter alone through its ``matter_id`` index seeks. It then applies the
+difference from the matter's previous totals to the graph-wide views in one
+statement, so concurrent workers ingesting different matters never lose an
+update.
+"""
+from __future__ import annotations
+
+import json
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+SUMMARY_LABELS: Tuple[str, ...] = ("MatterSummary", "MatterTotals", "GraphSummary", "DecisionTypeSummary")
+
+# Node labels counted per matter, and the totals property each one feeds
+COUNTED_LABELS: Dict[str, str] = {
+    "Matter": "matters",
+    "Party": "parties",
+    "Clause": "clauses",
+    "Recommendation": "recommendations",
+    "Decision": "decisions",
+    "Concession": "concessions",
+}
+
+VERSION_COUNTS_QUERY = """
+MATCH (m:Matter {matter_id: $matter_id})
+OPTIONAL MATCH (c:Clause {matter_id: $matter_id, version: m.version})
+OPTIONAL MATCH (c)-[:HAS_RECOMMENDATION]->(r:Recommendation)
+OPTIONAL MATCH (r)-[:HAS_DECISION]->(d:Decision)
+OPTIONAL MATCH (d)-[:RESULTED_IN_CONCESSION]->(con:Concession)
+RETURN m.matter_id, m.version, m.matter_type, m.timestamp,
+       COUNT(DISTINCT c), COUNT(DISTINCT r), COUNT(DISTINCT d), COUNT(DISTINCT con)
+"""
+
+UNFAVORABLE_COUNTS_QUERY = """
+MATCH (c:Clause {matter_id: $matter_id})-[:HAS_RECOMMENDATION]->(r:Recommendation {classification: 'unfavorable'})
+RETURN c.version, COUNT(DISTINCT r)
+"""
+
+LABEL_COUNTS_QUERY = """
+OPTIONAL MATCH (m:Matter {matter_id: $matter_id})
+WITH COUNT(m) AS matters
+OPTIONAL MATCH (p:Party {matter_id: $matter_id})
+WITH matters, COUNT(p) AS parties
+OPTIONAL MATCH (c:Clause {matter_id: $matter_id})
+WITH matters, parties, COUNT(c) AS clauses
+OPTIONAL MATCH (r:Recommendation {matter_id: $matter_id})
+WITH matters, parties, clauses, COUNT(r) AS recommendations
+OPTIONAL MATCH (d:Decision {matter_id: $matter_id})
+WITH matters, parties, clauses, recommendations, COUNT(d) AS decisions
+OPTIONAL MATCH (con:Concession {matter_id: $matter_id})
+RETURN matters, parties, clauses, recommendations, decisions, COUNT(con) AS concessions
+"""
+
+DECISION_TYPES_QUERY = """
+MATCH (d:Decision {matter_id: $matter_id})
+RETURN d.decision_type, COUNT(d)
+"""
+
+MATTER_TOTALS_QUERY = """
+MATCH (t:MatterTotals {matter_id: $matter_id})
+RETURN properties(t)
+"""
+
+WRITE_VERSIONS_QUERY = """
+UNWIND $versions AS row
+MERGE (s:MatterSummary {key: row.key})
+SET s += row
+"""
+
+DELETE_STALE_VERSIONS_QUERY = """
+MATCH (s:MatterSummary {matter_id: $matter_id})
+WHERE NOT s.key IN $keys
+DELETE s
+"""
+
+WRITE_TOTALS_QUERY = """
+MERGE (t:MatterTotals {matter_id: $matter_id})
+SET t += $totals
+"""
+
+APPLY_DELTA_QUERY = """
+MERGE (g:GraphSummary)
+SET g.matters = coalesce(g.matters, 0) + $delta.matters,
+    g.parties = coalesce(g.parties, 0) + $delta.parties,
+    g.clauses = coalesce(g.clauses, 0) + $delta.clauses,
+    g.recommendations = coalesce(g.recommendations, 0) + $delta.recommendations,
+    g.decisions = coalesce(g.decisions, 0) + $delta.decisions,
+    g.concessions = coalesce(g.concessions, 0) + $delta.concessions
+WITH g
+UNWIND $decision_types AS row
+MERGE (t:DecisionTypeSummary {decision_type: row.decision_type})
+SET t.count = coalesce(t.count, 0) + row.delta
+"""
+
+MATTER_IDS_QUERY = "MATCH (m:Matter) RETURN DISTINCT m.matter_id"
+
+# Readers
+
+GRAPH_SUMMARY_QUERY = """
+MATCH (g:GraphSummary)
+RETURN g.matters, g.parties, g.clauses, g.recommendations, g.decisions, g.concessions
+"""
+
+MATTER_VERSIONS_QUERY = """
+MATCH (s:MatterSummary {matter_id: $matter_id})
+RETURN s.matter_id, s.version, s.matter_type, s.timestamp,
+       s.clauses, s.recommendations, s.decisions, s.concessions, s.unfavorable
+ORDER BY s.version
+"""
+
+
+def version_key(matter_id: Any, version: Any, matter_type: Any, timestamp: Any) -> str:
+    """Identity of a MatterSummary: the grouping of the matter overview query."""
+    return json.dumps([matter_id, version, matter_type, timestamp])
+
+
+def matter_versions(graph: Any, matter_id: str) -> List[Dict[str, Any]]:
+    """Fresh MatterSummary rows for every version of ``matter_id``."""
+    params = {"matter_id": matter_id}
+    unfavorable = dict(graph.query(UNFAVORABLE_COUNTS_QUERY, params=params).result_set)
+    versions = []
+    for row in graph.query(VERSION_COUNTS_QUERY, params=params).result_set:
+        matter, version, matter_type, timestamp, clauses, recs, decisions, concessions = row
+        versions.append({
+            "key": version_key(matter, version, matter_type, timestamp),
+            "matter_id": matter,
+            "version": version,
+            "matter_type": matter_type,
+            "timestamp": timestamp,
+            "clauses": clauses,
+            "recommendations": recs,
+            "decisions": decisions,
+            "concessions": concessions,
+            "unfavorable": unfavorable.get(version, 0),
+        })
+    return versions
+
+
+def matter_totals(graph: Any, matter_id: str) -> Dict[str, Any]:
+    """Node counts of ``matter_id`` by label, plus its decision type histogram."""
+    params = {"matter_id": matter_id}
+    counts = graph.query(LABEL_COUNTS_QUERY, params=params).result_set[0]
+    totals: Dict[str, Any] = dict(zip(COUNTED_LABELS.values(), counts))
+    histogram = sorted(
+        (decision_type, count)
+        for decision_type, count in graph.query(DECISION_TYPES_QUERY, params=params).result_set
+        if decision_type is not None
+    )
+    totals["decision_types"] = [decision_type for decision_type, _ in histogram]
+    totals["decision_type_counts"] = [count for _, count in histogram]
+    return totals
+
+
+def totals_delta(old: Dict[str, Any], new: Dict[str, Any]) -> Tuple[Dict[str, int], List[Dict[str, Any]]]:
+    """(label count changes, decision type changes) from ``old`` to ``new`` matter totals."""
+    delta = {name: new.get(name, 0) - old.get(name, 0) for name in COUNTED_LABELS.values()}
+    types: Dict[str, int] = defaultdict(int)
+    for sign, totals in ((-1, old), (1, new)):
+        for decision_type, count in zip(totals.get("decision_types", []), totals.get("decision_type_counts", [])):
+            types[decision_type] += sign * count
+    changed = [{"decision_type": t, "delta": d} for t, d in sorted(types.items()) if d]
+    return delta, changed
+
+
+def refresh_matter_summary(graph: Any, matter_id: str) -> Dict[str, int]:
+    """Recount ``matter_id`` and fold the change into the graph-wide views.
+
+    Call after every write to a matter; returns the label count delta.
+    """
+    versions = matter_versions(graph, matter_id)
+    graph.query(WRITE_VERSIONS_QUERY, params={"versions": versions})
+    graph.query(DELETE_STALE_VERSIONS_QUERY, params={"matter_id": matter_id,
+                                                    "keys": [row["key"] for row in versions]})
+
+    previous = graph.query(MATTER_TOTALS_QUERY, params={"matter_id": matter_id}).result_set
+    old = previous[0][0] if previous else {}
+    new = matter_totals(graph, matter_id)
+    delta, decision_types = totals_delta(old, new)
+    graph.query(WRITE_TOTALS_QUERY, params={"matter_id": matter_id, "totals": new})
+    graph.query(APPLY_DELTA_QUERY, params={"delta": delta, "decision_types": decision_types})
+    return delta
+
+
+def rebuild_summaries(graph: Any) -> int:
+    """Drop every summary node and rebuild the views matter by matter; returns the matter count.
+
+    For graphs ingested before the views existed. Reads the whole graph once.
+    """
+    for label in SUMMARY_LABELS:
+        graph.query(f"MATCH (s:{label}) DELETE s")
+    matter_ids = [row[0] for row in graph.query(MATTER_IDS_QUERY).result_set if row[0] is not None]
+    for matter_id in matter_ids:
+        refresh_matter_summary(graph, matter_id)
+    return len(matter_ids)
+
+
+def graph_summary(graph: Any) -> Dict[str, int]:
+    """Graph-wide node counts by label from GraphSummary; empty if the views were never built."""
+    rows = graph.ro_query(GRAPH_SUMMARY_QUERY).result_set
+    if not rows:
+        return {}
+    return {label: count or 0 for label, count in zip(COUNTED_LABELS, rows[0])}
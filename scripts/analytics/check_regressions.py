@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from analytics.benchmark import DEFAULT_REPORT as BENCHMARK_REPORT
+from analytics.regression import (
+    DEFAULT_ALPHA,
+    DEFAULT_MIN_SLOWDOWN,
+    LatencyComparison,
+    benchmark_samples,
+    compare_samples,
+    kpi_regressions,
+    kpi_results,
+    metrics_runs,
+)
+
+console = Console()
+app = typer.Typer(help="Fail when KPIs or query latencies regress against a stored baseline")
+
+KPI_REPORT = Path("data/reports/kpi_report.json")
+BASELINE_DIR = Path("data/reports/baselines")
+
+
+def render_comparisons(title: str, comparisons: List[LatencyComparison]) -> None:
+    table = Table(title=title)
+    for column in ("Query", "n (base/cur)", "p50 base ms", "p50 cur ms", "Slowdown", "P(slower)", "p-value", "Status"):
+        table.add_column(column)
+    for c in comparisons:
+        status = "[red]REGRESSED[/red]" if c.regressed else (c.note or "ok")
+        table.add_row(
+            c.query,
+            f"{c.baseline_n}/{c.current_n}",
+            f"{c.baseline_p50_ms:.2f}",
+            f"{c.current_p50_ms:.2f}",
+            f"{c.slowdown * 100:+.1f}%",
+            f"{c.prob_slower:.2f}",
+            f"{c.p_value:.4f}",
+            status,
+        )
+    console.print(table)
+
+
+@app.command()
+def main(
+    kpi_report: Path = typer.Option(KPI_REPORT, help="Current measure_kpis report."),
+    benchmark_report: Path = typer.Option(BENCHMARK_REPORT, help="Current KPI #5 benchmark report."),
+    metrics: Optional[Path] = typer.Option(
+        None,
+        help="run_kpis JSONL file; its last run is compared with the run before it.",
+    ),
+    baseline_dir: Path = typer.Option(BASELINE_DIR, help="Directory holding the baseline reports."),
+    alpha: float = typer.Option(DEFAULT_ALPHA, help="Significance level of the one-sided test."),
+    min_slowdown: float = typer.Option(
+        DEFAULT_MIN_SLOWDOWN,
+        help="Smallest median slowdown (fraction) that counts as a regression.",
+    ),
+    output: Optional[Path] = typer.Option(None, help="Write the comparison as JSON."),
+    update_baseline: bool = typer.Option(
+        False,
+        help="Copy the current reports into the baseline directory when no regression is found.",
+    ),
+) -> None:
+    """Compare the current KPI run with the stored baseline."""
+    regressions: List[str] = []
+    summary = {"alpha": alpha, "min_slowdown": min_slowdown}
+
+    baseline_kpis = kpi_results(baseline_dir / kpi_report.name)
+    current_kpis = kpi_results(kpi_report)
+    if current_kpis is None:
+        console.log(f"[yellow]No KPI report at {kpi_report}; skipping KPI comparison.[/yellow]")
+    elif baseline_kpis is None:
+        console.log(f"[yellow]No baseline KPI report in {baseline_dir}; skipping KPI comparison.[/yellow]")
+    else:
+        failed = kpi_regressions(baseline_kpis, current_kpis)
+        summary["kpi_regressions"] = failed
+        regressions += [f"KPI {name} no longer passes" for name in failed]
+
+    baseline_samples = benchmark_samples(baseline_dir / benchmark_report.name)
+    current_samples = benchmark_samples(benchmark_report)
+    if current_samples is None or baseline_samples is None:
+        console.log("[yellow]Benchmark report or baseline missing; skipping KPI #5 latency comparison.[/yellow]")
+    else:
+        comparisons = compare_samples(baseline_samples, current_samples, alpha, min_slowdown)
+        render_comparisons("KPI #5 query latency vs baseline", comparisons)
+        summary["benchmark"] = [c.to_dict() for c in comparisons]
+        regressions += [f"KPI #5 query '{c.query}' is slower" for c in comparisons if c.regressed]
+
+    if metrics is not None:
+        runs = metrics_runs(metrics)
+        if len(runs) < 2:
+            console.log(f"[yellow]{metrics} holds {len(runs)} run(s); need two to compare.[/yellow]")
+        else:
+            (base_id, base), (cur_id, cur) = list(runs.items())[-2:]
+            comparisons = compare_samples(base, cur, alpha, min_slowdown)
+            render_comparisons(f"run_kpis latency: {cur_id} vs {base_id}", comparisons)
+            summary["metrics"] = {"baseline_run": base_id, "current_run": cur_id,
+                                  "queries": [c.to_dict() for c in comparisons]}
+            regressions += [f"run_kpis query '{c.query}' is slower" for c in comparisons if c.regressed]
+
+    summary["regressions"] = regressions
+    if output is not None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+
+    if regressions:
+        for message in regressions:
+            console.print(f"[red]✗ {message}[/red]")
+        raise typer.Exit(code=1)
+
+    console.print("[green]No regressions against the baseline.[/green]")
+    if update_baseline:
+        baseline_dir.mkdir(parents=True, exist_ok=True)
+        for report in (kpi_report, benchmark_report):
+            if report.exists():
+                shutil.copyfile(report, baseline_dir / report.name)
+        console.log(f"Baseline updated in {baseline_dir}")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import typer
+from dotenv import load_dotenv
+from rich.console import Console
+from rich.table import Table
+
+from analytics.clause_index import fulltext_query
+from analytics.kpi_queries import default_templates
+from analytics.plan_profiler import DEFAULT_OUTPUT_DIR, QueryProfile, profile_query, write_reports
+from scripts.ingest.load_graphiti import GraphitiConfig
+from scripts.nl_paging import DEFAULT_PAGE_SIZE
+
+console = Console()
+app = typer.Typer(help="Capture EXPLAIN/PROFILE plans for KPI templates and NL query patterns")
+
+# Representative values for the NL pattern parameters
+NL_SAMPLE_PARAMS: Dict[str, object] = {
+    "version": 2,
+    "terms": fulltext_query("liability"),
+    "actor": "Sarah Chen",
+    "matter_id": "matter_001",
+    "clause_number": "1.1",
+    # First page of keyset-paginated patterns ($after_N stay null)
+    "limit": DEFAULT_PAGE_SIZE + 1,
+}
+
+
+def profile_templates(graph, params: Dict[str, str], run_profile: bool) -> List[QueryProfile]:
+    return [
+        profile_query(graph, template.name, "template", template.cypher, params, run_profile)
+        for template in default_templates()
+    ]
+
+
+def profile_nl_patterns(graph_name: str, host: str, port: int, run_profile: bool) -> List[QueryProfile]:
+    from scripts.nl_query import NaturalLanguageQueryInterface
+
+    nl = NaturalLanguageQueryInterface(graph_name, host=host, port=port)
+    try:
+        return [
+            profile_query(
+                nl.graph,
+                pattern["intent"],
+                "nl",
+                pattern.get("cypher") or pattern["cypher_template"],
+                NL_SAMPLE_PARAMS,
+                run_profile,
+            )
+            for pattern in nl.query_patterns
+        ]
+    finally:
+        nl.close()
+
+
+@app.command()
+def main(
+    output_dir: Path = typer.Option(DEFAULT_OUTPUT_DIR, help="Directory for per-query plan reports."),
+    templates: bool = typer.Option(True, help="Profile analytics/kpi_queries templates (Graphiti graph)."),
+    nl: bool = typer.Option(True, help="Profile nl_query patterns (basic graph)."),
+    nl_graph: str = typer.Option("negotiation_continuity", help="Graph the NL patterns run against."),
+    profile: bool = typer.Option(True, help="Also run GRAPH.PROFILE (executes the queries)."),
+    canonical_clause_id: Optional[str] = typer.Option(None, help="Parameter for clause_lineage."),
+    session_id: Optional[str] = typer.Option(None, help="Parameter for handover_snapshot."),
+    since: str = typer.Option("1970-01-01T00:00:00", help="Parameter for concession_trail."),
+    fail_on_findings: bool = typer.Option(False, help="Exit 1 if any plan has a finding."),
+) -> None:
+    """Write one plan report per query and flag scans and Cartesian products."""
+    load_dotenv()
+    config = GraphitiConfig.from_env()
+    profiles: List[QueryProfile] = []
+
+    if templates:
+        from falkordb import FalkorDB
+
+        graph = FalkorDB(host=config.host, port=config.port).select_graph(config.graph_name)
+        params = {"since": since, "canonical_clause_id": canonical_clause_id, "session_id": session_id}
+        profiles += profile_templates(graph, params, profile)
+    if nl:
+        profiles += profile_nl_patterns(nl_graph, config.host, config.port, profile)
+
+    index_path = write_reports(profiles, output_dir)
+
+    table = Table(title="Query plans")
+    for column in ("Source", "Query", "Time ms", "Findings"):
+        table.add_column(column)
+    for item in profiles:
+        findings = "; ".join(f"{f.kind} {f.args or ''}".strip() for f in item.findings)
+        time_ms = item.total_time_ms
+        table.add_row(
+            item.source,
+            item.name,
+            "-" if time_ms is None else f"{time_ms:.2f}",
+            f"[red]{item.error}[/red]" if item.error else (findings or "[green]none[/green]"),
+        )
+    console.print(table)
+    console.log(f"Plan reports written to {output_dir} (index: {index_path.name})")
+
+    if fail_on_findings and any(item.findings or item.error for item in profiles):
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    app()
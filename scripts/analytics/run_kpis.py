@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 import json
+import time
+from collections import defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import typer
 from dotenv import load_dotenv
 from rich.console import Console
 from rich.table import Table
 
+from analytics.benchmark import LatencySummary
 from analytics.kpi_queries import build_queries, describe_queries
+from analytics.kpi_runner import stream_executions
+from scripts.ingest.load_graphiti import GraphitiConfig
 
 console = Console()
 app = typer.Typer(help="Execute or preview KPI queries against Graphiti")
@@ -42,8 +47,22 @@ def main(
         True,
         help="Preview queries instead of executing against Graphiti.",
     ),
+    repeat: int = typer.Option(
+        1,
+        min=1,
+        help="Executions of every query (execute mode).",
+    ),
+    concurrency: int = typer.Option(
+        1,
+        min=1,
+        help="Queries in flight at once, one connection each (execute mode).",
+    ),
+    append: bool = typer.Option(
+        False,
+        help="Append to the metrics file instead of replacing it.",
+    ),
 ) -> None:
-    """Preview KPI queries and emit placeholder metrics."""
+    """Preview KPI queries, or execute them and stream per-query metrics."""
     load_dotenv()
 
     params: Dict[str, str] = {}
@@ -67,21 +86,62 @@ def main(
     console.print(table)
 
     output.parent.mkdir(parents=True, exist_ok=True)
-    with output.open("w", encoding="utf-8") as handle:
-        for item in metadata:
-            record = {
-                "query": item["name"],
-                "parameters": item["parameters"],
-                "status": "pending" if not dry_run else "skipped",
-                "description": item["description"],
-            }
-            handle.write(json.dumps(record) + "\n")
-
+    mode = "a" if append else "w"
     if dry_run:
+        with output.open(mode, encoding="utf-8") as handle:
+            for item in metadata:
+                record = {
+                    "query": item["name"],
+                    "parameters": item["parameters"],
+                    "status": "skipped",
+                    "description": item["description"],
+                }
+                handle.write(json.dumps(record) + "\n")
         console.log("Dry-run complete; metrics file contains placeholders.")
         return
 
-    raise NotImplementedError("Graphiti execution wiring will be added once connectivity is ready.")
+    config = GraphitiConfig.from_env()
+
+    def connect():
+        from falkordb import FalkorDB
+
+        return FalkorDB(host=config.host, port=config.port).select_graph(config.graph_name)
+
+    run_id = datetime.now(timezone.utc).isoformat()
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    start = time.perf_counter()
+    with output.open(mode, encoding="utf-8") as handle:
+        # One line per finished execution, flushed so the file can be tailed
+        for record in stream_executions(connect, queries, repeat=repeat, concurrency=concurrency):
+            record.update(run_id=run_id, graph=config.graph_name, repeat=repeat, concurrency=concurrency)
+            handle.write(json.dumps(record, default=str) + "\n")
+            handle.flush()
+            statuses[record["query"]][record["status"]] += 1
+            if record["status"] == "ok":
+                latencies[record["query"]].append(record["latency_ms"])
+    elapsed = time.perf_counter() - start
+
+    summary = Table(title=f"KPI query latency ({repeat}x, concurrency {concurrency}, {elapsed:.2f}s)")
+    for column in ("Query", "OK", "Errors", "Skipped", "p50 ms", "p95 ms", "max ms"):
+        summary.add_column(column)
+    for item in metadata:
+        name = item["name"]
+        stats = LatencySummary.from_samples(latencies[name])
+        summary.add_row(
+            name,
+            str(statuses[name]["ok"]),
+            str(statuses[name]["error"]),
+            str(statuses[name]["skipped"]),
+            f"{stats.p50_ms:.2f}",
+            f"{stats.p95_ms:.2f}",
+            f"{stats.max_ms:.2f}",
+        )
+    console.print(summary)
+    console.log(f"Metrics written to {output}")
+
+    if any(counts["error"] for counts in statuses.values()):
+        raise typer.Exit(code=1)
 
 
 if __name__ == "__main__":
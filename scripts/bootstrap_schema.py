@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Create the indexes used by ingestion and KPI queries.
+
+Idempotent: existing indexes are left alone, so this can run before every
+ingestion. Prints KPI #5 query latencies before and after the bootstrap so
+the effect of new indexes is visible. Queries that need a full-text index
+time their CONTAINS scan while the index is missing, and are marked.
+
+Usage:
+    python scripts/bootstrap_schema.py
+    python scripts/bootstrap_schema.py --repeats 10
+    python scripts/bootstrap_schema.py --skip-benchmark
+    python scripts/bootstrap_schema.py --rebuild-summaries
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from falkordb import FalkorDB
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from graphdb import SCHEMA_INDEXES, ensure_indexes, rebuild_summaries
+from scripts.measure_kpis import runnable_kpi5_queries
+
+
+def time_kpi5_queries(graph, repeats: int, queries: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Median latency in milliseconds for each KPI #5 query"""
+    latencies = {}
+    for test in queries:
+        samples = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            graph.ro_query(test["query"])
+            samples.append((time.perf_counter() - start) * 1000)
+        latencies[test["name"]] = statistics.median(samples)
+    return latencies
+
+
+def print_latency_comparison(before: Dict[str, float], after: Dict[str, float], scanned: List[str]):
+    """Print before/after KPI #5 latencies side by side
+
+    ``scanned`` names queries whose "before" run timed the CONTAINS scan
+    because their full-text index did not exist yet.
+    """
+    print(f"\n   {'Query':<34}{'Before':>10}{'After':>10}{'Speedup':>10}")
+    for name, before_ms in before.items():
+        after_ms = after[name]
+        speedup = before_ms / after_ms if after_ms > 0 else float("inf")
+        mark = " *" if name in scanned else ""
+        print(f"   {name:<34}{before_ms:>8.2f}ms{after_ms:>8.2f}ms{speedup:>9.1f}x{mark}")
+    if scanned:
+        print("\n   * before: CONTAINS scan, full-text index not yet created")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create negotiation_continuity indexes")
+    parser.add_argument("--graph", default="negotiation_continuity", help="Graph name")
+    parser.add_argument("--host", default="localhost", help="FalkorDB host")
+    parser.add_argument("--port", type=int, default=6379, help="FalkorDB port")
+    parser.add_argument("--repeats", type=int, default=5,
+                        help="Timed runs per KPI #5 query (median is reported)")
+    parser.add_argument("--skip-benchmark", action="store_true",
+                        help="Only create indexes, do not time KPI #5 queries")
+    parser.add_argument("--rebuild-summaries", action="store_true",
+                        help="Rebuild the overview summary views from the whole graph "
+                             "(needed once for graphs ingested before they existed)")
+    args = parser.parse_args()
+
+    print("="*80)
+    print("SCHEMA BOOTSTRAP")
+    print("="*80)
+
+    db = FalkorDB(host=args.host, port=args.port)
+    graph = db.select_graph(args.graph)
+    print(f"\n🔌 Graph: {args.graph} ({args.host}:{args.port})")
+
+    before = None
+    if not args.skip_benchmark:
+        print(f"\n⏱️  Timing KPI #5 queries before bootstrap ({args.repeats} runs each)...")
+        before_queries = runnable_kpi5_queries(graph)
+        scanned = [test["name"] for test in before_queries if test.get("index_missing")]
+        before = time_kpi5_queries(graph, args.repeats, before_queries)
+
+    print(f"\n🧱 Ensuring {len(SCHEMA_INDEXES)} index specs...")
+    created = ensure_indexes(graph)
+    if created:
+        for description in created:
+            print(f"   ✅ Created {description}")
+    else:
+        print("   ✅ All indexes already present")
+
+    if before is not None:
+        print(f"\n⏱️  Timing KPI #5 queries after bootstrap...")
+        after = time_kpi5_queries(graph, args.repeats, runnable_kpi5_queries(graph))
+        print_latency_comparison(before, after, scanned)
+        if not created:
+            print("\n   Note: no indexes were created, so both runs used the same schema.")
+
+    if args.rebuild_summaries:
+        print(f"\n🧮 Rebuilding summary views...")
+        matters = rebuild_summaries(graph)
+        print(f"   ✅ Summarised {matters} matters")
+
+    print("\n✅ Schema bootstrap complete!")
+
+
+if __name__ == "__main__":
+    main()
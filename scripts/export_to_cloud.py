@@ -22,6 +22,12 @@ from pathlib import Path
 from falkordb import FalkorDB
 from dotenv import load_dotenv
 
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from graphdb import QueryRunner
+
 # Load environment variables
 load_dotenv()
 
@@ -117,7 +123,7 @@ def copy_nodes(local_graph, cloud_db):
     """Copy all nodes from local to cloud"""
     print("\n📦 Copying nodes to cloud...")
 
-    cloud_graph = cloud_db.select_graph(GRAPH_NAME)
+    cloud_graph = QueryRunner(cloud_db.select_graph(GRAPH_NAME))
 
     node_types = ['Matter', 'Party', 'Clause', 'Recommendation', 'Decision', 'Concession']
 
@@ -129,28 +135,16 @@ def copy_nodes(local_graph, cloud_db):
         # Get all nodes of this type from local
         result = local_graph.query(f'MATCH (n:{node_type}) RETURN n')
 
+        # Labels cannot be parameters, so there is one constant query per label
+        create_query = f'CREATE (n:{node_type}) SET n = $props'
+
         count = 0
         for row in result.result_set:
             node = row[0]
-            props = node.properties
-
-            # Build property string for CREATE
-            prop_parts = []
-            for key, value in props.items():
-                if isinstance(value, str):
-                    # Escape quotes
-                    value = value.replace('\\', '\\\\').replace('"', '\\"')
-                    prop_parts.append(f'{key}: "{value}"')
-                elif isinstance(value, bool):
-                    prop_parts.append(f'{key}: {str(value).lower()}')
-                elif value is not None:
-                    prop_parts.append(f'{key}: {value}')
-
-            props_str = ', '.join(prop_parts)
+            props = {key: value for key, value in node.properties.items() if value is not None}
 
             # Create node in cloud
-            create_query = f'CREATE (:{node_type} {{{props_str}}})'
-            cloud_graph.query(create_query)
+            cloud_graph.query(create_query, params={'props': props})
 
             count += 1
 
@@ -158,6 +152,7 @@ def copy_nodes(local_graph, cloud_db):
         total_nodes += count
 
     print(f"\n✅ Total nodes copied: {total_nodes}")
+    cloud_graph.print_cache_report()
     return total_nodes
 
 
@@ -165,7 +160,7 @@ def copy_relationships(local_graph, cloud_db):
     """Copy all relationships from local to cloud"""
     print("\n🔗 Copying relationships to cloud...")
 
-    cloud_graph = cloud_db.select_graph(GRAPH_NAME)
+    cloud_graph = QueryRunner(cloud_db.select_graph(GRAPH_NAME))
 
     rel_types = ['HAS_RECOMMENDATION', 'HAS_DECISION', 'RESULTED_IN_CONCESSION']
 
@@ -191,15 +186,18 @@ def copy_relationships(local_graph, cloud_db):
             to_node = row[3]
 
             # Get ID properties
-            from_id = get_id_property(from_type, from_node.properties)
-            to_id = get_id_property(to_type, to_node.properties)
+            from_field = get_id_field(from_type)
+            to_field = get_id_field(to_type)
 
-            # Create relationship in cloud
+            # Create relationship in cloud (constant text per label pair)
             create_query = f'''
-                MATCH (a:{from_type} {{{from_id}}}), (b:{to_type} {{{to_id}}})
+                MATCH (a:{from_type} {{{from_field}: $from_id}}), (b:{to_type} {{{to_field}: $to_id}})
                 CREATE (a)-[:{rel_type}]->(b)
             '''
-            cloud_graph.query(create_query)
+            cloud_graph.query(create_query, params={
+                'from_id': from_node.properties.get(from_field, ''),
+                'to_id': to_node.properties.get(to_field, ''),
+            })
 
             count += 1
 
@@ -207,11 +205,12 @@ def copy_relationships(local_graph, cloud_db):
         total_rels += count
 
     print(f"\n✅ Total relationships copied: {total_rels}")
+    cloud_graph.print_cache_report()
     return total_rels
 
 
-def get_id_property(node_type, properties):
-    """Get the ID property string for a node"""
+def get_id_field(node_type):
+    """Get the ID property name for a node type"""
     id_fields = {
         'Matter': 'matter_id',
         'Party': 'party_id',
@@ -221,13 +220,7 @@ def get_id_property(node_type, properties):
         'Concession': 'concession_id'
     }
 
-    id_field = id_fields.get(node_type, 'id')
-    id_value = properties.get(id_field, '')
-
-    # Escape quotes in ID value
-    id_value = id_value.replace('\\', '\\\\').replace('"', '\\"')
-
-    return f'{id_field}: "{id_value}"'
+    return id_fields.get(node_type, 'id')
 
 
 def verify_cloud_data(cloud_db):
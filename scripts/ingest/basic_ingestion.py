@@ -7,206 +7,569 @@ but creates the basic graph structure for testing.
 
 Usage:
     python scripts/ingest/basic_ingestion.py data/ground_truth/synthetic/matter_001_v1.json
+    python scripts/ingest/basic_ingestion.py --batch --workers 4 data/ground_truth/synthetic
+    python scripts/ingest/basic_ingestion.py --batch --chunk-size 1000 data/ground_truth/synthetic/matter_001_v1.json
+    python scripts/ingest/basic_ingestion.py --upsert data/ground_truth/synthetic/matter_001_v1.json
 """
 
-import json
+import argparse
+import contextlib
+import io
 import sys
+import time
 from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
 from falkordb import FalkorDB
 
-
-def clean_string_for_cypher(s: str) -> str:
-    """Escape single quotes in strings for Cypher queries"""
-    return s.replace("'", "\\'").replace('"', '\\"').replace('\n', ' ')
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from graphdb import QueryRunner, ensure_indexes, refresh_matter_summary
+from scripts.ingest.json_stream import iter_members, read_member
+from scripts.ingest.manifest import (
+    DEFAULT_MANIFEST,
+    FileManifest,
+    IngestRecord,
+    file_checksum,
+    manifest_key,
+    record_ingestion,
+)
+from scripts.ingest.parallel import MatterResult, WorkerSummary, run_matters, summarize_workers, worker_graph
+
+DEFAULT_CHUNK_SIZE = 500
+GRAPH_NAME = "negotiation_continuity"
+
+
+# Per-row statements used by ingest_matter. The text is constant and every
+# value travels as a parameter, so FalkorDB reuses one cached plan per label.
+ROW_QUERIES: Dict[str, str] = {
+    "Matter": """
+    CREATE (m:Matter {
+        matter_id: $matter_id,
+        matter_type: $matter_type,
+        version: $version,
+        timestamp: $timestamp
+    })
+    """,
+    "Party": """
+    CREATE (p:Party {
+        name: $name,
+        role: $role,
+        matter_id: $matter_id
+    })
+    """,
+    "Clause": """
+    CREATE (c:Clause {
+        clause_id: $clause_id,
+        clause_number: $clause_number,
+        title: $title,
+        category: $category,
+        text_preview: $text_preview,
+        version: $version,
+        matter_id: $matter_id
+    })
+    """,
+    "Recommendation": """
+    CREATE (r:Recommendation {
+        recommendation_id: $recommendation_id,
+        clause_id: $clause_id,
+        issue_type: $issue_type,
+        classification: $classification,
+        reasoning: $reasoning,
+        matter_id: $matter_id
+    })
+    """,
+    "Decision": """
+    CREATE (d:Decision {
+        decision_id: $decision_id,
+        recommendation_id: $recommendation_id,
+        decision_type: $decision_type,
+        actor: $actor,
+        role: $role,
+        timestamp: $timestamp,
+        notes: $notes,
+        matter_id: $matter_id
+    })
+    """,
+    "Concession": """
+    CREATE (c:Concession {
+        concession_id: $concession_id,
+        decision_id: $decision_id,
+        clause_id: $clause_id,
+        description: $description,
+        impact: $impact,
+        rationale: $rationale,
+        matter_id: $matter_id
+    })
+    """,
+}
+
+REL_QUERIES: Dict[str, str] = {
+    "Recommendation": """
+    MATCH (c:Clause {clause_id: $clause_id, matter_id: $matter_id}),
+          (r:Recommendation {recommendation_id: $recommendation_id, matter_id: $matter_id})
+    CREATE (c)-[:HAS_RECOMMENDATION]->(r)
+    """,
+    "Decision": """
+    MATCH (r:Recommendation {recommendation_id: $recommendation_id, matter_id: $matter_id}),
+          (d:Decision {decision_id: $decision_id, matter_id: $matter_id})
+    CREATE (r)-[:HAS_DECISION]->(d)
+    """,
+    "Concession": """
+    MATCH (d:Decision {decision_id: $decision_id, matter_id: $matter_id}),
+          (c:Concession {concession_id: $concession_id, matter_id: $matter_id})
+    CREATE (d)-[:RESULTED_IN_CONCESSION]->(c)
+    """,
+}
+
+
+# Progress messages for the per-row path, printed when a label starts
+ROW_BANNERS: Dict[str, str] = {
+    "Matter": "📦 Creating Matter node...",
+    "Party": "👥 Creating Party nodes...",
+    "Clause": "📋 Creating Clause nodes...",
+    "Recommendation": "💡 Creating Recommendation nodes and Clause relationships...",
+    "Decision": "✅ Creating Decision nodes and Recommendation relationships...",
+    "Concession": "⚠️  Creating Concession nodes and Decision relationships...",
+}
 
 
 def ingest_matter(matter_file: Path, graph_name: str = "negotiation_continuity"):
     """
     Ingest a single matter JSON file into FalkorDB.
 
+    The file is streamed entity by entity, so memory use does not grow with
+    the size of the matter.
+
     Args:
         matter_file: Path to JSON file
         graph_name: Name of the graph database
-    """
 
-    # Load data
-    print(f"📄 Loading {matter_file.name}...")
-    with open(matter_file) as f:
-        data = json.load(f)
-
-    matter_id = data["matter_id"]
-    version = data["version"]
+    Returns:
+        Nodes created per label
+    """
 
-    print(f"   Matter: {matter_id} v{version}")
-    print(f"   Clauses: {len(data['clauses'])}")
-    print(f"   Recommendations: {len(data['recommendations'])}")
-    print(f"   Decisions: {len(data['decisions'])}")
-    print(f"   Concessions: {len(data['concessions'])}")
+    print(f"📄 Streaming {matter_file.name}...")
 
     # Connect to FalkorDB
     print(f"\n🔌 Connecting to FalkorDB...")
     db = FalkorDB(host='localhost', port=6379)
-    graph = db.select_graph(graph_name)
+    graph = QueryRunner(db.select_graph(graph_name))
     print(f"   Graph: {graph_name}")
 
-    # Create Matter node
-    print(f"\n📦 Creating Matter node...")
-    matter_query = f"""
-    CREATE (m:Matter {{
-        matter_id: '{matter_id}',
-        matter_type: '{data['matter_type']}',
-        version: {version},
-        timestamp: '{data['timestamp']}'
-    }})
+    counts = {label: 0 for label in ROW_QUERIES}
+    matter = None
+    current = None
+
+    for label, chunk in iter_ready_chunks(stream_batch_rows(matter_file), chunk_size=1):
+        if label != current:
+            if current is not None:
+                print(f"   ✅ {counts[current]} {current} nodes created")
+            print(f"\n{ROW_BANNERS[label]}")
+            current = label
+        for row in chunk:
+            if label == "Matter":
+                matter = row
+                print(f"   Matter: {row['matter_id']} v{row['version']}")
+            graph.query(ROW_QUERIES[label], params=row)
+            if label in REL_QUERIES:
+                graph.query(REL_QUERIES[label], params=row)
+            counts[label] += 1
+            if label == "Clause" and counts[label] % 5 == 0:
+                print(f"   Progress: {counts[label]} clauses")
+
+    if current is not None:
+        print(f"   ✅ {counts[current]} {current} nodes created")
+
+    graph.print_cache_report()
+
+    print(f"\n✅ Ingestion complete for {matter['matter_id']} v{matter['version']}!")
+    return counts
+
+
+# =============================================================================
+# Batched ingestion (one UNWIND round trip per entity type and chunk)
+# =============================================================================
+
+# Each batch query creates the nodes for one entity type and, where the entity
+# hangs off a parent, the relationship to that parent in the same statement.
+# The parent MATCH uses the same keys as REL_QUERIES.
+BATCH_QUERIES: Dict[str, str] = {
+    "Matter": """
+    UNWIND $rows AS row
+    CREATE (:Matter {
+        matter_id: row.matter_id,
+        matter_type: row.matter_type,
+        version: row.version,
+        timestamp: row.timestamp
+    })
+    """,
+    "Party": """
+    UNWIND $rows AS row
+    CREATE (:Party {
+        name: row.name,
+        role: row.role,
+        matter_id: row.matter_id
+    })
+    """,
+    "Clause": """
+    UNWIND $rows AS row
+    CREATE (:Clause {
+        clause_id: row.clause_id,
+        clause_number: row.clause_number,
+        title: row.title,
+        category: row.category,
+        text_preview: row.text_preview,
+        version: row.version,
+        matter_id: row.matter_id
+    })
+    """,
+    "Recommendation": """
+    UNWIND $rows AS row
+    CREATE (r:Recommendation {
+        recommendation_id: row.recommendation_id,
+        clause_id: row.clause_id,
+        issue_type: row.issue_type,
+        classification: row.classification,
+        reasoning: row.reasoning,
+        matter_id: row.matter_id
+    })
+    WITH r, row
+    MATCH (c:Clause {clause_id: row.clause_id, matter_id: row.matter_id})
+    CREATE (c)-[:HAS_RECOMMENDATION]->(r)
+    """,
+    "Decision": """
+    UNWIND $rows AS row
+    CREATE (d:Decision {
+        decision_id: row.decision_id,
+        recommendation_id: row.recommendation_id,
+        decision_type: row.decision_type,
+        actor: row.actor,
+        role: row.role,
+        timestamp: row.timestamp,
+        notes: row.notes,
+        matter_id: row.matter_id
+    })
+    WITH d, row
+    MATCH (r:Recommendation {recommendation_id: row.recommendation_id, matter_id: row.matter_id})
+    CREATE (r)-[:HAS_DECISION]->(d)
+    """,
+    "Concession": """
+    UNWIND $rows AS row
+    CREATE (con:Concession {
+        concession_id: row.concession_id,
+        decision_id: row.decision_id,
+        clause_id: row.clause_id,
+        description: row.description,
+        impact: row.impact,
+        rationale: row.rationale,
+        matter_id: row.matter_id
+    })
+    WITH con, row
+    MATCH (d:Decision {decision_id: row.decision_id, matter_id: row.matter_id})
+    CREATE (d)-[:RESULTED_IN_CONCESSION]->(con)
+    """,
+}
+
+
+MATTER_HEADER_KEYS = ("matter_id", "matter_type", "version", "timestamp", "parties")
+
+
+def _single_line(s: str) -> str:
+    """Flatten newlines the same way the per-row CREATE path does"""
+    return (s or "").replace('\n', ' ')
+
+
+def matter_row(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "matter_id": data["matter_id"],
+        "matter_type": data["matter_type"],
+        "version": data["version"],
+        "timestamp": data["timestamp"],
+    }
+
+
+def party_rows(matter_id: str, parties: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "name": parties[side]["name"],
+            "role": parties[side]["role"],
+            "matter_id": matter_id,
+        }
+        for side in ("provider", "customer")
+    ]
+
+
+def clause_row(matter_id: str, clause: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "clause_id": clause["clause_id"],
+        "clause_number": clause["clause_number"],
+        "title": _single_line(clause["title"]),
+        "category": _single_line(clause["category"]),
+        "text_preview": f"{_single_line(clause['text'][:200])}...",
+        "version": clause["version"],
+        "matter_id": matter_id,
+    }
+
+
+def recommendation_row(matter_id: str, rec: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "recommendation_id": rec["recommendation_id"],
+        "clause_id": rec["clause_id"],
+        "issue_type": _single_line(rec["issue_type"]),
+        "classification": rec["classification"],
+        "reasoning": f"{_single_line(rec['reasoning'][:200])}...",
+        "matter_id": matter_id,
+    }
+
+
+def decision_row(matter_id: str, dec: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "decision_id": dec["decision_id"],
+        "recommendation_id": dec["recommendation_id"],
+        "decision_type": dec["decision_type"],
+        "actor": dec["actor"],
+        "role": dec["role"],
+        "timestamp": dec["timestamp"],
+        "notes": _single_line(dec.get("notes", "")[:200]),
+        "matter_id": matter_id,
+    }
+
+
+def concession_row(matter_id: str, con: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "concession_id": con["concession_id"],
+        "decision_id": con["decision_id"],
+        "clause_id": con["clause_id"],
+        "description": _single_line(con["description"]),
+        "impact": con["impact"],
+        "rationale": _single_line(con["rationale"]),
+        "matter_id": matter_id,
+    }
+
+
+# Payload array key -> (label, row builder) for the per-item entities
+ITEM_ROWS: Dict[str, Tuple[str, Callable[[str, Dict[str, Any]], Dict[str, Any]]]] = {
+    "clauses": ("Clause", clause_row),
+    "recommendations": ("Recommendation", recommendation_row),
+    "decisions": ("Decision", decision_row),
+    "concessions": ("Concession", concession_row),
+}
+
+# Label whose nodes a label's relationship MATCH needs to find
+PARENT_LABELS: Dict[str, str] = {
+    "Recommendation": "Clause",
+    "Decision": "Recommendation",
+    "Concession": "Decision",
+}
+
+
+def build_batch_rows(data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Convert a matter JSON payload into parameter rows for BATCH_QUERIES.
+
+    Property values match what ingest_matter stores, so both modes produce
+    the same graph.
+    """
+    matter_id = data["matter_id"]
+    rows = {
+        "Matter": [matter_row(data)],
+        "Party": party_rows(matter_id, data["parties"]),
+    }
+    for key, (label, build) in ITEM_ROWS.items():
+        rows[label] = [build(matter_id, item) for item in data[key]]
+    return {label: rows[label] for label in BATCH_QUERIES}
+
+
+def stream_batch_rows(matter_file: Path) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Yield ``(label, row)`` pairs from a matter file without loading it whole.
+
+    Rows come out in file order, one entity at a time. The matter header
+    fields must precede the entity arrays, as they do in every export.
     """
-    graph.query(matter_query)
-    print(f"   ✅ Matter node created")
-
-    # Create Party nodes
-    print(f"\n👥 Creating Party nodes...")
-    provider = data['parties']['provider']
-    customer = data['parties']['customer']
-
-    provider_query = f"""
-    CREATE (p:Party {{
-        name: '{provider['name']}',
-        role: '{provider['role']}',
-        matter_id: '{matter_id}'
-    }})
+    header: Dict[str, Any] = {}
+    header_sent = False
+
+    for key, value, in_array in iter_members(matter_file):
+        if not in_array:
+            header[key] = value
+            if not header_sent and all(k in header for k in MATTER_HEADER_KEYS):
+                header_sent = True
+                yield "Matter", matter_row(header)
+                yield from (("Party", row) for row in party_rows(header["matter_id"], header["parties"]))
+            continue
+        if key not in ITEM_ROWS:
+            continue
+        if not header_sent:
+            raise ValueError(f"{matter_file.name}: '{key}' appears before the matter header")
+        label, build = ITEM_ROWS[key]
+        yield label, build(header["matter_id"], value)
+
+    if not header_sent:
+        missing = [k for k in MATTER_HEADER_KEYS if k not in header]
+        raise KeyError(f"{matter_file.name}: missing {', '.join(missing)}")
+
+
+def iter_chunks(rows: List[Dict[str, Any]], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Yield consecutive slices of at most chunk_size rows"""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    for start in range(0, len(rows), chunk_size):
+        yield rows[start:start + chunk_size]
+
+
+def write_batches(graph, rows_by_label: Dict[str, List[Dict[str, Any]]],
+                  chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Dict[str, float]]:
     """
-    graph.query(provider_query)
-
-    customer_query = f"""
-    CREATE (p:Party {{
-        name: '{customer['name']}',
-        role: '{customer['role']}',
-        matter_id: '{matter_id}'
-    }})
+    Send each entity type as parameterised UNWIND statements.
+
+    Labels are written in dependency order (BATCH_QUERIES order) so that the
+    parent MATCH of every relationship finds its node.
+
+    Returns:
+        Per-label stats: rows, round_trips, seconds, rows_per_sec
     """
-    graph.query(customer_query)
-    print(f"   ✅ 2 Party nodes created")
-
-    # Create Clause nodes
-    print(f"\n📋 Creating Clause nodes...")
-    for i, clause in enumerate(data['clauses'], 1):
-        # Truncate text for demo (avoid huge query strings)
-        text_preview = clean_string_for_cypher(clause['text'][:200])
-
-        clause_query = f"""
-        CREATE (c:Clause {{
-            clause_id: '{clause['clause_id']}',
-            clause_number: '{clause['clause_number']}',
-            title: '{clean_string_for_cypher(clause['title'])}',
-            category: '{clean_string_for_cypher(clause['category'])}',
-            text_preview: '{text_preview}...',
-            version: {clause['version']},
-            matter_id: '{matter_id}'
-        }})
-        """
-        graph.query(clause_query)
-
-        if i % 5 == 0 or i == len(data['clauses']):
-            print(f"   Progress: {i}/{len(data['clauses'])} clauses")
-
-    print(f"   ✅ {len(data['clauses'])} Clause nodes created")
-
-    # Create Recommendation nodes
-    if data['recommendations']:
-        print(f"\n💡 Creating Recommendation nodes...")
-        for i, rec in enumerate(data['recommendations'], 1):
-            rec_query = f"""
-            CREATE (r:Recommendation {{
-                recommendation_id: '{rec['recommendation_id']}',
-                clause_id: '{rec['clause_id']}',
-                issue_type: '{clean_string_for_cypher(rec['issue_type'])}',
-                classification: '{rec['classification']}',
-                reasoning: '{clean_string_for_cypher(rec['reasoning'][:200])}...',
-                matter_id: '{matter_id}'
-            }})
-            """
-            graph.query(rec_query)
-
-        print(f"   ✅ {len(data['recommendations'])} Recommendation nodes created")
-
-        # Create relationships: Clause-[:HAS_RECOMMENDATION]->Recommendation
-        print(f"\n🔗 Creating Clause-Recommendation relationships...")
-        for rec in data['recommendations']:
-            rel_query = f"""
-            MATCH (c:Clause {{clause_id: '{rec['clause_id']}', matter_id: '{matter_id}'}}),
-                  (r:Recommendation {{recommendation_id: '{rec['recommendation_id']}', matter_id: '{matter_id}'}})
-            CREATE (c)-[:HAS_RECOMMENDATION]->(r)
-            """
-            graph.query(rel_query)
-
-        print(f"   ✅ {len(data['recommendations'])} relationships created")
-
-    # Create Decision nodes
-    if data['decisions']:
-        print(f"\n✅ Creating Decision nodes...")
-        for i, dec in enumerate(data['decisions'], 1):
-            notes = clean_string_for_cypher(dec.get('notes', '')[:200])
-
-            dec_query = f"""
-            CREATE (d:Decision {{
-                decision_id: '{dec['decision_id']}',
-                recommendation_id: '{dec['recommendation_id']}',
-                decision_type: '{dec['decision_type']}',
-                actor: '{dec['actor']}',
-                role: '{dec['role']}',
-                timestamp: '{dec['timestamp']}',
-                notes: '{notes}',
-                matter_id: '{matter_id}'
-            }})
-            """
-            graph.query(dec_query)
-
-        print(f"   ✅ {len(data['decisions'])} Decision nodes created")
-
-        # Create relationships: Recommendation-[:HAS_DECISION]->Decision
-        print(f"\n🔗 Creating Recommendation-Decision relationships...")
-        for dec in data['decisions']:
-            rel_query = f"""
-            MATCH (r:Recommendation {{recommendation_id: '{dec['recommendation_id']}', matter_id: '{matter_id}'}}),
-                  (d:Decision {{decision_id: '{dec['decision_id']}', matter_id: '{matter_id}'}})
-            CREATE (r)-[:HAS_DECISION]->(d)
-            """
-            graph.query(rel_query)
-
-        print(f"   ✅ {len(data['decisions'])} relationships created")
-
-    # Create Concession nodes
-    if data['concessions']:
-        print(f"\n⚠️  Creating Concession nodes...")
-        for i, con in enumerate(data['concessions'], 1):
-            con_query = f"""
-            CREATE (c:Concession {{
-                concession_id: '{con['concession_id']}',
-                decision_id: '{con['decision_id']}',
-                clause_id: '{con['clause_id']}',
-                description: '{clean_string_for_cypher(con['description'])}',
-                impact: '{con['impact']}',
-                rationale: '{clean_string_for_cypher(con['rationale'])}',
-                matter_id: '{matter_id}'
-            }})
-            """
-            graph.query(con_query)
-
-        print(f"   ✅ {len(data['concessions'])} Concession nodes created")
-
-        # Create relationships: Decision-[:RESULTED_IN_CONCESSION]->Concession
-        print(f"\n🔗 Creating Decision-Concession relationships...")
-        for con in data['concessions']:
-            rel_query = f"""
-            MATCH (d:Decision {{decision_id: '{con['decision_id']}', matter_id: '{matter_id}'}}),
-                  (c:Concession {{concession_id: '{con['concession_id']}', matter_id: '{matter_id}'}})
-            CREATE (d)-[:RESULTED_IN_CONCESSION]->(c)
-            """
-            graph.query(rel_query)
-
-        print(f"   ✅ {len(data['concessions'])} relationships created")
-
-    print(f"\n✅ Ingestion complete for {matter_id} v{version}!")
-    return True
+    stats: Dict[str, Dict[str, float]] = {}
+
+    for label, query in BATCH_QUERIES.items():
+        rows = rows_by_label.get(label, [])
+        round_trips = 0
+        start = time.perf_counter()
+        for chunk in iter_chunks(rows, chunk_size):
+            graph.query(query, params={"rows": chunk})
+            round_trips += 1
+        elapsed = time.perf_counter() - start
+
+        stats[label] = {
+            "rows": len(rows),
+            "round_trips": round_trips,
+            "seconds": elapsed,
+            "rows_per_sec": len(rows) / elapsed if elapsed > 0 else 0.0,
+        }
+
+    return stats
+
+
+def iter_ready_chunks(labelled_rows: Iterable[Tuple[str, Dict[str, Any]]],
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+    """
+    Group a ``(label, row)`` stream into chunks that are safe to write in order.
+
+    A label's rows are held back until every row of its parent label (see
+    PARENT_LABELS) has been emitted, so relationship MATCHes always find
+    their parent. For files that list entities in dependency order, which
+    every export does, at most one chunk per label is buffered.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    pending: Dict[str, List[Dict[str, Any]]] = {label: [] for label in BATCH_QUERIES}
+    finished = set()
+
+    def ready(label: str) -> bool:
+        parent = PARENT_LABELS.get(label)
+        return parent is None or (parent in finished and not pending[parent] and ready(parent))
+
+    def drain() -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        # BATCH_QUERIES order drains parents before their children are checked
+        for label in BATCH_QUERIES:
+            rows = pending[label]
+            if not rows or not ready(label):
+                continue
+            cut = len(rows) if label in finished else len(rows) - len(rows) % chunk_size
+            for start in range(0, cut, chunk_size):
+                yield label, rows[start:start + chunk_size]
+            pending[label] = rows[cut:]
+
+    current = None
+    for label, row in labelled_rows:
+        if label != current:
+            if current is not None:
+                finished.add(current)
+            current = label
+            yield from drain()
+        pending[label].append(row)
+        if len(pending[label]) >= chunk_size and ready(label):
+            yield label, pending[label]
+            pending[label] = []
+
+    finished.update(pending)
+    yield from drain()
+
+
+def write_row_stream(graph, labelled_rows: Iterable[Tuple[str, Dict[str, Any]]],
+                     chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Dict[str, float]]:
+    """
+    Streaming counterpart of write_batches for ``(label, row)`` pairs.
+
+    Returns:
+        Per-label stats in the write_batches format; seconds is the time
+        spent in that label's queries
+    """
+    stats = {
+        label: {"rows": 0, "round_trips": 0, "seconds": 0.0, "rows_per_sec": 0.0}
+        for label in BATCH_QUERIES
+    }
+
+    for label, chunk in iter_ready_chunks(labelled_rows, chunk_size):
+        start = time.perf_counter()
+        graph.query(BATCH_QUERIES[label], params={"rows": chunk})
+        entry = stats[label]
+        entry["seconds"] += time.perf_counter() - start
+        entry["rows"] += len(chunk)
+        entry["round_trips"] += 1
+
+    for entry in stats.values():
+        if entry["seconds"] > 0:
+            entry["rows_per_sec"] = entry["rows"] / entry["seconds"]
+    return stats
+
+
+def print_batch_stats(stats: Dict[str, Dict[str, float]]):
+    """Print per-entity throughput for a batched ingestion run"""
+    print(f"\n   {'Entity':<16}{'Rows':>8}{'Trips':>8}{'Seconds':>10}{'Rows/s':>12}")
+    for label, row in stats.items():
+        print(f"   {label:<16}{row['rows']:>8}{row['round_trips']:>8}"
+              f"{row['seconds']:>10.3f}{row['rows_per_sec']:>12.0f}")
+
+
+def ingest_matter_batched(matter_file: Path, graph_name: str = "negotiation_continuity",
+                          chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Dict[str, float]]:
+    """
+    Ingest a single matter JSON file using one UNWIND round trip per entity
+    type and chunk, creating relationships in the same pass.
+
+    The file is streamed, so only the chunks being assembled are in memory.
+
+    Args:
+        matter_file: Path to JSON file
+        graph_name: Name of the graph database
+        chunk_size: Maximum rows sent per UNWIND statement
+
+    Returns:
+        Per-label throughput stats (see write_batches)
+    """
+    print(f"📄 Streaming {matter_file.name}...")
+    matter_id = read_member(matter_file, "matter_id")
+    version = read_member(matter_file, "version")
+
+    print(f"   Matter: {matter_id} v{version}")
+    print(f"   Chunk size: {chunk_size}")
+
+    print(f"\n🔌 Connecting to FalkorDB...")
+    db = FalkorDB(host='localhost', port=6379)
+    graph = QueryRunner(db.select_graph(graph_name))
+    print(f"   Graph: {graph_name}")
+
+    print(f"\n📦 Writing batches...")
+    stats = write_row_stream(graph, stream_batch_rows(matter_file), chunk_size)
+    print_batch_stats(stats)
+    graph.print_cache_report()
+
+    print(f"\n✅ Batched ingestion complete for {matter_id} v{version}!")
+    return stats
 
 
 def verify_ingestion(matter_id: str, graph_name: str = "negotiation_continuity"):
@@ -215,31 +578,32 @@ def verify_ingestion(matter_id: str, graph_name: str = "negotiation_continuity")
     print(f"\n🔍 Verifying ingestion for {matter_id}...")
 
     db = FalkorDB(host='localhost', port=6379)
-    graph = db.select_graph(graph_name)
+    graph = QueryRunner(db.select_graph(graph_name))
+    params = {"matter_id": matter_id}
 
     # Count nodes
     queries = {
-        "Matters": f"MATCH (m:Matter {{matter_id: '{matter_id}'}}) RETURN COUNT(m)",
-        "Parties": f"MATCH (p:Party {{matter_id: '{matter_id}'}}) RETURN COUNT(p)",
-        "Clauses": f"MATCH (c:Clause {{matter_id: '{matter_id}'}}) RETURN COUNT(c)",
-        "Recommendations": f"MATCH (r:Recommendation {{matter_id: '{matter_id}'}}) RETURN COUNT(r)",
-        "Decisions": f"MATCH (d:Decision {{matter_id: '{matter_id}'}}) RETURN COUNT(d)",
-        "Concessions": f"MATCH (c:Concession {{matter_id: '{matter_id}'}}) RETURN COUNT(c)",
+        "Matters": "MATCH (m:Matter {matter_id: $matter_id}) RETURN COUNT(m)",
+        "Parties": "MATCH (p:Party {matter_id: $matter_id}) RETURN COUNT(p)",
+        "Clauses": "MATCH (c:Clause {matter_id: $matter_id}) RETURN COUNT(c)",
+        "Recommendations": "MATCH (r:Recommendation {matter_id: $matter_id}) RETURN COUNT(r)",
+        "Decisions": "MATCH (d:Decision {matter_id: $matter_id}) RETURN COUNT(d)",
+        "Concessions": "MATCH (c:Concession {matter_id: $matter_id}) RETURN COUNT(c)",
     }
 
     for label, query in queries.items():
-        result = graph.query(query)
+        result = graph.ro_query(query, params=params)
         count = result.result_set[0][0] if result.result_set else 0
         print(f"   {label}: {count}")
 
     # Sample query: Find unfavorable recommendations
     print(f"\n📊 Sample Query: Unfavorable Recommendations")
-    sample_query = f"""
-    MATCH (c:Clause {{matter_id: '{matter_id}'}})-[:HAS_RECOMMENDATION]->(r:Recommendation {{classification: 'unfavorable'}})
+    sample_query = """
+    MATCH (c:Clause {matter_id: $matter_id})-[:HAS_RECOMMENDATION]->(r:Recommendation {classification: 'unfavorable'})
     RETURN c.clause_number, c.title, r.issue_type
     LIMIT 3
     """
-    result = graph.query(sample_query)
+    result = graph.ro_query(sample_query, params=params)
 
     if result.result_set:
         for row in result.result_set:
@@ -250,18 +614,136 @@ def verify_ingestion(matter_id: str, graph_name: str = "negotiation_continuity")
     print(f"\n✅ Verification complete!")
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python scripts/ingest/basic_ingestion.py <matter_file.json>")
-        print("\nExample:")
-        print("  python scripts/ingest/basic_ingestion.py data/ground_truth/synthetic/matter_001_v1.json")
-        sys.exit(1)
+def group_matter_files(paths: Iterable[Path]) -> Dict[str, List[Path]]:
+    """
+    Expand files and directories into matter JSON files grouped by matter_id.
 
-    matter_file = Path(sys.argv[1])
+    Each group is sorted by version so that v1 is applied before v2, and a
+    file named twice is only ingested once.
+    """
+    versions: Dict[str, List[Tuple[int, Path]]] = {}
+    seen = set()
+    for path in paths:
+        files = sorted(path.glob("*.json")) if path.is_dir() else [path]
+        for matter_file in files:
+            if matter_file.resolve() in seen:
+                continue
+            seen.add(matter_file.resolve())
+            matter_id = read_member(matter_file, "matter_id")
+            version = read_member(matter_file, "version")
+            versions.setdefault(matter_id, []).append((version, matter_file))
+    return {
+        matter_id: [matter_file for _, matter_file in sorted(entries)]
+        for matter_id, entries in sorted(versions.items())
+    }
 
-    if not matter_file.exists():
-        print(f"❌ Error: File not found: {matter_file}")
-        sys.exit(1)
+
+def select_files(groups: Dict[str, List[Path]], loaded: Dict[str, str],
+                 force: bool = False) -> Tuple[Dict[str, List[Path]], int, List[Path]]:
+    """
+    Drop files the graph already holds unchanged, and find files it holds an
+    earlier load of.
+
+    Args:
+        groups: group_matter_files output
+        loaded: FileManifest.ingested_files output (key -> checksum)
+        force: Keep unchanged files too
+
+    Returns:
+        (groups still to ingest, unchanged files skipped, files to ingest
+        that were loaded before). Only upsert mode can apply the last ones
+        without duplicating their nodes.
+    """
+    selected: Dict[str, List[Path]] = {}
+    skipped = 0
+    reloaded: List[Path] = []
+    for matter_id, files in groups.items():
+        keep = []
+        for matter_file in files:
+            key = manifest_key(matter_file)
+            if key in loaded:
+                if not force and loaded[key] == file_checksum(matter_file):
+                    skipped += 1
+                    continue
+                reloaded.append(matter_file)
+            keep.append(matter_file)
+        if keep:
+            selected[matter_id] = keep
+    return selected, skipped, reloaded
+
+
+def ingest_matter_files(matter_id: str, files: List[Path], mode: str = "row",
+                        chunk_size: int = DEFAULT_CHUNK_SIZE, quiet: bool = False) -> MatterResult:
+    """
+    Ingest every version of one matter, in order. Used as a pool task.
+
+    Each call opens its own FalkorDB connection, so pool workers never share
+    one. ``quiet`` swallows the per-file progress output, which would
+    otherwise interleave across workers. Every loaded file refreshes the
+    matter's summary views (graphdb.summary) and gets an ingestion Episode;
+    the records come back in ``detail["ingested"]`` for the manifest.
+    """
+    rows = 0
+    ingested: List[IngestRecord] = []
+    with contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext():
+        for matter_file in files:
+            record = IngestRecord(
+                key=manifest_key(matter_file),
+                checksum=file_checksum(matter_file),
+                matter_id=matter_id,
+                version=read_member(matter_file, "version"),
+                reference_time=read_member(matter_file, "timestamp"),
+            )
+            if mode == "upsert":
+                from scripts.ingest.upsert_ingestion import ingest_matter_upsert
+                stats = ingest_matter_upsert(matter_file, chunk_size=chunk_size)
+                rows += sum(entry["rows"] for entry in stats.values())
+            elif mode == "batch":
+                stats = ingest_matter_batched(matter_file, chunk_size=chunk_size)
+                rows += sum(entry["rows"] for entry in stats.values())
+            else:
+                rows += sum(ingest_matter(matter_file).values())
+            # Fold the file into the summary views before the epoch bump invalidates caches
+            graph = worker_graph("localhost", 6379, GRAPH_NAME)
+            refresh_matter_summary(graph, matter_id)
+            ingested.append(record_ingestion(graph, record))
+    return MatterResult(matter=matter_id, files=len(files), rows=rows, detail={"ingested": ingested})
+
+
+def print_worker_stats(summaries: List[WorkerSummary]):
+    """Print combined throughput per pool worker"""
+    print(f"\n   {'Worker':<10}{'Matters':>9}{'Files':>7}{'Rows':>9}{'Seconds':>10}{'Rows/s':>10}")
+    for summary in summaries:
+        print(f"   {summary.worker:<10}{summary.matters:>9}{summary.files:>7}{summary.rows:>9}"
+              f"{summary.seconds:>10.3f}{summary.rows_per_sec:>10.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Load synthetic matter JSON files into FalkorDB",
+        epilog="Example: python scripts/ingest/basic_ingestion.py data/ground_truth/synthetic/matter_001_v1.json",
+    )
+    parser.add_argument("matter_files", nargs="+", type=Path,
+                        help="Matter JSON files, or directories of them, to ingest")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--batch", action="store_true",
+                      help="Use batched UNWIND writes instead of one query per entity")
+    mode.add_argument("--upsert", action="store_true",
+                      help="MERGE on canonical ids; unchanged entities are skipped")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Rows per UNWIND statement in batch/upsert mode (default: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Matters ingested in parallel, one process each (default: 1)")
+    parser.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST,
+                        help=f"Checksum manifest of ingested files (default: {DEFAULT_MANIFEST})")
+    parser.add_argument("--force", action="store_true",
+                        help="Ingest files even if the manifest shows them unchanged")
+    args = parser.parse_args()
+
+    for matter_path in args.matter_files:
+        if not matter_path.exists():
+            print(f"❌ Error: File not found: {matter_path}")
+            sys.exit(1)
 
     print("="*80)
     print("BASIC FALKORDB INGESTION")
@@ -269,17 +751,51 @@ def main():
     print()
 
     try:
-        # Load data from the JSON file
-        with open(matter_file) as f:
-            data = json.load(f)
-
-        matter_id = data["matter_id"]
-
-        # Ingest
-        ingest_matter(matter_file)
+        # Only the headers are read here; ingestion streams the rest
+        groups = group_matter_files(args.matter_files)
+
+        # Make sure the join-key indexes exist before any MATCH runs
+        db = FalkorDB(host='localhost', port=6379)
+        graph = db.select_graph(GRAPH_NAME)
+        created = ensure_indexes(graph)
+        if created:
+            print(f"🧱 Created indexes: {', '.join(created)}\n")
+
+        # Skip files the manifest and the graph both show as already loaded
+        manifest = FileManifest.load(args.manifest)
+        groups, skipped, reloaded = select_files(groups, manifest.ingested_files(GRAPH_NAME, graph),
+                                                 force=args.force)
+        if skipped:
+            print(f"⏭️  Skipping {skipped} unchanged file(s) (use --force to reload)\n")
+
+        # Row and batch mode CREATE every node, so a second load would duplicate it
+        if reloaded and not args.upsert:
+            print(f"❌ {len(reloaded)} file(s) were ingested before and would be duplicated:")
+            for matter_file in reloaded:
+                print(f"   • {matter_file}")
+            print("   Re-run with --upsert to update them in place")
+            sys.exit(1)
+
+        # Ingest, one job per matter so versions stay in order
+        mode_name = "upsert" if args.upsert else "batch" if args.batch else "row"
+        quiet = args.workers > 1
+        if quiet:
+            print(f"🚀 Ingesting {len(groups)} matters with {args.workers} workers...")
+        jobs = [
+            (matter_id, files, mode_name, args.chunk_size, quiet)
+            for matter_id, files in groups.items()
+        ]
+        results = run_matters(ingest_matter_files, jobs, args.workers)
+        for result in results:
+            for record in result.detail["ingested"]:
+                manifest.mark_ingested(record, GRAPH_NAME)
+        manifest.save()
+        if quiet:
+            print_worker_stats(summarize_workers(results))
 
         # Verify
-        verify_ingestion(matter_id)
+        for matter_id in groups:
+            verify_ingestion(matter_id)
 
         print("\n" + "="*80)
         print("✅ SUCCESS!")
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from models import (
+    AgentRecommendation,
+    Clause,
+    Concession,
+    DocVersion,
+    Document,
+    Episode,
+    UserDecision,
+)
+
+
+@dataclass(frozen=True)
+class EdgeSpec:
+    """Relationship derived from a foreign-key field on the written entity.
+
+    ``outgoing`` means the written node is the start of the relationship.
+    """
+
+    rel_type: str
+    field: str
+    other_label: str
+    other_key: str
+    outgoing: bool = False
+
+
+@dataclass(frozen=True)
+class LabelSpec:
+    label: str
+    payload_key: str
+    model: Type[BaseModel]
+    key: str
+    edges: Tuple[EdgeSpec, ...] = ()
+
+
+# Labels, payload keys and edges follow docs/schema/kg_schema_graphiti_enhanced.md
+LABEL_SPECS: Tuple[LabelSpec, ...] = (
+    LabelSpec("Document", "documents", Document, "doc_id"),
+    LabelSpec(
+        "DocVersion", "versions", DocVersion, "version_id",
+        edges=(EdgeSpec("HAS_VERSION", "doc_id", "Document", "doc_id"),),
+    ),
+    LabelSpec(
+        "Clause", "clauses", Clause, "clause_id",
+        edges=(EdgeSpec("BELONGS_TO", "version_id", "DocVersion", "version_id", outgoing=True),),
+    ),
+    LabelSpec(
+        "AgentRecommendation", "recommendations", AgentRecommendation, "rec_id",
+        edges=(EdgeSpec("HAS_AGENT_RECOMMENDATION", "clause_id", "Clause", "clause_id"),),
+    ),
+    LabelSpec(
+        "UserDecision", "decisions", UserDecision, "decision_id",
+        edges=(EdgeSpec("APPLIES_TO", "rec_id", "AgentRecommendation", "rec_id", outgoing=True),),
+    ),
+    LabelSpec(
+        "Concession", "concessions", Concession, "concession_id",
+        edges=(
+            EdgeSpec("AFFECTS_CLAUSE", "clause_id", "Clause", "clause_id", outgoing=True),
+            EdgeSpec("TRIGGERS_CONCESSION", "decision_id", "UserDecision", "decision_id"),
+        ),
+    ),
+    LabelSpec("Episode", "episodes", Episode, "episode_id"),
+)
+
+SPECS_BY_PAYLOAD_KEY: Dict[str, LabelSpec] = {spec.payload_key: spec for spec in LABEL_SPECS}
+
+
+def build_write_query(spec: LabelSpec) -> str:
+    """MERGE the batch on its key and MERGE each edge to the referenced node.
+
+    The referenced node is MERGEd on its key as well, so batches may arrive in
+    any order: a placeholder created by a child is filled in when the parent's
+    own batch is written.
+    """
+    lines = [
+        "UNWIND $rows AS row",
+        f"MERGE (n:{spec.label} {{{spec.key}: row.key}})",
+        "SET n += row.props",
+    ]
+    for index, edge in enumerate(spec.edges):
+        other = f"o{index}"
+        lines.append("WITH n, row")
+        lines.append(f"MERGE ({other}:{edge.other_label} {{{edge.other_key}: row.props.{edge.field}}})")
+        if edge.outgoing:
+            lines.append(f"MERGE (n)-[:{edge.rel_type}]->({other})")
+        else:
+            lines.append(f"MERGE ({other})-[:{edge.rel_type}]->(n)")
+    return "\n".join(lines)
+
+
+WRITE_QUERIES: Dict[str, str] = {spec.label: build_write_query(spec) for spec in LABEL_SPECS}
+
+
+def to_properties(entity: BaseModel) -> Dict[str, Any]:
+    """Flatten a model into FalkorDB-storable properties.
+
+    Datetimes become ISO strings, maps become JSON strings and null fields
+    are dropped.
+    """
+    props: Dict[str, Any] = {}
+    # warnings=False: manifest-trusted entities are built with model_construct
+    # and keep their JSON strings where the model declares datetimes
+    for key, value in entity.model_dump(mode="json", warnings=False).items():
+        if value is None:
+            continue
+        if isinstance(value, dict):
+            value = json.dumps(value, sort_keys=True)
+        props[key] = value
+    return props
+
+
+@dataclass
+class LabelThroughput:
+    label: str
+    rows: int = 0
+    batches: int = 0
+    busy_seconds: float = 0.0
+    first_submit: Optional[float] = None
+    last_done: Optional[float] = None
+
+    @property
+    def wall_seconds(self) -> float:
+        if self.first_submit is None or self.last_done is None:
+            return 0.0
+        return self.last_done - self.first_submit
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+
+@dataclass
+class BulkGraphWriter:
+    """Stream validated entities into a graph as batched, concurrent writes.
+
+    Records are buffered per label and written ``batch_size`` at a time. At
+    most ``concurrency`` batches are in flight; ``add`` blocks once that cap
+    is reached, so memory stays bounded by ``batch_size * concurrency``.
+    A failed batch is raised from the next ``add`` that submits a batch
+    rather than waiting for ``close``.
+    ``graph`` is anything exposing ``query(q, params=...)``.
+    """
+
+    graph: Any
+    batch_size: int = 500
+    concurrency: int = 4
+    _buffers: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict, init=False)
+    _stats: Dict[str, LabelThroughput] = field(default_factory=dict, init=False)
+    _futures: List[Future] = field(default_factory=list, init=False)
+
+    def __post_init__(self) -> None:
+        if self.batch_size < 1 or self.concurrency < 1:
+            raise ValueError("batch_size and concurrency must be at least 1")
+        self._pool = ThreadPoolExecutor(max_workers=self.concurrency)
+        self._slots = threading.BoundedSemaphore(self.concurrency)
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "BulkGraphWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def add(self, spec: LabelSpec, entity: BaseModel) -> None:
+        props = to_properties(entity)
+        buffer = self._buffers.setdefault(spec.label, [])
+        buffer.append({"key": props[spec.key], "props": props})
+        if len(buffer) >= self.batch_size:
+            self._submit(spec.label)
+
+    def add_payload(self, blob: Dict[str, Any]) -> int:
+        """Queue every known entity list in a payload blob.
+
+        Items that are already models are written as-is; raw dicts are
+        validated first.
+        """
+        added = 0
+        for payload_key, raws in blob.items():
+            spec = SPECS_BY_PAYLOAD_KEY.get(payload_key)
+            if spec is None or not isinstance(raws, list):
+                continue
+            for raw in raws:
+                entity = raw if isinstance(raw, BaseModel) else spec.model.model_validate(raw)
+                self.add(spec, entity)
+                added += 1
+        return added
+
+    def flush(self) -> None:
+        for label in list(self._buffers):
+            if self._buffers[label]:
+                self._submit(label)
+
+    def drain(self) -> None:
+        """Write every buffered row and wait until all submitted batches have landed."""
+        self.flush()
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+
+    def close(self) -> Dict[str, LabelThroughput]:
+        try:
+            self.drain()
+        finally:
+            self._pool.shutdown(wait=True)
+        return self.throughput()
+
+    def throughput(self) -> Dict[str, LabelThroughput]:
+        with self._lock:
+            return {
+                spec.label: self._stats[spec.label]
+                for spec in LABEL_SPECS
+                if spec.label in self._stats
+            }
+
+    def _reap(self) -> None:
+        """Forget landed batches and raise the first one that failed."""
+        landed = [future for future in self._futures if future.done()]
+        self._futures = [future for future in self._futures if future not in landed]
+        for future in landed:
+            if future.exception() is not None:
+                raise future.exception()
+
+    def _submit(self, label: str) -> None:
+        self._reap()
+        rows = self._buffers[label]
+        self._buffers[label] = []
+        self._slots.acquire()
+        with self._lock:
+            stats = self._stats.setdefault(label, LabelThroughput(label=label))
+            if stats.first_submit is None:
+                stats.first_submit = time.perf_counter()
+        try:
+            future = self._pool.submit(self._write, label, rows)
+        except BaseException:
+            self._slots.release()
+            raise
+        self._futures.append(future)
+
+    def _write(self, label: str, rows: List[Dict[str, Any]]) -> None:
+        start = time.perf_counter()
+        try:
+            self.graph.query(WRITE_QUERIES[label], params={"rows": rows})
+        finally:
+            done = time.perf_counter()
+            self._slots.release()
+            with self._lock:
+                stats = self._stats[label]
+                stats.rows += len(rows)
+                stats.batches += 1
+                stats.busy_seconds += done - start
+                stats.last_done = max(stats.last_done or done, done)
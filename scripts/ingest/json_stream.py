@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, TextIO, Tuple, Union
+
+DEFAULT_READ_SIZE = 1 << 16
+
+_WHITESPACE = " \t\r\n"
+_decoder = json.JSONDecoder()
+
+
+class _Scanner:
+    """Buffered cursor over a text stream that decodes one JSON value at a time.
+
+    Only the unconsumed tail of the input is kept, so memory is bounded by the
+    largest single value plus one read.
+    """
+
+    def __init__(self, handle: TextIO, read_size: int = DEFAULT_READ_SIZE) -> None:
+        if read_size < 1:
+            raise ValueError("read_size must be at least 1")
+        self.handle = handle
+        self.read_size = read_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, size: int) -> bool:
+        if self.eof:
+            return False
+        if self.pos > self.read_size and self.pos * 2 > len(self.buf):
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        chunk = self.handle.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf += chunk
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ('' at EOF)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill(self.read_size):
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos}, found {found or 'EOF'!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        size = self.read_size
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill(size):
+                    raise
+            else:
+                # A number cut off at the buffer edge decodes "successfully"
+                if end < len(self.buf) or not self._fill(size):
+                    self.pos = end
+                    return value
+            # Grow reads geometrically so one huge value is not re-parsed
+            # once per read_size
+            size *= 2
+
+
+def iter_members(
+    source: Union[str, Path, TextIO],
+    read_size: int = DEFAULT_READ_SIZE,
+) -> Iterator[Tuple[str, Any, bool]]:
+    """Walk the members of a top-level JSON object without loading it whole.
+
+    Yields ``(key, value, False)`` for scalar and object members and
+    ``(key, item, True)`` for every element of an array member, in file order.
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, "r", encoding="utf-8") as handle:
+            yield from iter_members(handle, read_size)
+        return
+
+    scanner = _Scanner(source, read_size)
+    scanner.expect("{")
+    if scanner.peek() == "}":
+        return
+    while True:
+        key = scanner.value()
+        if not isinstance(key, str):
+            raise ValueError(f"Expected an object key at offset {scanner.pos}")
+        scanner.expect(":")
+        if scanner.peek() == "[":
+            scanner.pos += 1
+            if scanner.peek() == "]":
+                scanner.pos += 1
+            else:
+                while True:
+                    yield key, scanner.value(), True
+                    if scanner.peek() == ",":
+                        scanner.pos += 1
+                        continue
+                    scanner.expect("]")
+                    break
+        else:
+            yield key, scanner.value(), False
+
+        if scanner.peek() == ",":
+            scanner.pos += 1
+            continue
+        scanner.expect("}")
+        return
+
+
+def iter_payload_batches(
+    source: Union[str, Path, TextIO],
+    batch_size: int = 500,
+    read_size: int = DEFAULT_READ_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """Re-chunk a bundle into small blobs shaped like the original payload.
+
+    Array members arrive as ``{key: [<= batch_size items]}`` and other members
+    as ``{key: value}``, so code written against whole payloads (for example
+    ``blob.get("clauses", [])``) works unchanged on each blob.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    pending_key = None
+    pending: list = []
+    for key, value, in_array in iter_members(source, read_size):
+        if pending and (key != pending_key or len(pending) >= batch_size):
+            yield {pending_key: pending}
+            pending = []
+        if in_array:
+            pending_key = key
+            pending.append(value)
+        else:
+            yield {key: value}
+    if pending:
+        yield {pending_key: pending}
+
+
+def read_member(source: Union[str, Path], key: str, read_size: int = DEFAULT_READ_SIZE) -> Any:
+    """Return one non-array top-level member, scanning only as far as needed."""
+    for found, value, in_array in iter_members(source, read_size):
+        if found == key and not in_array:
+            return value
+    raise KeyError(key)
@@ -2,39 +2,95 @@ from __future__ import annotations
 
 import json
 import os
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Iterator, Optional
 
 import typer
 from dotenv import load_dotenv
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from rich.console import Console
 from rich.table import Table
 
 from models import (
     AgentRecommendation,
     Clause,
+    Concession,
     DocVersion,
     Document,
+    Episode,
     UserDecision,
 )
+from scripts.ingest.graphiti_writer import BulkGraphWriter, LabelThroughput
+from scripts.ingest.json_stream import iter_members, iter_payload_batches
+from scripts.ingest.manifest import (
+    DEFAULT_MANIFEST,
+    FileManifest,
+    IngestRecord,
+    file_checksum,
+    manifest_key,
+    record_ingestion,
+)
+from scripts.ingest.parallel import MatterResult, WorkerSummary, run_matters, summarize_workers, worker_graph
 
 console = Console()
 app = typer.Typer(help="Load negotiation continuity artifacts into Graphiti")
 
+# Yielded by iter_matter_payloads(file_breaks=True) after each file's blobs;
+# ingest_payloads waits for the writes in flight before reading the next file
+FILE_BREAK: dict = {}
+
+PAYLOAD_MODELS: dict[str, type[BaseModel]] = {
+    "documents": Document,
+    "versions": DocVersion,
+    "clauses": Clause,
+    "recommendations": AgentRecommendation,
+    "decisions": UserDecision,
+    "concessions": Concession,
+    "episodes": Episode,
+}
+
+# One compiled validator per entity list; validating a whole list in a single
+# call is much cheaper than one model_validate per dict.
+PAYLOAD_ADAPTERS: dict[str, TypeAdapter] = {
+    key: TypeAdapter(list[model]) for key, model in PAYLOAD_MODELS.items()
+}
+
+
+@dataclass
+class ValidationIssue:
+    source: str
+    key: str
+    index: int
+    location: str
+    message: str
+
+
+class PayloadValidationError(ValueError):
+    def __init__(self, issues: list[ValidationIssue]) -> None:
+        self.issues = issues
+        first = issues[0]
+        super().__init__(
+            f"{len(issues)} validation error(s); first: {first.source} "
+            f"{first.key}[{first.index}].{first.location}: {first.message}"
+        )
+
 
 @dataclass
 class GraphitiConfig:
     host: str
     port: int
     api_key: Optional[str]
+    graph_name: str = "negotiation_continuity_graphiti"
 
     @classmethod
     def from_env(cls) -> "GraphitiConfig":
         host = os.getenv("FALKORDB_HOST", "localhost")
         port = int(os.getenv("FALKORDB_PORT", "6379"))
         api_key = os.getenv("GRAPHITI_API_KEY")
-        return cls(host=host, port=port, api_key=api_key)
+        graph_name = os.getenv("FALKORDB_GRAPH_NAME", cls.graph_name)
+        return cls(host=host, port=port, api_key=api_key, graph_name=graph_name)
 
 
 def iter_matter_dirs(root: Path, matter: Optional[str]) -> Iterator[Path]:
@@ -49,14 +105,180 @@ def iter_matter_dirs(root: Path, matter: Optional[str]) -> Iterator[Path]:
         yield path
 
 
+def bundle_version(path: Path) -> Optional[int]:
+    """``version_no`` of the first DocVersion in a bundle, or None if it has none."""
+    for key, value, in_array in iter_members(path):
+        if key == "versions" and in_array:
+            return value.get("version_no")
+    return None
+
+
+def matter_files(matter_dir: Path) -> list[Path]:
+    """JSON bundles of a matter directory in version order (v1, v2, ..., v10).
+
+    Bundles without a DocVersion come first; ties fall back to the file name
+    with its digit runs compared as numbers.
+    """
+    def natural(name: str) -> list:
+        return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", name)]
+
+    return sorted(
+        matter_dir.glob("*.json"),
+        key=lambda path: (bundle_version(path) or 0, natural(path.name)),
+    )
+
+
 def load_json_payloads(matter_dir: Path) -> list[dict]:
     payloads: list[dict] = []
-    for path in sorted(matter_dir.glob("*.json")):
+    for path in matter_files(matter_dir):
         with path.open("r", encoding="utf-8") as handle:
             payloads.append(json.load(handle))
     return payloads
 
 
+def iter_json_payloads(matter_dir: Path, batch_size: int = 500) -> Iterator[dict]:
+    """Stream a matter directory as small payload blobs.
+
+    Unlike ``load_json_payloads`` no file is ever held whole in memory: array
+    members are re-chunked into blobs of at most ``batch_size`` items.
+    """
+    for path in matter_files(matter_dir):
+        yield from iter_payload_batches(path, batch_size=batch_size)
+
+
+def validate_blob(
+    blob: dict,
+    source: str = "",
+    offsets: Optional[dict[str, int]] = None,
+) -> tuple[dict[str, list[BaseModel]], list[ValidationIssue]]:
+    """Validate every entity list in a blob with one adapter call per list.
+
+    Returns the valid models per key and an issue for every invalid item.
+    ``offsets`` carries list positions across the blobs of one streamed file
+    so reported indexes refer to the original array.
+    """
+    offsets = offsets if offsets is not None else {}
+    models: dict[str, list[BaseModel]] = {}
+    issues: list[ValidationIssue] = []
+    for key, adapter in PAYLOAD_ADAPTERS.items():
+        raws = blob.get(key)
+        if not raws:
+            continue
+        offset = offsets.get(key, 0)
+        offsets[key] = offset + len(raws)
+        try:
+            models[key] = adapter.validate_python(raws)
+            continue
+        except ValidationError as exc:
+            bad = set()
+            for error in exc.errors():
+                index, *location = error["loc"]
+                bad.add(index)
+                issues.append(ValidationIssue(
+                    source=source,
+                    key=key,
+                    index=offset + index,
+                    location=".".join(str(part) for part in location),
+                    message=error["msg"],
+                ))
+        models[key] = adapter.validate_python([raw for i, raw in enumerate(raws) if i not in bad])
+    return models, issues
+
+
+def construct_blob(blob: dict) -> dict[str, list[BaseModel]]:
+    """Build models without validation, for files the manifest already trusts."""
+    return {
+        key: [model.model_construct(**raw) for raw in blob[key]]
+        for key, model in PAYLOAD_MODELS.items()
+        if blob.get(key)
+    }
+
+
+def validate_and_count(
+    payloads: Iterable[dict],
+    summary: dict[str, int],
+    issues: Optional[list[ValidationIssue]] = None,
+    source: str = "",
+    trusted: bool = False,
+) -> Iterator[dict[str, list[BaseModel]]]:
+    """Validate and tally each blob as it passes through to the writer.
+
+    Yields blobs of validated models. Invalid items are appended to
+    ``issues`` and left out; without an ``issues`` list the first invalid
+    blob raises PayloadValidationError.
+    """
+    offsets: dict[str, int] = {}
+    for blob in payloads:
+        for key, value in summarize_payloads([blob]).items():
+            summary[key] = summary.get(key, 0) + value
+        if trusted:
+            yield construct_blob(blob)
+            continue
+        models, found = validate_blob(blob, source, offsets)
+        if found:
+            if issues is None:
+                raise PayloadValidationError(found)
+            issues.extend(found)
+        yield models
+
+
+def iter_matter_payloads(
+    matter_dir: Path,
+    batch_size: int,
+    summary: dict[str, int],
+    issues: list[ValidationIssue],
+    trusted_checksums: Optional[dict[str, str]] = None,
+    validated: Optional[dict[str, str]] = None,
+    skip: Optional[dict[str, str]] = None,
+    loaded: Optional[list[IngestRecord]] = None,
+    skipped: Optional[list[str]] = None,
+    file_breaks: bool = False,
+) -> Iterator[dict[str, list[BaseModel]]]:
+    """Stream, validate and count every file of a matter directory.
+
+    Files whose checksum appears in ``trusted_checksums`` skip validation,
+    and files whose checksum appears in ``skip`` are not read at all (their
+    keys go to ``skipped``).
+    Files that validate cleanly are recorded in ``validated`` (key ->
+    checksum) so the caller can update the manifest, and every file streamed
+    without issues is appended to ``loaded``. Files are read in version
+    order (see matter_files); with ``file_breaks`` each file's blobs are
+    followed by FILE_BREAK.
+    """
+    for path in matter_files(matter_dir):
+        key = manifest_key(path)
+        checksum = file_checksum(path)
+        if skip is not None and skip.get(key) == checksum:
+            if skipped is not None:
+                skipped.append(key)
+            continue
+        trusted = trusted_checksums is not None and trusted_checksums.get(key) == checksum
+        before = len(issues)
+        versions: set[int] = set()
+        for blob in validate_and_count(
+            iter_payload_batches(path, batch_size=batch_size),
+            summary,
+            issues,
+            source=path.name,
+            trusted=trusted,
+        ):
+            versions.update(version.version_no for version in blob.get("versions", []))
+            yield blob
+        if file_breaks:
+            yield FILE_BREAK
+        if len(issues) != before:
+            continue
+        if not trusted and validated is not None:
+            validated[key] = checksum
+        if loaded is not None:
+            loaded.append(IngestRecord(
+                key=key,
+                checksum=checksum,
+                matter_id=matter_dir.name,
+                version=versions.pop() if len(versions) == 1 else None,
+            ))
+
+
 def summarize_payloads(payloads: Iterable[dict]) -> dict[str, int]:
     summary: dict[str, int] = {
         "documents": 0,
@@ -64,6 +286,8 @@ def summarize_payloads(payloads: Iterable[dict]) -> dict[str, int]:
         "clauses": 0,
         "recommendations": 0,
         "decisions": 0,
+        "concessions": 0,
+        "episodes": 0,
     }
     for blob in payloads:
         if "documents" in blob:
@@ -76,21 +300,38 @@ def summarize_payloads(payloads: Iterable[dict]) -> dict[str, int]:
             summary["recommendations"] += len(blob["recommendations"])
         if "decisions" in blob:
             summary["decisions"] += len(blob["decisions"])
+        if "concessions" in blob:
+            summary["concessions"] += len(blob["concessions"])
+        if "episodes" in blob:
+            summary["episodes"] += len(blob["episodes"])
     return summary
 
 
-def validate_payloads(payloads: Iterable[dict]) -> None:
+def collect_validation_issues(payloads: Iterable[dict], source: str = "") -> list[ValidationIssue]:
+    issues: list[ValidationIssue] = []
+    offsets: dict[str, int] = {}
     for blob in payloads:
-        for raw in blob.get("documents", []):
-            Document.model_validate(raw)
-        for raw in blob.get("versions", []):
-            DocVersion.model_validate(raw)
-        for raw in blob.get("clauses", []):
-            Clause.model_validate(raw)
-        for raw in blob.get("recommendations", []):
-            AgentRecommendation.model_validate(raw)
-        for raw in blob.get("decisions", []):
-            UserDecision.model_validate(raw)
+        issues.extend(validate_blob(blob, source, offsets)[1])
+    return issues
+
+
+def validate_payloads(payloads: Iterable[dict]) -> None:
+    issues = collect_validation_issues(payloads)
+    if issues:
+        raise PayloadValidationError(issues)
+
+
+def render_issue_table(issues: list[ValidationIssue], limit: int = 50) -> None:
+    table = Table(title=f"Validation issues ({len(issues)})")
+    table.add_column("File")
+    table.add_column("Entity")
+    table.add_column("Field")
+    table.add_column("Error")
+    for issue in issues[:limit]:
+        table.add_row(issue.source, f"{issue.key}[{issue.index}]", issue.location, issue.message)
+    console.print(table)
+    if len(issues) > limit:
+        console.print(f"... {len(issues) - limit} more")
 
 
 def render_summary_table(matter_id: str, summary: dict[str, int]) -> None:
@@ -102,14 +343,134 @@ def render_summary_table(matter_id: str, summary: dict[str, int]) -> None:
     console.print(table)
 
 
-def ingest_payloads(payloads: Iterable[dict], config: GraphitiConfig, dry_run: bool) -> None:
+def render_throughput_table(matter_id: str, throughput: dict[str, LabelThroughput]) -> None:
+    table = Table(title=f"Matter {matter_id} write throughput")
+    table.add_column("Label")
+    table.add_column("Rows", justify="right")
+    table.add_column("Batches", justify="right")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Rows/s", justify="right")
+    for label, stats in throughput.items():
+        table.add_row(
+            label,
+            str(stats.rows),
+            str(stats.batches),
+            f"{stats.wall_seconds:.3f}",
+            f"{stats.rows_per_sec:,.0f}",
+        )
+    console.print(table)
+
+
+def connect_graph(config: GraphitiConfig):
+    return worker_graph(config.host, config.port, config.graph_name)
+
+
+def ingest_payloads(
+    payloads: Iterable[dict],
+    config: GraphitiConfig,
+    dry_run: bool,
+    batch_size: int = 500,
+    concurrency: int = 4,
+    graph=None,
+) -> dict[str, LabelThroughput]:
+    """Write payload entities through a BulkGraphWriter.
+
+    Payloads are consumed lazily, so a generator keeps at most one blob plus
+    the writer's in-flight batches in memory. A FILE_BREAK blob waits for
+    every write so far to land before the next blob is read. A dry run
+    still drains the payloads so that any validation chained onto the
+    iterator runs.
+    """
     if dry_run:
-        return
-    raise NotImplementedError(
-        "Graphiti ingestion wiring is pending dataset availability."
+        for _ in payloads:
+            pass
+        return {}
+    if graph is None:
+        graph = connect_graph(config)
+    writer = BulkGraphWriter(graph, batch_size=batch_size, concurrency=concurrency)
+    with writer:
+        for blob in payloads:
+            if blob is FILE_BREAK:
+                writer.drain()
+                continue
+            writer.add_payload(blob)
+    return writer.throughput()
+
+
+def ingest_matter_dir(
+    matter_dir: Path,
+    config: GraphitiConfig,
+    dry_run: bool,
+    batch_size: int,
+    concurrency: int,
+    trusted_checksums: Optional[dict[str, str]] = None,
+    skip: Optional[dict[str, str]] = None,
+) -> MatterResult:
+    """Validate and ingest one matter directory; runs inside a pool worker.
+
+    Files are applied in version order, and each file's writes land before
+    the next file is read, so v1 is in the graph before v2 starts. Invalid
+    entities are reported and skipped, and files listed in ``skip`` are left
+    alone. After the writes land, each cleanly loaded file gets an
+    ingestion Episode. Workers never touch the manifest: validated and
+    ingested files come back in ``detail`` for the parent to record.
+    """
+    summary = summarize_payloads([])
+    issues: list[ValidationIssue] = []
+    validated: dict[str, str] = {}
+    loaded: list[IngestRecord] = []
+    skipped: list[str] = []
+    payloads = iter_matter_payloads(
+        matter_dir, batch_size, summary, issues,
+        trusted_checksums=trusted_checksums, validated=validated,
+        skip=skip, loaded=loaded, skipped=skipped, file_breaks=True,
+    )
+    throughput = ingest_payloads(
+        payloads,
+        config,
+        dry_run=dry_run,
+        batch_size=batch_size,
+        concurrency=concurrency,
+    )
+    ingested: list[IngestRecord] = []
+    if not dry_run:
+        graph = connect_graph(config)
+        ingested = [record_ingestion(graph, record) for record in loaded]
+    return MatterResult(
+        matter=matter_dir.name,
+        files=len(list(matter_dir.glob("*.json"))) - len(skipped),
+        rows=sum(summary.values()),
+        detail={
+            "summary": summary,
+            "throughput": throughput,
+            "issues": issues,
+            "validated": validated,
+            "ingested": ingested,
+            "skipped": skipped,
+        },
     )
 
 
+def render_worker_table(summaries: list[WorkerSummary]) -> None:
+    table = Table(title="Throughput per worker")
+    table.add_column("Worker (pid)")
+    table.add_column("Matters", justify="right")
+    table.add_column("Files", justify="right")
+    table.add_column("Entities", justify="right")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Entities/s", justify="right")
+    for summary in summaries:
+        table.add_row(
+            str(summary.worker),
+            str(summary.matters),
+            str(summary.files),
+            str(summary.rows),
+            f"{summary.seconds:.3f}",
+            f"{summary.rows_per_sec:,.0f}",
+        )
+    console.print(table)
+
+
 @app.command()
 def main(
     input_dir: Path = typer.Argument(
@@ -127,21 +488,73 @@ def main(
         True,
         help="Validate and summarize without writing to Graphiti.",
     ),
+    batch_size: int = typer.Option(
+        500,
+        min=1,
+        help="Entities per streamed blob and per UNWIND write.",
+    ),
+    concurrency: int = typer.Option(
+        4,
+        min=1,
+        help="Maximum write batches in flight.",
+    ),
+    workers: int = typer.Option(
+        1,
+        min=1,
+        help="Matter directories ingested in parallel, one process each.",
+    ),
+    trusted: bool = typer.Option(
+        False,
+        help="Skip validation for files whose checksum matches the manifest.",
+    ),
+    manifest_path: Path = typer.Option(
+        DEFAULT_MANIFEST,
+        "--manifest",
+        help="JSON manifest of validated and ingested file checksums.",
+    ),
+    force: bool = typer.Option(
+        False,
+        help="Reload files even if the manifest shows them unchanged.",
+    ),
 ) -> None:
     """Validate and ingest matter payloads into Graphiti."""
     load_dotenv()
     config = GraphitiConfig.from_env()
     console.log(
-        f"Starting ingestion (dry_run={dry_run}) against {config.host}:{config.port}"
+        f"Starting ingestion (dry_run={dry_run}) against "
+        f"{config.host}:{config.port}/{config.graph_name}"
     )
+    manifest = FileManifest.load(manifest_path)
+    trusted_checksums = manifest.validated_checksums() if trusted else None
+    skip = None
+    if not dry_run and not force:
+        skip = manifest.ingested_files(config.graph_name, connect_graph(config))
+    jobs = [
+        (matter_dir, config, dry_run, batch_size, concurrency, trusted_checksums, skip)
+        for matter_dir in iter_matter_dirs(input_dir, matter)
+    ]
+    results = run_matters(ingest_matter_dir, jobs, workers)
 
-    for matter_dir in iter_matter_dirs(input_dir, matter):
-        payloads = load_json_payloads(matter_dir)
-        validate_payloads(payloads)
-        summary = summarize_payloads(payloads)
-        render_summary_table(matter_dir.name, summary)
-        ingest_payloads(payloads, config, dry_run=dry_run)
+    issues: list[ValidationIssue] = []
+    for result in results:
+        render_summary_table(result.matter, result.detail["summary"])
+        if result.detail["throughput"]:
+            render_throughput_table(result.matter, result.detail["throughput"])
+        issues.extend(result.detail["issues"])
+        for key, checksum in result.detail["validated"].items():
+            manifest.mark_validated(key, checksum)
+        for record in result.detail["ingested"]:
+            manifest.mark_ingested(record, config.graph_name)
+        if result.detail["skipped"]:
+            console.log(f"{result.matter}: skipped {len(result.detail['skipped'])} unchanged file(s)")
+    if workers > 1:
+        render_worker_table(summarize_workers(results))
+    manifest.save()
 
+    if issues:
+        render_issue_table(issues)
+        console.log("Ingestion run finished with validation errors")
+        raise typer.Exit(code=1)
     console.log("Ingestion run complete")
 
 
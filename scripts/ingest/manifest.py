@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from models import Episode
+
+DEFAULT_MANIFEST = Path("data/manifests/ingest_manifest.json")
+TOOL_VERSION = "ingest-manifest/1"
+
+EPISODE_QUERY = """
+MERGE (e:Episode {episode_id: $episode_id})
+SET e += $props
+"""
+
+EPISODE_CHECKSUMS_QUERY = """
+MATCH (e:Episode {episode_type: 'ingestion_event'})
+RETURN e.checksum
+"""
+
+
+def file_checksum(path: Path, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def manifest_key(path: Path) -> str:
+    """Key files by resolved path so relative and absolute arguments agree."""
+    return path.resolve().as_posix()
+
+
+def utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass
+class IngestRecord:
+    """One file written to a graph, as reported back by an ingestion worker."""
+
+    key: str
+    checksum: str
+    matter_id: Optional[str] = None
+    version: Optional[int] = None
+    reference_time: Optional[str] = None
+    ingested_at: Optional[str] = None
+
+
+def ingestion_episode(record: IngestRecord) -> Episode:
+    """Episode(ingestion_event) describing a file load.
+
+    The id is derived from the checksum, so loading identical content again
+    MERGEs onto the same episode and only refreshes ``ingestion_time``.
+    """
+    now = datetime.now(timezone.utc)
+    return Episode(
+        episode_id=f"ingestion:{record.checksum}",
+        episode_type="ingestion_event",
+        reference_time=record.reference_time or now,
+        ingestion_time=now,
+        tool_version=TOOL_VERSION,
+        checksum=record.checksum,
+        metadata={"file": record.key, "matter_id": record.matter_id, "version": record.version},
+    )
+
+
+def record_ingestion(graph, record: IngestRecord) -> IngestRecord:
+    """Write the ingestion episode for ``record`` and stamp its ingest time.
+
+    Also bumps the graph's write epoch, which invalidates cached query
+    results read before this file was loaded.
+    """
+    from graphdb.epoch import bump_epoch
+    from scripts.ingest.graphiti_writer import to_properties
+
+    episode = ingestion_episode(record)
+    graph.query(EPISODE_QUERY, params={"episode_id": episode.episode_id, "props": to_properties(episode)})
+    bump_epoch(graph)
+    record.ingested_at = episode.ingestion_time.isoformat()
+    return record
+
+
+def graph_checksums(graph) -> Set[str]:
+    """Checksums of every file the graph itself has an ingestion episode for."""
+    result = graph.query(EPISODE_CHECKSUMS_QUERY)
+    return {row[0] for row in result.result_set if row[0]}
+
+
+@dataclass
+class ManifestEntry:
+    checksum: str
+    matter_id: Optional[str] = None
+    version: Optional[int] = None
+    validated_at: Optional[str] = None
+    # graph name -> ingest timestamp (matches Episode.ingestion_time)
+    ingested: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class FileManifest:
+    """Persistent per-file record of checksums, stored as JSON.
+
+    A file is only trusted while its current checksum equals the recorded
+    one, so edits are always picked up.
+    """
+
+    path: Path
+    entries: Dict[str, ManifestEntry]
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_MANIFEST) -> "FileManifest":
+        if not path.exists():
+            return cls(path=path, entries={})
+        with path.open("r", encoding="utf-8") as handle:
+            raw = json.load(handle)
+        entries = {key: ManifestEntry(**value) for key, value in raw.get("files", {}).items()}
+        return cls(path=path, entries=entries)
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"files": {key: asdict(entry) for key, entry in sorted(self.entries.items())}}
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with tmp.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2)
+        tmp.replace(self.path)
+
+    def validated_checksums(self) -> Dict[str, str]:
+        return {
+            key: entry.checksum
+            for key, entry in self.entries.items()
+            if entry.validated_at is not None
+        }
+
+    def _entry(self, key: str, checksum: str) -> ManifestEntry:
+        entry = self.entries.get(key)
+        if entry is None or entry.checksum != checksum:
+            entry = ManifestEntry(checksum=checksum)
+            self.entries[key] = entry
+        return entry
+
+    def mark_validated(self, key: str, checksum: str) -> None:
+        self._entry(key, checksum).validated_at = utc_now()
+
+    def mark_ingested(self, record: IngestRecord, graph_name: str) -> None:
+        entry = self._entry(record.key, record.checksum)
+        entry.matter_id = record.matter_id
+        entry.version = record.version
+        entry.ingested[graph_name] = record.ingested_at or utc_now()
+
+    def ingested_files(self, graph_name: str, graph=None) -> Dict[str, str]:
+        """Files (key -> checksum) already loaded into ``graph_name``.
+
+        A file is unchanged while its current checksum equals the one listed
+        here. When a graph handle is given, only files whose ingestion
+        episode is still in the graph count, so a wiped graph is reloaded
+        even though the manifest remembers the files.
+        """
+        files = {
+            key: entry.checksum
+            for key, entry in self.entries.items()
+            if graph_name in entry.ingested
+        }
+        if graph is not None:
+            present = graph_checksums(graph)
+            files = {key: checksum for key, checksum in files.items() if checksum in present}
+        return files
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+# One FalkorDB graph handle per (host, port, graph) and per process. Module
+# state is not shared between pool workers, so every worker opens its own
+# connection the first time it asks for one.
+_graphs: Dict[Tuple[str, int, str], Any] = {}
+
+
+def worker_graph(host: str, port: int, graph_name: str):
+    key = (host, port, graph_name)
+    if key not in _graphs:
+        from falkordb import FalkorDB
+
+        _graphs[key] = FalkorDB(host=host, port=port).select_graph(graph_name)
+    return _graphs[key]
+
+
+@dataclass
+class MatterResult:
+    """Outcome of ingesting one matter (all of its versions) in a worker."""
+
+    matter: str
+    files: int = 0
+    rows: int = 0
+    seconds: float = 0.0
+    worker: int = field(default_factory=os.getpid)
+    detail: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class WorkerSummary:
+    worker: int
+    matters: int = 0
+    files: int = 0
+    rows: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+def timed(task: Callable[..., MatterResult], *args: Any) -> MatterResult:
+    """Run a worker task and stamp its wall time and worker pid."""
+    start = time.perf_counter()
+    result = task(*args)
+    result.seconds = time.perf_counter() - start
+    result.worker = os.getpid()
+    return result
+
+
+def run_matters(
+    task: Callable[..., MatterResult],
+    jobs: Iterable[Tuple[Any, ...]],
+    workers: int,
+) -> List[MatterResult]:
+    """Fan independent matter jobs out over a process pool.
+
+    ``task`` must be a module-level function (it is pickled). Each job is the
+    argument tuple for one matter; the versions of a matter stay inside one
+    job so they are applied in order. With ``workers == 1`` the jobs run
+    in-process, which keeps tracebacks and debuggers simple.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    jobs = list(jobs)
+    if workers == 1:
+        return [timed(task, *job) for job in jobs]
+
+    results: List[MatterResult] = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs) or 1)) as pool:
+        futures = [pool.submit(timed, task, *job) for job in jobs]
+        for future in as_completed(futures):
+            results.append(future.result())
+    return sorted(results, key=lambda result: result.matter)
+
+
+def summarize_workers(results: Iterable[MatterResult]) -> List[WorkerSummary]:
+    summaries: Dict[int, WorkerSummary] = defaultdict(lambda: WorkerSummary(worker=0))
+    for result in results:
+        summary = summaries[result.worker]
+        summary.worker = result.worker
+        summary.matters += 1
+        summary.files += result.files
+        summary.rows += result.rows
+        summary.seconds += result.seconds
+    return sorted(summaries.values(), key=lambda summary: summary.worker)
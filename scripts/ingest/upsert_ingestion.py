@@ -0,0 +1,333 @@
+"""
+Idempotent MERGE-based ingestion keyed on canonical IDs.
+
+Every node written here carries a ``canonical_id`` and a ``content_hash``.
+Re-ingesting a file costs one hash lookup per entity type: rows whose hash
+matches are skipped without a write, changed rows only SET the properties
+that differ, and new rows are MERGEd together with their parent
+relationship. Updates re-MERGE the parent relationship too and drop the
+edge from any previous parent; the parent key is part of the content hash,
+so a row whose parent moved is never skipped.
+
+Key derivation:
+    Clause          canonical_clause_id(matter version, clause_number)
+    Matter          matter_id + version
+    Party           matter_id + version + role
+    Recommendation  matter_id + version + recommendation_id
+    Decision        matter_id + version + decision_id
+    Concession      matter_id + version + concession_id
+
+Keys deliberately leave out editable content (clause text, timestamps,
+actors) so that an edited row updates in place instead of creating a
+second node.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from falkordb import FalkorDB
+
+from graphdb import QueryRunner
+from models import canonical_clause_id
+
+from .basic_ingestion import (
+    BATCH_QUERIES,
+    build_batch_rows,
+    iter_chunks,
+    iter_ready_chunks,
+    stream_batch_rows,
+)
+from .json_stream import read_member
+
+UPSERT_CHUNK_SIZE = 500
+
+# Parent label and relationship type for labels that hang off another node
+PARENTS: Dict[str, tuple] = {
+    "Recommendation": ("Clause", "HAS_RECOMMENDATION"),
+    "Decision": ("Recommendation", "HAS_DECISION"),
+    "Concession": ("Decision", "RESULTED_IN_CONCESSION"),
+}
+
+LOOKUP_QUERIES: Dict[str, str] = {
+    label: f"""
+    UNWIND $keys AS key
+    MATCH (n:{label} {{canonical_id: key}})
+    RETURN n.canonical_id, n.content_hash
+    """
+    for label in BATCH_QUERIES
+}
+
+PROPERTIES_QUERIES: Dict[str, str] = {
+    label: f"""
+    UNWIND $keys AS key
+    MATCH (n:{label} {{canonical_id: key}})
+    RETURN n.canonical_id, properties(n)
+    """
+    for label in BATCH_QUERIES
+}
+
+
+def _parent_edge(label: str) -> str:
+    if label not in PARENTS:
+        return ""
+    parent_label, rel_type = PARENTS[label]
+    return f"""
+    WITH n, row
+    MATCH (p:{parent_label} {{canonical_id: row.parent_key}})
+    MERGE (p)-[:{rel_type}]->(n)
+    """
+
+
+def _update_query(label: str) -> str:
+    query = f"""
+    UNWIND $rows AS row
+    MATCH (n:{label} {{canonical_id: row.canonical_id}})
+    SET n += row.changes
+    """ + _parent_edge(label)
+    if label in PARENTS:
+        parent_label, rel_type = PARENTS[label]
+        query += f"""
+    WITH n, p
+    MATCH (old:{parent_label})-[stale:{rel_type}]->(n)
+    WHERE ID(old) <> ID(p)
+    DELETE stale
+    """
+    return query
+
+
+UPDATE_QUERIES: Dict[str, str] = {label: _update_query(label) for label in BATCH_QUERIES}
+
+
+def _insert_query(label: str) -> str:
+    return f"""
+    UNWIND $rows AS row
+    MERGE (n:{label} {{canonical_id: row.canonical_id}})
+    ON CREATE SET n += row.props
+    """ + _parent_edge(label)
+
+
+INSERT_QUERIES: Dict[str, str] = {label: _insert_query(label) for label in BATCH_QUERIES}
+
+
+def content_hash(props: Dict[str, Any]) -> str:
+    """Stable hash of a node's stored properties"""
+    encoded = json.dumps(props, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def upsert_row(key: str, props: Dict[str, Any], parent: Optional[str]) -> Dict[str, Any]:
+    """One ``{canonical_id, content_hash, props, parent_key}`` row"""
+    digest = content_hash({**props, "parent_key": parent})
+    return {
+        "canonical_id": key,
+        "content_hash": digest,
+        "props": {**props, "canonical_id": key, "content_hash": digest},
+        "parent_key": parent,
+    }
+
+
+def keyed_upsert_rows(labelled_rows: Iterable[Tuple[str, Dict[str, Any]]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Turn ``(label, props)`` pairs into ``(label, upsert row)`` pairs.
+
+    ``props`` are exactly the properties the CREATE paths store. Only the
+    source id -> canonical key maps of parent entities are kept, so rows can
+    come straight from stream_batch_rows. The Matter row must come first.
+    """
+    version_key = None
+    clause_keys: Dict[str, str] = {}
+    rec_keys: Dict[str, str] = {}
+    dec_keys: Dict[str, str] = {}
+
+    for label, props in labelled_rows:
+        parent = None
+        if label == "Matter":
+            version_key = f"{props['matter_id']}:v{props['version']}"
+            key = version_key
+        elif version_key is None:
+            raise ValueError(f"{label} row arrived before the Matter row")
+        elif label == "Party":
+            key = f"{version_key}:{props['role']}"
+        elif label == "Clause":
+            key = canonical_clause_id(version_key, props["clause_number"], None, None, None)
+            clause_keys[props["clause_id"]] = key
+        elif label == "Recommendation":
+            parent = clause_keys.get(props["clause_id"])
+            key = f"{version_key}:{props['recommendation_id']}"
+            rec_keys[props["recommendation_id"]] = key
+        elif label == "Decision":
+            parent = rec_keys.get(props["recommendation_id"])
+            key = f"{version_key}:{props['decision_id']}"
+            dec_keys[props["decision_id"]] = key
+        else:
+            parent = dec_keys.get(props["decision_id"])
+            key = f"{version_key}:{props['concession_id']}"
+        yield label, upsert_row(key, props, parent)
+
+
+def build_upsert_rows(data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Build rows of ``{canonical_id, content_hash, props, parent_key}`` per label
+    from an already parsed matter payload.
+    """
+    rows: Dict[str, List[Dict[str, Any]]] = {label: [] for label in BATCH_QUERIES}
+    labelled = ((label, props) for label, label_rows in build_batch_rows(data).items() for props in label_rows)
+    for label, row in keyed_upsert_rows(labelled):
+        rows[label].append(row)
+    return rows
+
+
+def _lookup(graph, query: str, keys: List[str], chunk_size: int) -> Dict[str, Any]:
+    found: Dict[str, Any] = {}
+    for chunk in iter_chunks(keys, chunk_size):
+        result = graph.query(query, params={"keys": chunk})
+        for key, value in result.result_set:
+            found[key] = value
+    return found
+
+
+def upsert_chunk(graph, label: str, rows: List[Dict[str, Any]]) -> Tuple[int, int]:
+    """
+    Upsert one chunk of a label's rows.
+
+    Returns:
+        (inserted, updated) row counts; the rest of the chunk was unchanged
+    """
+    chunk_size = max(len(rows), 1)
+    existing = _lookup(graph, LOOKUP_QUERIES[label], [row["canonical_id"] for row in rows], chunk_size)
+    new_rows = [row for row in rows if row["canonical_id"] not in existing]
+    changed_rows = [
+        row for row in rows
+        if row["canonical_id"] in existing and existing[row["canonical_id"]] != row["content_hash"]
+    ]
+
+    if changed_rows:
+        current = _lookup(graph, PROPERTIES_QUERIES[label],
+                          [row["canonical_id"] for row in changed_rows], chunk_size)
+        updates = []
+        for row in changed_rows:
+            stored = current.get(row["canonical_id"]) or {}
+            changes = {
+                key: value for key, value in row["props"].items()
+                if stored.get(key) != value
+            }
+            updates.append({"canonical_id": row["canonical_id"], "changes": changes,
+                            "parent_key": row["parent_key"]})
+        graph.query(UPDATE_QUERIES[label], params={"rows": updates})
+
+    if new_rows:
+        inserts = [
+            {"canonical_id": row["canonical_id"], "props": row["props"], "parent_key": row["parent_key"]}
+            for row in new_rows
+        ]
+        graph.query(INSERT_QUERIES[label], params={"rows": inserts})
+
+    return len(new_rows), len(changed_rows)
+
+
+def upsert_row_stream(graph, labelled_rows: Iterable[Tuple[str, Dict[str, Any]]],
+                      chunk_size: int = UPSERT_CHUNK_SIZE) -> Dict[str, Dict[str, float]]:
+    """
+    Upsert a stream of ``(label, props)`` pairs, one chunk at a time.
+
+    Chunks are formed by iter_ready_chunks, so every parent is written
+    before the children that MERGE a relationship to it.
+
+    Returns:
+        Per-label counts: rows, inserted, updated, unchanged, seconds
+    """
+    stats = {
+        label: {"rows": 0, "inserted": 0, "updated": 0, "unchanged": 0, "seconds": 0.0}
+        for label in BATCH_QUERIES
+    }
+
+    for label, chunk in iter_ready_chunks(keyed_upsert_rows(labelled_rows), chunk_size):
+        start = time.perf_counter()
+        inserted, updated = upsert_chunk(graph, label, chunk)
+        entry = stats[label]
+        entry["seconds"] += time.perf_counter() - start
+        entry["rows"] += len(chunk)
+        entry["inserted"] += inserted
+        entry["updated"] += updated
+        entry["unchanged"] += len(chunk) - inserted - updated
+
+    return stats
+
+
+def upsert_rows(graph, rows_by_label: Dict[str, List[Dict[str, Any]]],
+                chunk_size: int = UPSERT_CHUNK_SIZE) -> Dict[str, Dict[str, float]]:
+    """
+    Apply prepared upsert rows label by label in dependency order.
+
+    Returns:
+        Per-label counts: rows, inserted, updated, unchanged, seconds
+    """
+    stats: Dict[str, Dict[str, float]] = {}
+
+    for label in BATCH_QUERIES:
+        rows = rows_by_label.get(label, [])
+        entry = {"rows": len(rows), "inserted": 0, "updated": 0, "unchanged": 0, "seconds": 0.0}
+        start = time.perf_counter()
+        for chunk in iter_chunks(rows, chunk_size):
+            inserted, updated = upsert_chunk(graph, label, chunk)
+            entry["inserted"] += inserted
+            entry["updated"] += updated
+        entry["unchanged"] = len(rows) - entry["inserted"] - entry["updated"]
+        entry["seconds"] = time.perf_counter() - start
+        stats[label] = entry
+
+    return stats
+
+
+def print_upsert_stats(stats: Dict[str, Dict[str, float]]):
+    """Print per-entity insert/update/skip counts"""
+    print(f"\n   {'Entity':<16}{'Rows':>8}{'New':>8}{'Changed':>9}{'Skipped':>9}{'Seconds':>10}")
+    for label, row in stats.items():
+        print(f"   {label:<16}{row['rows']:>8}{row['inserted']:>8}{row['updated']:>9}"
+              f"{row['unchanged']:>9}{row['seconds']:>10.3f}")
+
+
+def upsert_matter(graph, data: Dict[str, Any],
+                  chunk_size: Optional[int] = None) -> Dict[str, Dict[str, float]]:
+    """Upsert one matter payload (already parsed JSON) into ``graph``"""
+    return upsert_rows(graph, build_upsert_rows(data), chunk_size or UPSERT_CHUNK_SIZE)
+
+
+def upsert_matter_file(graph, matter_file: Path,
+                       chunk_size: Optional[int] = None) -> Dict[str, Dict[str, float]]:
+    """Upsert one matter file into ``graph`` without loading it whole"""
+    return upsert_row_stream(graph, stream_batch_rows(matter_file), chunk_size or UPSERT_CHUNK_SIZE)
+
+
+def ingest_matter_upsert(matter_file: Path, graph_name: str = "negotiation_continuity",
+                         chunk_size: int = UPSERT_CHUNK_SIZE) -> Dict[str, Dict[str, float]]:
+    """
+    Upsert a single matter JSON file; safe to re-run on the same file.
+
+    The file is streamed, so only the chunks being assembled are in memory.
+
+    Args:
+        matter_file: Path to JSON file
+        graph_name: Name of the graph database
+        chunk_size: Maximum rows per UNWIND statement
+    """
+    print(f"📄 Streaming {matter_file.name}...")
+    matter_id = read_member(matter_file, "matter_id")
+    version = read_member(matter_file, "version")
+
+    print(f"   Matter: {matter_id} v{version}")
+
+    print(f"\n🔌 Connecting to FalkorDB...")
+    db = FalkorDB(host='localhost', port=6379)
+    graph = QueryRunner(db.select_graph(graph_name))
+    print(f"   Graph: {graph_name}")
+
+    print(f"\n🔁 Upserting by canonical id...")
+    stats = upsert_matter_file(graph, matter_file, chunk_size)
+    print_upsert_stats(stats)
+
+    print(f"\n✅ Upsert complete for {matter_id} v{version}!")
+    return stats
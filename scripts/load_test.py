@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Load test for the Negotiation Continuity graph
+
+Replays a weighted mix of natural-language example questions and KPI #5
+queries from K concurrent clients (one connection each) and reports
+throughput, tail latency and error rate per concurrency level.
+
+Usage:
+    python scripts/load_test.py
+    python scripts/load_test.py --levels 1 10 50 --duration 30
+    python scripts/load_test.py --graph negotiation_continuity --nl-share 0.5 --requests 200
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from analytics.load_test import (
+    DEFAULT_CHART,
+    DEFAULT_LEVELS,
+    DEFAULT_REPORT,
+    LevelResult,
+    build_mix,
+    run_load_test,
+    write_chart,
+    write_report,
+)
+from scripts.measure_kpis import runnable_kpi5_queries
+from scripts.nl_query import NaturalLanguageQueryInterface
+
+
+def client_factory(graph_name: str, host: str, port: int, nl_cache_size: int = 0):
+    """Each simulated user gets its own interface, and with it its own connection.
+
+    The NL result cache is off by default so every question reaches FalkorDB.
+    ``close`` releases the interface's event-loop thread and connection pools.
+    """
+    def connect():
+        nl = NaturalLanguageQueryInterface(graph_name, host=host, port=port,
+                                           cache_size=nl_cache_size, max_connections=1)
+        return SimpleNamespace(nl=nl, graph=nl.graph, close=nl.close)
+    return connect
+
+
+def print_level(result: LevelResult):
+    print(f"  • {result.concurrency:>4} clients: {result.throughput_rps:8.1f} req/s  "
+          f"p50 {result.latency.p50_ms:8.2f}ms  p95 {result.latency.p95_ms:8.2f}ms  "
+          f"p99 {result.latency.p99_ms:8.2f}ms  errors {result.error_rate*100:5.1f}%")
+    for message, count in result.top_errors:
+        print(f"      ⚠️  {count}× {message}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent load test for NL and KPI queries")
+    parser.add_argument("--graph", default="negotiation_continuity", help="Graph to load")
+    parser.add_argument("--host", default="localhost", help="FalkorDB host")
+    parser.add_argument("--port", type=int, default=6379, help="FalkorDB port")
+    parser.add_argument("--levels", type=int, nargs="+", default=list(DEFAULT_LEVELS),
+                        help="Concurrent client counts to run, in order")
+    parser.add_argument("--duration", type=float, default=10.0,
+                        help="Seconds per concurrency level (ignored with --requests)")
+    parser.add_argument("--requests", type=int,
+                        help="Requests per client per level instead of a fixed duration")
+    parser.add_argument("--nl-share", type=float, default=0.7,
+                        help="Fraction of requests that are natural-language questions")
+    parser.add_argument("--nl-cache-size", type=int, default=0,
+                        help="Result cache entries per simulated client (default: 0, no cache)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the operation mix")
+    parser.add_argument("--output", type=Path, default=DEFAULT_REPORT, help="JSON report path")
+    parser.add_argument("--chart", type=Path, default=DEFAULT_CHART, help="Plotly HTML chart path")
+    args = parser.parse_args()
+
+    print("="*80)
+    print("NEGOTIATION CONTINUITY - LOAD TEST")
+    print("="*80)
+
+    factory = client_factory(args.graph, args.host, args.port, args.nl_cache_size)
+    probe = factory()
+    try:
+        questions = probe.nl._get_example_questions()
+        # KPI #5 queries whose full-text index is missing run their CONTAINS scan
+        operations = build_mix(questions, runnable_kpi5_queries(probe.graph), nl_share=args.nl_share)
+    finally:
+        probe.close()
+    duration = None if args.requests else args.duration
+
+    print(f"\n🔁 {len(operations)} operations ({args.nl_share*100:.0f}% NL) against '{args.graph}'")
+    print(f"   Levels: {args.levels}, "
+          f"{f'{args.requests} requests/client' if args.requests else f'{duration:.0f}s each'}\n")
+
+    results = run_load_test(factory, operations, args.levels, duration=duration,
+                            requests_per_client=args.requests, seed=args.seed, on_level=print_level)
+
+    write_report(results, operations, args.output, graph=args.graph, duration=duration,
+                 requests_per_client=args.requests, nl_share=args.nl_share, seed=args.seed)
+    print(f"\n💾 Report saved to: {args.output}")
+    try:
+        write_chart(results, args.chart)
+        print(f"📈 Chart saved to: {args.chart}")
+    except ImportError:
+        print("⚠️  plotly not installed; skipped chart")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Keyset pagination for natural language query patterns
+
+A paged pattern orders its rows by a tuple of key expressions that is unique
+per row and returns those keys as trailing columns. The next page asks for
+rows whose keys sort after the last row shown, so FalkorDB never builds or
+ships more than one page (plus one row, to know whether another page exists)
+whatever the size of the graph. The continuation token handed back to the
+caller is that last key tuple, encoded with the question's intent and
+parameters so it cannot be replayed against a different question.
+"""
+
+import base64
+import binascii
+import json
+import re
+import textwrap
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 500
+
+AFTER_PARAMETER = re.compile(r"\$after_(\d+)")
+
+
+def node_key(variable: str) -> str:
+    """Internal id of an OPTIONAL MATCH variable, -1 when it did not match."""
+    return f"CASE WHEN {variable} IS NULL THEN -1 ELSE ID({variable}) END"
+
+
+def keyset_query(match: str, columns: Sequence[Tuple[str, str]], keys: Sequence[str],
+                 distinct: bool = False) -> str:
+    """Paged query: ``match`` projected to ``columns`` (expression, alias), ordered by ``keys``.
+
+    Keys must never be null (wrap optional values in ``coalesce``) and must
+    be unique per row together. Parameters: ``$after_0`` ... (null on the
+    first page) and ``$limit``.
+    """
+    projections = [f"{expression} AS {alias}" for expression, alias in columns]
+    projections += [f"{key} AS _k{i}" for i, key in enumerate(keys)]
+
+    predicate = f"_k{len(keys) - 1} > $after_{len(keys) - 1}"
+    for i in reversed(range(len(keys) - 1)):
+        predicate = f"_k{i} > $after_{i} OR (_k{i} = $after_{i} AND ({predicate}))"
+
+    key_aliases = ", ".join(f"_k{i}" for i in range(len(keys)))
+    return "\n".join([
+        textwrap.dedent(match).strip(),
+        f"WITH {'DISTINCT ' if distinct else ''}{', '.join(projections)}",
+        f"WHERE $after_0 IS NULL OR {predicate}",
+        f"RETURN {', '.join(alias for _, alias in columns)}, {key_aliases}",
+        f"ORDER BY {key_aliases}",
+        "LIMIT $limit",
+    ])
+
+
+def keyset_key_count(cypher: str) -> int:
+    """Number of keyset keys in a query built by ``keyset_query`` (0 for other queries)."""
+    return len(set(AFTER_PARAMETER.findall(cypher)))
+
+
+@dataclass
+class Cursor:
+    """Position after the last row of a page."""
+
+    offset: int
+    after: Optional[List[Any]] = None
+
+    def query_params(self, key_count: int, page_size: int) -> Dict[str, Any]:
+        after = self.after or [None] * key_count
+        params: Dict[str, Any] = {f"after_{i}": value for i, value in enumerate(after)}
+        params["limit"] = page_size + 1
+        return params
+
+
+def encode_token(intent: str, params: Optional[Dict[str, Any]], cursor: Cursor) -> str:
+    payload = json.dumps(
+        {"intent": intent, "params": params or {}, "offset": cursor.offset, "after": cursor.after},
+        sort_keys=True, separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_token(token: Optional[str], intent: str, params: Optional[Dict[str, Any]]) -> Cursor:
+    """Cursor for ``token``, or the first page when there is none.
+
+    Raises ValueError for a malformed token or one issued for another question.
+    """
+    if not token:
+        return Cursor(offset=0)
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        cursor = Cursor(offset=int(payload["offset"]), after=list(payload["after"]))
+    except (binascii.Error, ValueError, KeyError, TypeError, UnicodeError) as exc:
+        raise ValueError("malformed continuation token") from exc
+    if payload.get("intent") != intent or payload.get("params") != (params or {}):
+        raise ValueError("continuation token belongs to a different question")
+    return cursor
+
+
+@dataclass
+class Page:
+    """One page of rows from a keyset query, with the key columns split off."""
+
+    rows: List[Sequence[Any]]
+    key_count: int
+    page_size: int
+    cursor: Cursor
+
+    @property
+    def has_more(self) -> bool:
+        return len(self.rows) > self.page_size
+
+    @property
+    def count(self) -> int:
+        return min(len(self.rows), self.page_size)
+
+    def __iter__(self) -> Iterator[Sequence[Any]]:
+        for row in self.rows[:self.page_size]:
+            yield row[:len(row) - self.key_count]
+
+    def next_cursor(self) -> Optional[Cursor]:
+        if not self.has_more:
+            return None
+        last = self.rows[self.page_size - 1]
+        return Cursor(offset=self.cursor.offset + self.page_size, after=list(last[len(last) - self.key_count:]))
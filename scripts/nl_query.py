@@ -8,16 +8,65 @@ Usage:
     python scripts/nl_query.py "Show me all concessions"
     python scripts/nl_query.py "What did we agree to in round 2?"
     python scripts/nl_query.py "Find liability clauses"
+    python scripts/nl_query.py --read-model "Show unfavorable terms"
 
 Interactive mode:
     python scripts/nl_query.py
+
+Results are cached in memory per intent and parameters until ingestion
+bumps the graph's write epoch (see graphdb.epoch); type 'cache' in
+interactive mode for hit/miss counters.
+
+With read_model=True (or --read-model), questions are answered from an
+in-process copy of the graph (analytics.read_model) that is reloaded when
+the write epoch changes, instead of a FalkorDB round trip per question.
+
+Clause search seeds from the Clause full-text index; on a graph that was
+never bootstrapped (scripts/bootstrap_schema.py) it scans clauses with
+CONTAINS instead.
+
+Overview, statistics and decision distribution questions read the summary
+views ingestion maintains (graphdb.summary) rather than aggregating the
+graph. A graph loaded before those views existed is aggregated instead
+until scripts/bootstrap_schema.py --rebuild-summaries builds them.
 """
 
 import sys
 import re
-from typing import Dict, List, Tuple, Optional, Any
+import asyncio
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple, Optional, Any
 from falkordb import FalkorDB
 
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from graphdb import (
+    AsyncQueryRunner,
+    BackgroundLoop,
+    GraphEpoch,
+    QueryRunner,
+    ResultCache,
+    cache_key,
+    connect_async_graph,
+    existing_indexes,
+    graph_summary,
+)
+from scripts.nl_paging import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    Page,
+    decode_token,
+    encode_token,
+    keyset_key_count,
+    keyset_query,
+    node_key,
+)
+from scripts.nl_router import ACTOR_NAME, QuestionRouter
+from analytics.clause_index import fulltext_query
+from analytics.read_model import NL_INTENTS, ReadReplica
+
 
 class NaturalLanguageQueryInterface:
     """
@@ -27,12 +76,47 @@ class NaturalLanguageQueryInterface:
     For production use, could be enhanced with LLM-based query generation.
     """
 
-    def __init__(self, graph_name: str = "negotiation_continuity"):
-        self.db = FalkorDB(host='localhost', port=6379)
-        self.graph = self.db.select_graph(graph_name)
+    def __init__(self, graph_name: str = "negotiation_continuity",
+                 host: str = "localhost", port: int = 6379,
+                 cache_size: int = 256, cache_ttl: Optional[float] = 300.0,
+                 max_connections: int = 8, max_in_flight: Optional[int] = None,
+                 query_timeout_ms: Optional[int] = 30000, read_model: bool = False):
+        # Synchronous handle for ad-hoc Cypher (load test, plan profiler)
+        self.db = FalkorDB(host=host, port=port)
+        self.graph = QueryRunner(self.db.select_graph(graph_name))
+
+        # Questions run on a pooled asyncio connection, at most max_in_flight at
+        # a time, each bounded by query_timeout_ms. The sync API submits them to
+        # a background event loop, so one instance can serve many sessions.
+        self.async_graph = AsyncQueryRunner(
+            connect_async_graph(host, port, graph_name, max_connections),
+            max_in_flight=max_in_flight or max_connections,
+            timeout_ms=query_timeout_ms,
+        )
+        self._loop = BackgroundLoop()
+
+        # Result cache; entries are dropped when ingestion bumps the write epoch.
+        # cache_size=0 sends every question to FalkorDB.
+        self.cache = ResultCache(max_entries=cache_size, ttl_seconds=cache_ttl)
+        self.epoch = GraphEpoch(self.async_graph)
+
+        # Labels known to have a full-text index; a missing one is looked up
+        # again on every question that needs it, until bootstrap creates it
+        self._fulltext_labels: set = set()
+        self._has_summaries = False
 
         # Define query patterns and their Cypher translations
         self.query_patterns = self._build_query_patterns()
+        self.router = QuestionRouter(self.query_patterns)
+
+        # Optional in-process read model; loading it reads the whole graph once
+        # per write epoch, so it suits graphs that fit comfortably in memory.
+        self.replica: Optional[ReadReplica] = None
+        if read_model:
+            self.replica = ReadReplica(self.graph, {
+                pattern.get("cypher") or pattern["cypher_template"]: NL_INTENTS[pattern["intent"]]
+                for pattern in self.query_patterns
+            }, epoch=GraphEpoch(self.graph))
 
     def _build_query_patterns(self) -> List[Dict[str, Any]]:
         """Build list of query patterns with regex matching and Cypher templates"""
@@ -48,19 +132,21 @@ class NaturalLanguageQueryInterface:
                     r"all concession",
                     r"get.*concession"
                 ],
+                "intent": "concessions",
                 "description": "Find all concessions made during negotiations",
-                "cypher": """
-                    MATCH (d:Decision)-[:RESULTED_IN_CONCESSION]->(con:Concession)
-                    RETURN DISTINCT con.concession_id,
-                           con.matter_id as matter,
-                           con.clause_id as clause_id,
-                           d.actor as who_made_it,
-                           con.description as what_happened,
-                           con.impact as impact_level,
-                           con.rationale as why,
-                           d.timestamp as when
-                    ORDER BY when
-                """,
+                "cypher": keyset_query(
+                    "MATCH (d:Decision)-[:RESULTED_IN_CONCESSION]->(con:Concession)",
+                    [("con.concession_id", "concession_id"),
+                     ("con.matter_id", "matter"),
+                     ("con.clause_id", "clause_id"),
+                     ("d.actor", "who_made_it"),
+                     ("con.description", "what_happened"),
+                     ("con.impact", "impact_level"),
+                     ("con.rationale", "why"),
+                     ("d.timestamp", "when")],
+                    ["coalesce(d.timestamp, '')", "ID(con)", "ID(d)"],
+                    distinct=True,
+                ),
                 "formatter": self._format_concessions
             },
 
@@ -71,22 +157,25 @@ class NaturalLanguageQueryInterface:
                     r"show.*(?:round|version)\s*(\d+)",
                     r"(?:round|version)\s*(\d+).*(?:decision|change)",
                 ],
+                "intent": "round_decisions",
                 "description": "Show decisions made in a specific round/version",
-                "cypher_template": """
-                    MATCH (m:Matter {{version: {version}}})
-                    MATCH (c:Clause {{matter_id: m.matter_id, version: {version}}})
+                "cypher_template": keyset_query(
+                    """
+                    MATCH (m:Matter {version: $version})
+                    MATCH (c:Clause {matter_id: m.matter_id, version: $version})
                     OPTIONAL MATCH (c)-[:HAS_RECOMMENDATION]->(r:Recommendation)
                     OPTIONAL MATCH (r)-[:HAS_DECISION]->(d:Decision)
-                    RETURN m.matter_id as matter,
-                           m.version as version,
-                           c.clause_number as clause,
-                           c.title as clause_title,
-                           r.classification as recommendation,
-                           d.decision_type as decision,
-                           d.actor as who_decided,
-                           d.notes as notes
-                    ORDER BY c.clause_number
-                """,
+                    """,
+                    [("m.matter_id", "matter"),
+                     ("m.version", "version"),
+                     ("c.clause_number", "clause"),
+                     ("c.title", "clause_title"),
+                     ("r.classification", "recommendation"),
+                     ("d.decision_type", "decision"),
+                     ("d.actor", "who_decided"),
+                     ("d.notes", "notes")],
+                    ["coalesce(c.clause_number, '')", "ID(m)", "ID(c)", node_key("r"), node_key("d")],
+                ),
                 "formatter": self._format_round_decisions,
                 "requires_params": True
             },
@@ -99,18 +188,36 @@ class NaturalLanguageQueryInterface:
                     r"search.*(?:clause|clauses).*['\"]?(\w+)['\"]?",
                     r"(liability|indemnit|warrant|termination|payment|data|ip|intellectual)\s*clause"
                 ],
+                "intent": "clause_search",
                 "description": "Find clauses containing specific terms",
-                "cypher_template": """
+                "cypher_template": keyset_query(
+                    """
+                    CALL db.idx.fulltext.queryNodes('Clause', $terms) YIELD node AS c, score
+                    """,
+                    [("c.matter_id", "matter"),
+                     ("c.version", "version"),
+                     ("c.clause_number", "clause"),
+                     ("c.title", "title"),
+                     ("c.category", "category")],
+                    ["-score", "ID(c)"],
+                ),
+                # Runs instead while the Clause full-text index does not exist
+                "fulltext_label": "Clause",
+                "fallback_template": keyset_query(
+                    """
                     MATCH (c:Clause)
-                    WHERE toLower(c.title) CONTAINS toLower('{keyword}')
-                       OR toLower(c.category) CONTAINS toLower('{keyword}')
-                    RETURN DISTINCT c.matter_id as matter,
-                           c.version as version,
-                           c.clause_number as clause,
-                           c.title as title,
-                           c.category as category
-                    ORDER BY c.matter_id, c.version, c.clause_number
-                """,
+                    WHERE toLower(c.title) CONTAINS toLower($keyword)
+                       OR toLower(c.category) CONTAINS toLower($keyword)
+                       OR toLower(c.text_preview) CONTAINS toLower($keyword)
+                    """,
+                    [("c.matter_id", "matter"),
+                     ("c.version", "version"),
+                     ("c.clause_number", "clause"),
+                     ("c.title", "title"),
+                     ("c.category", "category")],
+                    ["coalesce(c.matter_id, '')", "coalesce(c.version, -1)", "coalesce(c.clause_number, '')",
+                     "ID(c)"],
+                ),
                 "formatter": self._format_clause_search,
                 "requires_params": True
             },
@@ -118,24 +225,27 @@ class NaturalLanguageQueryInterface:
             # Actor/reviewer queries
             {
                 "patterns": [
-                    r"(?:decision|review|work).*(?:by|from|made by)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)",
-                    r"what.*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+(?:decide|review|do)",
-                    r"show.*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)'?s?\s+(?:decision|review|work)"
+                    r"(?:decision|review|work).*(?:by|from|made by)\s+(" + ACTOR_NAME + ")",
+                    r"what did\s+(" + ACTOR_NAME + r")\s+(?:decide|review|do)\b",
+                    r"show\s+(" + ACTOR_NAME + r")'s\s+(?:decision|review|work)"
                 ],
+                "intent": "actor_decisions",
                 "description": "Show decisions made by a specific person",
-                "cypher_template": """
-                    MATCH (d:Decision {{actor: '{actor}'}})
+                "cypher_template": keyset_query(
+                    """
+                    MATCH (d:Decision {actor: $actor})
                     MATCH (r:Recommendation)-[:HAS_DECISION]->(d)
                     MATCH (c:Clause)-[:HAS_RECOMMENDATION]->(r)
-                    RETURN d.matter_id as matter,
-                           c.clause_number as clause,
-                           c.title as clause_title,
-                           r.classification as recommendation_type,
-                           d.decision_type as decision,
-                           d.timestamp as when,
-                           LEFT(d.notes, 100) as notes
-                    ORDER BY d.timestamp
-                """,
+                    """,
+                    [("d.matter_id", "matter"),
+                     ("c.clause_number", "clause"),
+                     ("c.title", "clause_title"),
+                     ("r.classification", "recommendation_type"),
+                     ("d.decision_type", "decision"),
+                     ("d.timestamp", "when"),
+                     ("LEFT(d.notes, 100)", "notes")],
+                    ["coalesce(d.timestamp, '')", "ID(d)", "ID(r)", "ID(c)"],
+                ),
                 "formatter": self._format_actor_decisions,
                 "requires_params": True
             },
@@ -147,20 +257,23 @@ class NaturalLanguageQueryInterface:
                     r"(?:bad|problematic|risky)\s+(?:term|clause)",
                     r"(?:issue|problem|concern|risk).*clause"
                 ],
+                "intent": "unfavorable_terms",
                 "description": "Find all unfavorable terms flagged in reviews",
-                "cypher": """
+                "cypher": keyset_query(
+                    """
                     MATCH (c:Clause)-[:HAS_RECOMMENDATION]->(r:Recommendation {classification: 'unfavorable'})
                     OPTIONAL MATCH (r)-[:HAS_DECISION]->(d:Decision)
-                    RETURN c.matter_id as matter,
-                           c.version as version,
-                           c.clause_number as clause,
-                           c.title as clause_title,
-                           r.issue_type as issue,
-                           d.decision_type as decision,
-                           d.actor as reviewed_by
-                    ORDER BY c.matter_id, c.version, c.clause_number
-                    LIMIT 20
-                """,
+                    """,
+                    [("c.matter_id", "matter"),
+                     ("c.version", "version"),
+                     ("c.clause_number", "clause"),
+                     ("c.title", "clause_title"),
+                     ("r.issue_type", "issue"),
+                     ("d.decision_type", "decision"),
+                     ("d.actor", "reviewed_by")],
+                    ["coalesce(c.matter_id, '')", "coalesce(c.version, -1)", "coalesce(c.clause_number, '')",
+                     "ID(c)", "ID(r)", node_key("d")],
+                ),
                 "formatter": self._format_unfavorable_terms
             },
 
@@ -168,13 +281,29 @@ class NaturalLanguageQueryInterface:
             {
                 "patterns": [
                     r"(?:overview|summary|status).*(?:matter|contract)\s+(\w+)",
+                    r"(?:overview|summary|status).*\b(matter_\w+)",
                     r"(?:matter|contract)\s+(\w+)\s+(?:overview|summary|status)",
                     r"show.*(?:matter|contract)\s+(\w+)"
                 ],
+                "intent": "matter_overview",
                 "description": "Show overview of a specific matter",
                 "cypher_template": """
-                    MATCH (m:Matter {{matter_id: '{matter_id}'}})
-                    OPTIONAL MATCH (c:Clause {{matter_id: '{matter_id}', version: m.version}})
+                    MATCH (s:MatterSummary {matter_id: $matter_id})
+                    RETURN s.matter_id as matter,
+                           s.version as version,
+                           s.matter_type as type,
+                           s.timestamp as last_updated,
+                           s.clauses as total_clauses,
+                           s.recommendations as recommendations,
+                           s.decisions as decisions,
+                           s.concessions as concessions
+                    ORDER BY s.version
+                """,
+                # Runs instead while the summary views have not been built
+                "summary_view": True,
+                "fallback_template": """
+                    MATCH (m:Matter {matter_id: $matter_id})
+                    OPTIONAL MATCH (c:Clause {matter_id: $matter_id, version: m.version})
                     OPTIONAL MATCH (c)-[:HAS_RECOMMENDATION]->(r:Recommendation)
                     OPTIONAL MATCH (r)-[:HAS_DECISION]->(d:Decision)
                     OPTIONAL MATCH (d)-[:RESULTED_IN_CONCESSION]->(con:Concession)
@@ -199,20 +328,23 @@ class NaturalLanguageQueryInterface:
                     r"clause\s+([\d.]+).*(?:change|history|version)",
                     r"how.*clause\s+([\d.]+).*(?:change|evolve)"
                 ],
+                "intent": "clause_history",
                 "description": "Track how a specific clause evolved across versions",
-                "cypher_template": """
-                    MATCH (c:Clause {{clause_number: '{clause_number}'}})
+                "cypher_template": keyset_query(
+                    """
+                    MATCH (c:Clause {clause_number: $clause_number})
                     OPTIONAL MATCH (c)-[:HAS_RECOMMENDATION]->(r:Recommendation)
                     OPTIONAL MATCH (r)-[:HAS_DECISION]->(d:Decision)
-                    RETURN c.matter_id as matter,
-                           c.version as version,
-                           c.clause_number as clause,
-                           c.title as title,
-                           r.classification as recommendation,
-                           r.issue_type as issue,
-                           d.decision_type as decision
-                    ORDER BY c.matter_id, c.version
-                """,
+                    """,
+                    [("c.matter_id", "matter"),
+                     ("c.version", "version"),
+                     ("c.clause_number", "clause"),
+                     ("c.title", "title"),
+                     ("r.classification", "recommendation"),
+                     ("r.issue_type", "issue"),
+                     ("d.decision_type", "decision")],
+                    ["coalesce(c.matter_id, '')", "coalesce(c.version, -1)", "ID(c)", node_key("r"), node_key("d")],
+                ),
                 "formatter": self._format_clause_history,
                 "requires_params": True
             },
@@ -224,20 +356,29 @@ class NaturalLanguageQueryInterface:
                     r"how many",
                     r"total.*(?:clause|recommendation|decision|concession)"
                 ],
+                "intent": "statistics",
                 "description": "Show overall system statistics",
                 "cypher": """
+                    MATCH (g:GraphSummary)
+                    RETURN g.matters as matters, g.parties as parties, g.clauses as clauses,
+                           g.recommendations as recommendations, g.decisions as decisions,
+                           g.concessions as concessions
+                """,
+                # Same counting rule as the views: nodes of an ingested matter_id
+                "summary_view": True,
+                "fallback": """
                     MATCH (m:Matter)
-                    WITH COUNT(DISTINCT m) as matters
-                    MATCH (p:Party)
-                    WITH matters, COUNT(DISTINCT p) as parties
-                    MATCH (c:Clause)
-                    WITH matters, parties, COUNT(DISTINCT c) as clauses
-                    OPTIONAL MATCH (r:Recommendation)
-                    WITH matters, parties, clauses, COUNT(DISTINCT r) as recommendations
-                    OPTIONAL MATCH (d:Decision)
-                    WITH matters, parties, clauses, recommendations, COUNT(DISTINCT d) as decisions
-                    OPTIONAL MATCH (con:Concession)
-                    RETURN matters, parties, clauses, recommendations, decisions, COUNT(DISTINCT con) as concessions
+                    WITH collect(DISTINCT m.matter_id) as ids, COUNT(m) as matters
+                    OPTIONAL MATCH (p:Party) WHERE p.matter_id IN ids
+                    WITH ids, matters, COUNT(p) as parties
+                    OPTIONAL MATCH (c:Clause) WHERE c.matter_id IN ids
+                    WITH ids, matters, parties, COUNT(c) as clauses
+                    OPTIONAL MATCH (r:Recommendation) WHERE r.matter_id IN ids
+                    WITH ids, matters, parties, clauses, COUNT(r) as recommendations
+                    OPTIONAL MATCH (d:Decision) WHERE d.matter_id IN ids
+                    WITH ids, matters, parties, clauses, recommendations, COUNT(d) as decisions
+                    OPTIONAL MATCH (con:Concession) WHERE con.matter_id IN ids
+                    RETURN matters, parties, clauses, recommendations, decisions, COUNT(con) as concessions
                 """,
                 "formatter": self._format_statistics
             },
@@ -248,64 +389,70 @@ class NaturalLanguageQueryInterface:
                     r"decision.*(?:distribution|breakdown|type)",
                     r"(?:apply|override|defer).*decision"
                 ],
+                "intent": "decision_distribution",
                 "description": "Show breakdown of decision types",
                 "cypher": """
+                    MATCH (t:DecisionTypeSummary)
+                    WHERE t.count > 0
+                    WITH collect(t) as types, SUM(t.count) as total
+                    UNWIND types as t
+                    RETURN t.decision_type as decision_type, t.count as count,
+                           ROUND(100.0 * t.count / total) as percentage
+                    ORDER BY count DESC
+                """,
+                "summary_view": True,
+                "fallback": """
+                    MATCH (m:Matter)
+                    WITH collect(DISTINCT m.matter_id) as ids
                     MATCH (d:Decision)
-                    WITH COUNT(d) as total
-                    MATCH (d2:Decision)
-                    WITH d2.decision_type as decision_type, COUNT(d2) as count, total
-                    RETURN decision_type, count, ROUND(100.0 * count / total) as percentage
+                    WHERE d.matter_id IN ids AND d.decision_type IS NOT NULL
+                    WITH d.decision_type as decision_type, COUNT(d) as count
+                    WITH collect([decision_type, count]) as types, SUM(count) as total
+                    UNWIND types as t
+                    RETURN t[0] as decision_type, t[1] as count,
+                           ROUND(100.0 * t[1] / total) as percentage
                     ORDER BY count DESC
                 """,
                 "formatter": self._format_decision_distribution
             }
         ]
 
-    def match_query(self, question: str) -> Optional[Tuple[Dict[str, Any], Dict[str, str]]]:
+    def match_query(self, question: str) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
         """
         Match a natural language question to a query pattern.
 
         Returns:
             Tuple of (pattern_dict, params_dict) if match found, None otherwise
         """
-        question_lower = question.lower().strip()
-
-        for pattern_dict in self.query_patterns:
-            for pattern in pattern_dict["patterns"]:
-                match = re.search(pattern, question_lower)
-                if match:
-                    # Extract parameters from regex groups
-                    params = {}
-                    if match.groups():
-                        if "round" in pattern or "version" in pattern:
-                            params["version"] = int(match.group(1))
-                        elif "clause" in pattern and "clause_number" in pattern_dict.get("cypher_template", ""):
-                            params["clause_number"] = match.group(1)
-                        elif "matter" in pattern:
-                            params["matter_id"] = match.group(1)
-                        elif "actor" in pattern_dict.get("cypher_template", ""):
-                            params["actor"] = match.group(1).title()  # Capitalize name
-                        else:
-                            # Generic keyword extraction
-                            params["keyword"] = match.group(1)
-                    else:
-                        # No capture groups - check if template needs keyword
-                        if "keyword" in pattern_dict.get("cypher_template", ""):
-                            # Try to infer keyword from pattern or question
-                            # Extract common terms like "liability", "indemnity", etc.
-                            for term in ["liability", "indemnit", "warrant", "termination", "payment", "data", "ip", "intellectual"]:
-                                if term in question_lower:
-                                    params["keyword"] = term
-                                    break
-
-                    return (pattern_dict, params)
-
-        return None
-
-    def execute_query(self, question: str) -> Dict[str, Any]:
+        route = self.router.route(question)
+        if route is None:
+            return None
+        return (route.pattern, route.params)
+
+    def execute_query(self, question: str, page_token: Optional[str] = None,
+                      page_size: int = DEFAULT_PAGE_SIZE) -> Dict[str, Any]:
         """
         Execute a natural language query and return formatted results.
 
+        Blocking wrapper around execute_query_async; safe to call from any thread.
+
+        Returns:
+            Dictionary with query results and metadata
+        """
+        return self._loop.run(self.execute_query_async(question, page_token, page_size))
+
+    async def execute_query_async(self, question: str, page_token: Optional[str] = None,
+                                  page_size: int = DEFAULT_PAGE_SIZE) -> Dict[str, Any]:
+        """
+        Execute a natural language query without blocking the event loop.
+
+        Must be awaited on the interface's own loop (execute_query does this);
+        the connection pool belongs to that loop.
+
+        List queries return one page of at most page_size rows. When more rows
+        follow, "next_token" is set; pass it back as page_token with the same
+        question to get the next page.
+
         Returns:
             Dictionary with query results and metadata
         """
@@ -321,18 +468,22 @@ class NaturalLanguageQueryInterface:
 
         pattern_dict, params = match_result
 
-        # Build Cypher query
+        # Build Cypher query (constant text; values are passed as parameters)
+        query_params = None
+        use_fallback = await self._needs_fallback(pattern_dict)
         if "cypher" in pattern_dict:
-            cypher_query = pattern_dict["cypher"]
+            cypher_query = pattern_dict["fallback" if use_fallback else "cypher"]
         elif "cypher_template" in pattern_dict:
             # Check if we have all required parameters
-            template = pattern_dict["cypher_template"]
-            # Extract required parameters from template
-            import string
-            required_params = [fname for _, fname, _, _ in string.Formatter().parse(template) if fname]
+            template = pattern_dict["fallback_template" if use_fallback else "cypher_template"]
+            # Extract required $parameters from template
+            required_params = list(dict.fromkeys(re.findall(r"\$(\w+)", template)))
 
             # Fill in missing params with empty strings or defaults
             for param in required_params:
+                # $terms is the full-text index query for the keyword
+                if param == "terms":
+                    param = "keyword"
                 if param not in params:
                     # Try to infer from question
                     if param == "keyword":
@@ -346,50 +497,170 @@ class NaturalLanguageQueryInterface:
                         if param not in params:
                             params[param] = ""
 
-            cypher_query = template.format(**params)
+            if "terms" in required_params:
+                params["terms"] = fulltext_query(params["keyword"])
+
+            cypher_query = template
+            query_params = {param: params[param] for param in required_params if param in params}
         else:
             return {
                 "success": False,
                 "error": "Query pattern configuration error"
             }
 
-        # Execute query
+        # Keyset queries are fetched a page at a time, after the token's cursor
+        intent = pattern_dict.get("intent", "")
+        key_count = keyset_key_count(cypher_query)
+        try:
+            cursor = decode_token(page_token, intent, query_params)
+        except ValueError as e:
+            return {
+                "success": False,
+                "error": f"Invalid continuation token: {e}"
+            }
+        page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+        run_params = query_params
+        if key_count:
+            run_params = {**(query_params or {}), **cursor.query_params(key_count, page_size)}
+
+        # Execute query (or reuse the rows of an identical one)
         try:
-            result = self.graph.query(cypher_query)
+            rows, cached = await self._fetch_rows(pattern_dict, cypher_query, run_params)
 
             # Format results
             formatter = pattern_dict.get("formatter", self._format_generic)
-            formatted_output = formatter(result.result_set, params)
+            if key_count:
+                page = Page(rows, key_count, page_size, cursor)
+                formatted_output = formatter(iter(page), params, cursor.offset + 1)
+                results_count = page.count
+                next_cursor = page.next_cursor()
+            else:
+                formatted_output = formatter(iter(rows), params)
+                results_count = len(rows)
+                next_cursor = None
 
             return {
                 "success": True,
                 "question": question,
                 "description": pattern_dict["description"],
-                "results_count": len(result.result_set),
+                "results_count": results_count,
                 "results": formatted_output,
-                "cypher": cypher_query  # Include for debugging
+                "cypher": cypher_query,  # Include for debugging
+                "params": query_params or {},
+                "cached": cached,
+                "page_start": cursor.offset + 1,
+                "next_token": encode_token(intent, query_params, next_cursor) if next_cursor else None
+            }
+
+        except asyncio.TimeoutError:
+            return {
+                "success": False,
+                "error": f"Query timed out after {self.async_graph.timeout_ms}ms",
+                "cypher": cypher_query,
+                "params": query_params or {}
             }
 
         except Exception as e:
             return {
                 "success": False,
                 "error": f"Query execution error: {str(e)}",
-                "cypher": cypher_query
+                "cypher": cypher_query,
+                "params": query_params or {}
             }
 
+    async def _needs_fallback(self, pattern_dict: Dict[str, Any]) -> bool:
+        """Whether a pattern must run its fallback because its index or summary views are missing
+
+        The read model answers the primary form itself, so it never needs one.
+        """
+        if self.replica is not None:
+            return False
+        label = pattern_dict.get("fulltext_label")
+        if label and not await self._has_fulltext_index(label):
+            return True
+        return bool(pattern_dict.get("summary_view")) and not await self._summaries_built()
+
+    async def _summaries_built(self) -> bool:
+        """Whether the GraphSummary view exists; assumed so if it cannot be read"""
+        if not self._has_summaries:
+            try:
+                self._has_summaries = bool(await asyncio.to_thread(graph_summary, self.graph))
+            except Exception:
+                return True
+        return self._has_summaries
+
+    async def _has_fulltext_index(self, label: str) -> bool:
+        """Whether ``label`` has a full-text index; assumed so if the schema cannot be read"""
+        if label not in self._fulltext_labels:
+            try:
+                present = await asyncio.to_thread(existing_indexes, self.graph)
+            except Exception:
+                # The indexed query then reports the real problem
+                return True
+            self._fulltext_labels = {found for kind, found, _ in present if kind == "fulltext"}
+        return label in self._fulltext_labels
+
+    async def _fetch_rows(self, pattern_dict: Dict[str, Any], cypher_query: str,
+                          query_params: Optional[Dict[str, Any]]) -> Tuple[List, bool]:
+        """Result rows for the query, and whether they came from the cache"""
+        if not self.cache.enabled:
+            return await self._run_query(cypher_query, query_params), False
+
+        key = cache_key(pattern_dict.get("intent", cypher_query), query_params)
+        epoch = await self.epoch.current_async()
+        hit, rows = self.cache.get(key, epoch)
+        if hit:
+            return rows, True
+
+        rows = await self._run_query(cypher_query, query_params, epoch)
+        self.cache.put(key, epoch, rows)
+        return rows, False
+
+    async def _run_query(self, cypher_query: str, query_params: Optional[Dict[str, Any]],
+                         epoch: Optional[int] = None) -> List:
+        """Rows from the read model when enabled, else from FalkorDB"""
+        if self.replica is None or not self.replica.handles(cypher_query):
+            return (await self.async_graph.ro_query(cypher_query, params=query_params)).result_set
+
+        if epoch is None:
+            epoch = await self.epoch.current_async()
+        if not self.replica.is_current(epoch):
+            # Reloading reads the whole graph; keep it off the event loop
+            await asyncio.to_thread(self.replica.model, epoch)
+        return self.replica.answer(cypher_query, query_params, epoch)
+
+    def close(self):
+        """Close the pooled connections and stop the background event loop"""
+        self._loop.run(self.async_graph.aclose())
+        self._loop.close()
+
+    def print_cache_stats(self):
+        """Print result cache counters"""
+        stats = self.cache.stats()
+        print(f"\n🗄️  Result cache: {stats['entries']}/{stats['max_entries']} entries, "
+              f"{stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']*100:.1f}% hit), "
+              f"{stats['invalidations']} invalidated, {stats['expirations']} expired, "
+              f"{stats['evictions']} evicted\n")
+
     # =========================================================================
     # Result Formatters
+    #
+    # Formatters consume rows as an iterator (one page of a paged query) and
+    # number them from ``start``, so later pages continue the numbering.
     # =========================================================================
 
-    def _format_concessions(self, rows: List, params: Dict) -> str:
-        """Format concession query results"""
-        if not rows:
-            return "No concessions found in the database."
+    def _found(self, count: int, start: int, noun: str) -> str:
+        """Header count, e.g. 'Found 3 clause(s)' or 'Clause(s) 26-50'"""
+        if start == 1:
+            return f"Found {count} {noun}(s)"
+        return f"{noun.capitalize()}(s) {start}-{start + count - 1}"
 
+    def _format_concessions(self, rows: Iterable, params: Dict, start: int = 1) -> str:
+        """Format concession query results"""
         output = []
-        output.append(f"\n🔍 Found {len(rows)} concession(s):\n")
-
-        for i, row in enumerate(rows, 1):
+        count = 0
+        for i, row in enumerate(rows, start):
+            count += 1
             con_id, matter, clause_id, who, what, impact, why, when = row
             output.append(f"{i}. {matter} - Clause ID: {clause_id}")
             output.append(f"   Who: {who}")
@@ -399,18 +670,18 @@ class NaturalLanguageQueryInterface:
             output.append(f"   When: {when}")
             output.append("")
 
-        return "\n".join(output)
+        if not output:
+            return "No concessions found in the database."
+        header = f"\n🔍 {self._found(count, start, 'concession')}:\n"
+        return "\n".join([header] + output)
 
-    def _format_round_decisions(self, rows: List, params: Dict) -> str:
+    def _format_round_decisions(self, rows: Iterable, params: Dict, start: int = 1) -> str:
         """Format round-based decision results"""
-        if not rows:
-            return f"No decisions found for version {params.get('version', '?')}."
-
         version = params.get("version", "?")
         output = []
         output.append(f"\n📋 Decisions in Round/Version {version}:\n")
 
-        for i, row in enumerate(rows, 1):
+        for i, row in enumerate(rows, start):
             matter, ver, clause, title, rec, decision, who, notes = row
             if decision:  # Only show clauses with decisions
                 output.append(f"{i}. Clause {clause}: {title}")
@@ -420,37 +691,30 @@ class NaturalLanguageQueryInterface:
                     output.append(f"   Notes: {notes}")
                 output.append("")
 
-        return "\n".join(output) if len(output) > 2 else f"No decisions recorded for version {version}."
+        return "\n".join(output) if len(output) > 1 else f"No decisions recorded for version {version}."
 
-    def _format_clause_search(self, rows: List, params: Dict) -> str:
+    def _format_clause_search(self, rows: Iterable, params: Dict, start: int = 1) -> str:
         """Format clause search results"""
-        if not rows:
-            keyword = params.get("keyword", "?")
-            return f"No clauses found containing '{keyword}'."
-
         keyword = params.get("keyword", "")
         output = []
-        output.append(f"\n🔍 Found {len(rows)} clause(s) matching '{keyword}':\n")
-
-        for i, row in enumerate(rows, 1):
+        count = 0
+        for i, row in enumerate(rows, start):
+            count += 1
             matter, version, clause, title, category = row
             output.append(f"{i}. {matter} v{version} - Clause {clause}: {title}")
             output.append(f"   Category: {category}")
             output.append("")
 
-        return "\n".join(output)
+        if not output:
+            return f"No clauses found containing '{keyword or '?'}'."
+        header = f"\n🔍 {self._found(count, start, 'clause')} matching '{keyword}':\n"
+        return "\n".join([header] + output)
 
-    def _format_actor_decisions(self, rows: List, params: Dict) -> str:
+    def _format_actor_decisions(self, rows: Iterable, params: Dict, start: int = 1) -> str:
         """Format actor-specific decision results"""
-        if not rows:
-            actor = params.get("actor", "?")
-            return f"No decisions found for {actor}."
-
         actor = params.get("actor", "?")
         output = []
-        output.append(f"\n👤 Decisions by {actor}:\n")
-
-        for i, row in enumerate(rows, 1):
+        for i, row in enumerate(rows, start):
             matter, clause, title, rec_type, decision, when, notes = row
             output.append(f"{i}. {matter} - Clause {clause}: {title}")
             output.append(f"   Recommendation type: {rec_type}")
@@ -460,31 +724,29 @@ class NaturalLanguageQueryInterface:
                 output.append(f"   Notes: {notes}...")
             output.append("")
 
-        return "\n".join(output)
+        if not output:
+            return f"No decisions found for {actor}."
+        return "\n".join([f"\n👤 Decisions by {actor}:\n"] + output)
 
-    def _format_unfavorable_terms(self, rows: List, params: Dict) -> str:
+    def _format_unfavorable_terms(self, rows: Iterable, params: Dict, start: int = 1) -> str:
         """Format unfavorable terms results"""
-        if not rows:
-            return "No unfavorable terms found."
-
         output = []
-        output.append(f"\n⚠️  Found {len(rows)} unfavorable term(s):\n")
-
-        for i, row in enumerate(rows, 1):
+        count = 0
+        for i, row in enumerate(rows, start):
+            count += 1
             matter, version, clause, title, issue, decision, reviewer = row
             output.append(f"{i}. {matter} v{version} - Clause {clause}: {title}")
             output.append(f"   Issue: {issue}")
             output.append(f"   Decision: {decision or 'Pending'} {f'by {reviewer}' if reviewer else ''}")
             output.append("")
 
-        return "\n".join(output)
+        if not output:
+            return "No unfavorable terms found."
+        header = f"\n⚠️  {self._found(count, start, 'unfavorable term')}:\n"
+        return "\n".join([header] + output)
 
-    def _format_matter_overview(self, rows: List, params: Dict) -> str:
+    def _format_matter_overview(self, rows: Iterable, params: Dict, start: int = 1) -> str:
         """Format matter overview results"""
-        if not rows:
-            matter_id = params.get("matter_id", "?")
-            return f"Matter {matter_id} not found."
-
         output = []
         output.append(f"\n📊 Matter Overview:\n")
 
@@ -501,19 +763,16 @@ class NaturalLanguageQueryInterface:
             output.append(f"  - Concessions: {concessions}")
             output.append("")
 
+        if len(output) == 1:
+            matter_id = params.get("matter_id", "?")
+            return f"Matter {matter_id} not found."
         return "\n".join(output)
 
-    def _format_clause_history(self, rows: List, params: Dict) -> str:
+    def _format_clause_history(self, rows: Iterable, params: Dict, start: int = 1) -> str:
         """Format clause history results"""
-        if not rows:
-            clause_num = params.get("clause_number", "?")
-            return f"No history found for clause {clause_num}."
-
         clause_num = params.get("clause_number", "?")
         output = []
-        output.append(f"\n📜 History of Clause {clause_num}:\n")
-
-        for i, row in enumerate(rows, 1):
+        for i, row in enumerate(rows, start):
             matter, version, clause, title, rec, issue, decision = row
             output.append(f"{i}. Version {version} ({matter}): {title}")
             if rec:
@@ -523,14 +782,16 @@ class NaturalLanguageQueryInterface:
                 output.append(f"   No recommendations")
             output.append("")
 
-        return "\n".join(output)
+        if not output:
+            return f"No history found for clause {clause_num}."
+        return "\n".join([f"\n📜 History of Clause {clause_num}:\n"] + output)
 
-    def _format_statistics(self, rows: List, params: Dict) -> str:
+    def _format_statistics(self, rows: Iterable, params: Dict, start: int = 1) -> str:
         """Format statistics results"""
-        if not rows:
+        row = next(iter(rows), None)
+        if row is None:
             return "No statistics available."
 
-        row = rows[0]
         matters, parties, clauses, recs, decisions, concessions = row
 
         output = []
@@ -545,11 +806,8 @@ class NaturalLanguageQueryInterface:
 
         return "\n".join(output)
 
-    def _format_decision_distribution(self, rows: List, params: Dict) -> str:
+    def _format_decision_distribution(self, rows: Iterable, params: Dict, start: int = 1) -> str:
         """Format decision distribution results"""
-        if not rows:
-            return "No decision data available."
-
         output = []
         output.append("\n📊 Decision Distribution:\n")
 
@@ -557,22 +815,23 @@ class NaturalLanguageQueryInterface:
             decision_type, count, percentage = row
             output.append(f"{decision_type}: {count} ({percentage}%)")
 
+        if len(output) == 1:
+            return "No decision data available."
         output.append("")
         return "\n".join(output)
 
-    def _format_generic(self, rows: List, params: Dict) -> str:
+    def _format_generic(self, rows: Iterable, params: Dict, start: int = 1) -> str:
         """Generic formatter for unformatted results"""
-        if not rows:
-            return "No results found."
-
         output = []
-        output.append(f"\n📋 Found {len(rows)} result(s):\n")
-
-        for i, row in enumerate(rows, 1):
+        count = 0
+        for i, row in enumerate(rows, start):
+            count += 1
             output.append(f"{i}. {' | '.join(str(v) for v in row)}")
 
+        if not output:
+            return "No results found."
         output.append("")
-        return "\n".join(output)
+        return "\n".join([f"\n📋 {self._found(count, start, 'result')}:\n"] + output)
 
     def _get_example_questions(self) -> List[str]:
         """Return list of example questions"""
@@ -607,7 +866,7 @@ class NaturalLanguageQueryInterface:
         print("  • Matter overviews")
         print("  • Clause history")
         print("  • Statistics")
-        print("\nType 'help' for this message, 'quit' or 'exit' to quit.\n")
+        print("\nType 'more' for the next page of results, 'help' for this message, 'cache' for result cache stats, 'quit' or 'exit' to quit.\n")
 
 
 def main():
@@ -616,13 +875,17 @@ def main():
     print("NATURAL LANGUAGE QUERY INTERFACE")
     print("="*80)
 
+    args = sys.argv[1:]
+    read_model = "--read-model" in args
+    args = [arg for arg in args if arg != "--read-model"]
+
     # Initialize interface
-    interface = NaturalLanguageQueryInterface()
+    interface = NaturalLanguageQueryInterface(read_model=read_model)
 
     # Check if question provided as argument
-    if len(sys.argv) > 1:
+    if args:
         # Single query mode
-        question = " ".join(sys.argv[1:])
+        question = " ".join(args)
 
         result = interface.execute_query(question)
 
@@ -630,6 +893,8 @@ def main():
             print(f"\n📝 Question: {result['question']}")
             print(f"💡 Interpretation: {result['description']}")
             print(result["results"])
+            if result.get("next_token"):
+                print("⏬ More results available; ask in interactive mode and type 'more' to page through them.")
         else:
             print(f"\n❌ Error: {result['error']}")
             if "suggestions" in result:
@@ -639,6 +904,7 @@ def main():
     else:
         # Interactive mode
         interface.print_help()
+        last_question, next_token = None, None
 
         while True:
             try:
@@ -655,12 +921,28 @@ def main():
                     interface.print_help()
                     continue
 
+                if question.lower() == "cache":
+                    interface.print_cache_stats()
+                    continue
+
+                if question.lower() == "more":
+                    if not next_token:
+                        print("\nNo more results.")
+                        continue
+                    question, page_token = last_question, next_token
+                else:
+                    page_token = None
+
                 # Execute query
-                result = interface.execute_query(question)
+                result = interface.execute_query(question, page_token=page_token)
 
                 if result["success"]:
-                    print(f"\n💡 {result['description']}")
+                    last_question, next_token = question, result.get("next_token")
+                    if page_token is None:
+                        print(f"\n💡 {result['description']}")
                     print(result["results"])
+                    if next_token:
+                        print("⏬ Type 'more' for the next page.")
                 else:
                     print(f"\n❌ {result['error']}")
                     if "suggestions" in result:
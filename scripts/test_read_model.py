@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Check the in-process read model against the live graph.
+
+Runs every nl_query pattern (first page and a later page of the paged ones)
+and every KPI #5 query on FalkorDB and on analytics.read_model, and reports
+any query whose rows differ. Queries whose ORDER BY leaves ties are
+compared as sorted rows. Clause search is ranked by FalkorDB's full-text
+score live and by BM25 locally, so only the set of clauses it finds is
+compared.
+
+Usage:
+    python scripts/test_read_model.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from falkordb import FalkorDB
+
+from analytics.clause_index import fulltext_query
+from analytics.plan_profiler import fill_parameters
+from analytics.read_model import KPI5_HANDLERS, NL_INTENTS, ReadModel
+from analytics.snapshot import GraphSnapshot
+from scripts.measure_kpis import runnable_kpi5_queries
+from scripts.nl_paging import keyset_key_count
+from scripts.nl_router import load_patterns
+
+SAMPLE_PARAMS = {
+    "version": 2,
+    "terms": fulltext_query("liability"),
+    "actor": "Jessica Martinez",
+    "matter_id": "matter_001",
+    "clause_number": "1.1",
+}
+
+# Ordered on a column that can tie, so only the set of rows is comparable
+UNORDERED = {"clause_search", "matter_overview", "decision_distribution", "Decisions by Actor",
+             "Decision Type Distribution", "Cross-Matter Precedent Search"}
+
+# Ranked differently on each side; compared as the full set of matches without the score key
+RANKED = {"clause_search"}
+
+
+def compare(name, live_rows, local_rows):
+    live_rows, local_rows = [list(row) for row in live_rows], [list(row) for row in local_rows]
+    if name in UNORDERED:
+        live_rows.sort(key=repr)
+        local_rows.sort(key=repr)
+    if live_rows == local_rows:
+        print(f"✅ {name}: {len(live_rows)} rows match")
+        return True
+    print(f"❌ {name}: live returned {len(live_rows)} rows, read model {len(local_rows)}")
+    for live, local in zip(live_rows, local_rows):
+        if live != local:
+            print(f"   first difference:\n     live:  {live}\n     local: {local}")
+            break
+    return False
+
+
+def check_nl_patterns(graph, model):
+    """Each NL pattern, and the second page of the paged ones"""
+    print("\nNL query patterns...")
+    ok = True
+    for pattern in load_patterns():
+        intent = pattern["intent"]
+        cypher = pattern.get("cypher") or pattern["cypher_template"]
+        params = fill_parameters(cypher, {**SAMPLE_PARAMS, "limit": 3})
+        if intent in RANKED:
+            # Every match on both sides; FalkorDB rejects a null LIMIT
+            params["limit"] = len(model.nodes.get("Clause", {})) + 1
+            live_rows = graph.ro_query(cypher, params=params).result_set
+            local_rows = NL_INTENTS[intent](model, params)
+            ok &= compare(intent, [row[:-2] for row in live_rows], [row[:-2] for row in local_rows])
+            continue
+        live_rows = graph.ro_query(cypher, params=params).result_set
+        ok &= compare(intent, live_rows, NL_INTENTS[intent](model, params))
+
+        key_count = keyset_key_count(cypher)
+        if key_count and live_rows:
+            after = live_rows[-1][-key_count:]
+            params.update({f"after_{i}": value for i, value in enumerate(after)})
+            live_rows = graph.ro_query(cypher, params=params).result_set
+            ok &= compare(f"{intent} (page 2)", live_rows, NL_INTENTS[intent](model, params))
+    return ok
+
+
+def check_kpi5_queries(graph, model):
+    """Each KPI #5 query"""
+    print("\nKPI #5 queries...")
+    ok = True
+    for query in runnable_kpi5_queries(graph):
+        live_rows = graph.ro_query(query["query"]).result_set
+        ok &= compare(query["name"], live_rows, KPI5_HANDLERS[query["name"]](model, {}))
+    return ok
+
+
+def main():
+    print("="*80)
+    print("READ MODEL PARITY")
+    print("="*80)
+
+    db = FalkorDB(host='localhost', port=6379)
+    graph = db.select_graph('negotiation_continuity')
+    model = ReadModel(GraphSnapshot.from_graph(graph))
+
+    nl_ok = check_nl_patterns(graph, model)
+    kpi_ok = check_kpi5_queries(graph, model)
+
+    print("\n" + "="*80)
+    if nl_ok and kpi_ok:
+        print("✅ Read model matches the live graph")
+        return 0
+    print("❌ Read model differs from the live graph")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
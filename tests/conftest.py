@@ -0,0 +1,16 @@
+class KeyValueGraph:
+    """Graph handle with the key/value commands the epoch helpers use.
+
+    Values are stored as strings, the way Redis returns them to ``GET``.
+    """
+
+    name = "negotiation_continuity"
+
+    def __init__(self):
+        self.keys = {}
+
+    def execute_command(self, command, key, *args):
+        if command == "INCR":
+            self.keys[key] = str(int(self.keys.get(key, 0)) + 1)
+            return int(self.keys[key])
+        return self.keys.get(key)
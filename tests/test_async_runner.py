@@ -0,0 +1,68 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from graphdb import AsyncQueryRunner, BackgroundLoop
+
+
+class SlowGraph:
+    """Async graph whose queries sleep, tracking how many overlap."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.timeouts = []
+
+    async def ro_query(self, q, params=None, timeout=None):
+        self.timeouts.append(timeout)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return SimpleNamespace(result_set=[[1]], cached_execution=True, run_time_ms=0.2)
+
+
+def test_runner_caps_queries_in_flight_and_records_stats():
+    graph = SlowGraph()
+    runner = AsyncQueryRunner(graph, max_in_flight=3, timeout_ms=1000)
+
+    async def burst():
+        return await asyncio.gather(*(runner.ro_query("RETURN 1") for _ in range(10)))
+
+    results = asyncio.run(burst())
+
+    assert len(results) == 10
+    assert graph.peak == 3
+    assert graph.timeouts == [1000] * 10
+    assert runner.cache_report()[0]["calls"] == 10
+    assert runner.hit_rate == 1.0
+
+
+def test_runner_times_out_slow_queries():
+    runner = AsyncQueryRunner(SlowGraph(delay=1.0), timeout_ms=20)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(runner.ro_query("RETURN 1"))
+    assert runner.distinct_queries == 0
+
+
+def test_background_loop_runs_coroutines_from_many_threads():
+    loop = BackgroundLoop()
+    seen = []
+
+    async def where():
+        return threading.current_thread().name
+
+    threads = [threading.Thread(target=lambda: seen.append(loop.run(where()))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    loop.close()
+
+    assert seen == ["graphdb-loop"] * 4
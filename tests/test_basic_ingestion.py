@@ -0,0 +1,116 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from scripts.ingest.basic_ingestion import (
+    BATCH_QUERIES,
+    build_batch_rows,
+    iter_chunks,
+    iter_ready_chunks,
+    select_files,
+    stream_batch_rows,
+    write_batches,
+    write_row_stream,
+)
+
+from scripts.ingest.manifest import file_checksum, manifest_key
+
+SAMPLE_FILE = Path("data/ground_truth/synthetic/matter_001_v1.json")
+
+
+class RecordingGraph:
+    def __init__(self):
+        self.calls = []
+
+    def query(self, q, params=None):
+        self.calls.append((q, params))
+
+
+def load_sample():
+    with SAMPLE_FILE.open() as handle:
+        return json.load(handle)
+
+
+def test_build_batch_rows_covers_every_entity():
+    data = load_sample()
+    rows = build_batch_rows(data)
+
+    assert list(rows) == list(BATCH_QUERIES)
+    assert len(rows["Matter"]) == 1
+    assert len(rows["Party"]) == 2
+    assert len(rows["Clause"]) == len(data["clauses"])
+    assert len(rows["Recommendation"]) == len(data["recommendations"])
+    assert len(rows["Decision"]) == len(data["decisions"])
+    assert len(rows["Concession"]) == len(data["concessions"])
+    assert all(row["matter_id"] == data["matter_id"] for label in rows for row in rows[label])
+    assert rows["Clause"][0]["text_preview"].endswith("...")
+
+
+def test_iter_chunks_rejects_zero():
+    assert list(iter_chunks([1, 2, 3], 2)) == [[1, 2], [3]]
+    with pytest.raises(ValueError):
+        list(iter_chunks([1], 0))
+
+
+def test_write_batches_sends_one_query_per_chunk():
+    rows = build_batch_rows(load_sample())
+    graph = RecordingGraph()
+
+    stats = write_batches(graph, rows, chunk_size=4)
+
+    expected_trips = sum(-(-len(rows[label]) // 4) for label in BATCH_QUERIES)
+    assert len(graph.calls) == expected_trips
+    assert all(q in BATCH_QUERIES.values() for q, _ in graph.calls)
+    assert stats["Clause"]["rows"] == len(rows["Clause"])
+    assert stats["Clause"]["round_trips"] == -(-len(rows["Clause"]) // 4)
+
+
+def test_stream_batch_rows_matches_build_batch_rows():
+    expected = build_batch_rows(load_sample())
+    streamed = {label: [] for label in BATCH_QUERIES}
+    for label, row in stream_batch_rows(SAMPLE_FILE):
+        streamed[label].append(row)
+    assert streamed == expected
+
+
+def test_iter_ready_chunks_holds_children_until_parents_are_written():
+    rows = [
+        ("Decision", {"id": "d1"}),
+        ("Recommendation", {"id": "r1"}),
+        ("Recommendation", {"id": "r2"}),
+        ("Clause", {"id": "c1"}),
+    ]
+    order = [label for label, _ in iter_ready_chunks(rows, chunk_size=1)]
+    assert order == ["Clause", "Recommendation", "Recommendation", "Decision"]
+
+
+def test_write_row_stream_matches_write_batches():
+    rows = build_batch_rows(load_sample())
+    batched, streamed = RecordingGraph(), RecordingGraph()
+
+    write_batches(batched, rows, chunk_size=4)
+    stats = write_row_stream(streamed, stream_batch_rows(SAMPLE_FILE), chunk_size=4)
+
+    assert streamed.calls == batched.calls
+    assert stats["Clause"]["round_trips"] == -(-len(rows["Clause"]) // 4)
+
+
+def test_select_files_skips_unchanged_and_reports_reloads(tmp_path):
+    files = []
+    for name in ("v1.json", "v2.json", "v3.json"):
+        path = tmp_path / name
+        path.write_text(json.dumps({"name": name}))
+        files.append(path)
+    loaded = {
+        manifest_key(files[0]): file_checksum(files[0]),
+        manifest_key(files[1]): "stale",
+    }
+
+    groups, skipped, reloaded = select_files({"m": files}, loaded)
+    assert (groups, skipped, reloaded) == ({"m": files[1:]}, 1, [files[1]])
+
+    groups, skipped, reloaded = select_files({"m": files}, loaded, force=True)
+    assert (groups, skipped, reloaded) == ({"m": files}, 0, files[:2])
+
+    assert select_files({"m": files[:1]}, loaded) == ({}, 1, [])
@@ -0,0 +1,54 @@
+from types import SimpleNamespace
+
+import pytest
+
+from analytics.benchmark import benchmark_query, load_report, percentile, run_benchmark, write_report
+
+
+class TimedGraph:
+    def __init__(self):
+        self.calls = 0
+
+    def ro_query(self, q, params=None):
+        self.calls += 1
+        # First execution compiles the plan; later ones hit the cache
+        return SimpleNamespace(result_set=[[1], [2]], run_time_ms=float(self.calls),
+                               cached_execution=self.calls > 1)
+
+
+def test_percentile_interpolates_linearly():
+    samples = [float(v) for v in range(1, 101)]
+
+    assert percentile(samples, 50) == pytest.approx(50.5)
+    assert percentile(samples, 95) == pytest.approx(95.05)
+    assert percentile(samples, 100) == 100.0
+    assert percentile([7.0], 99) == 7.0
+    assert percentile([], 50) == 0.0
+
+
+def test_benchmark_query_discards_warmup_runs():
+    graph = TimedGraph()
+    result = benchmark_query(graph, "q", "MATCH (n) RETURN n", warmup=3, repeat=10)
+
+    assert graph.calls == 13
+    assert result.client.count == result.server.count == 10
+    # Server samples come from the timed calls 4..13 only
+    assert result.server_samples_ms == [float(v) for v in range(4, 14)]
+    assert result.server.max_ms == 13.0
+    assert result.cached_ratio == 1.0
+    assert result.rows == 2
+    assert 0 <= result.client.p50_ms <= result.client.p95_ms <= result.client.p99_ms <= result.client.max_ms
+
+
+def test_benchmark_report_round_trips(tmp_path):
+    path = tmp_path / "reports" / "bench.json"
+    assert load_report(path) is None
+
+    results = run_benchmark(TimedGraph(), [{"name": "a", "query": "RETURN 1"}, {"name": "b", "query": "RETURN 2"}],
+                            warmup=0, repeat=5)
+    write_report(results, path, warmup=0, repeat=5, graph="g")
+    report = load_report(path)
+
+    assert [q["name"] for q in report["queries"]] == ["a", "b"]
+    assert report["repeat"] == 5 and report["graph"] == "g"
+    assert report["queries"][0]["server"]["p50_ms"] == 3.0
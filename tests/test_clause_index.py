@@ -0,0 +1,55 @@
+from analytics.clause_index import ClauseIndex, fulltext_query, tokenize
+
+CLAUSES = {
+    1: {"title": "Limitation of Liability", "category": "Liability and Risk",
+        "text_preview": "Aggregate liability shall not exceed the fees paid."},
+    2: {"title": "Payment Terms", "category": "Commercial",
+        "text_preview": "Invoices are payable within 30 days; no liability for late fees."},
+    3: {"title": "Indemnities", "category": "Liability and Risk", "text_preview": None},
+    4: {"title": "Data Protection", "category": "Data", "text_preview": "Personal data is processed lawfully."},
+}
+
+
+def test_search_ranks_matches_with_bm25_and_matches_word_prefixes():
+    index = ClauseIndex.from_nodes(CLAUSES)
+
+    ranked = index.search("liability")
+    assert [node_id for node_id, _ in ranked] == [1, 3, 2]
+    assert ranked[0][1] > ranked[1][1] > ranked[2][1] > 0
+
+    assert [node_id for node_id, _ in index.search("indemnit")] == [3]
+    assert {node_id for node_id, _ in index.search("data payment")} == {2, 4}
+    assert index.search("ability") == []
+    assert index.search("liability", limit=1) == ranked[:1]
+    assert index.candidates("LIAB") == {1, 2, 3}
+
+
+def test_sync_reindexes_only_changed_clauses():
+    index = ClauseIndex.from_nodes(CLAUSES)
+    updated = {**CLAUSES, 2: {**CLAUSES[2], "text_preview": "Invoices are payable within 30 days."}}
+    del updated[4]
+
+    assert index.sync(updated) == 2
+    assert index.sync(updated) == 0
+    assert 4 not in index and "protection" not in index.postings
+    assert [node_id for node_id, _ in index.search("liability")] == [1, 3]
+    assert index.total_length == sum(index.lengths.values())
+
+    fresh = ClauseIndex.from_nodes(updated)
+    assert index.search("liability") == fresh.search("liability")
+
+
+def test_copy_is_independent():
+    index = ClauseIndex.from_nodes(CLAUSES)
+    copy = index.copy()
+    copy.remove(1)
+
+    assert 1 in index and 1 not in copy
+    assert 1 in index.postings["limitation"]
+
+
+def test_fulltext_query_uses_the_same_prefixes():
+    assert tokenize("Non-Liability (cap)") == ["non", "liability", "cap"]
+    assert fulltext_query("Indemnit") == "indemnit*"
+    assert fulltext_query("IP, data") == "ip* | data*"
+    assert fulltext_query("a") == "a"
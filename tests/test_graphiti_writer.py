@@ -0,0 +1,199 @@
+import json
+import threading
+import time
+
+import pytest
+
+from scripts.ingest.graphiti_writer import WRITE_QUERIES, BulkGraphWriter
+from scripts.ingest.load_graphiti import (
+    GraphitiConfig,
+    ingest_payloads,
+    iter_json_payloads,
+    iter_matter_payloads,
+    matter_files,
+    summarize_payloads,
+    validate_and_count,
+)
+
+TS = "2025-01-15T10:00:00Z"
+
+
+def make_payload(n_clauses: int) -> dict:
+    return {
+        "documents": [{"doc_id": "doc", "matter_id": "m1", "title": "MSA"}],
+        "versions": [
+            {"version_id": "v1", "doc_id": "doc", "version_no": 1, "source": "counterparty", "ts": TS}
+        ],
+        "clauses": [
+            {
+                "clause_id": f"c{i}",
+                "canonical_clause_id": f"cc{i}",
+                "version_id": "v1",
+                "section_path": f"{i}",
+                "text": f"Clause {i}",
+                "playbook_flags": {"consent": True},
+            }
+            for i in range(n_clauses)
+        ],
+        "recommendations": [
+            {
+                "rec_id": "r0",
+                "clause_id": "c0",
+                "issue_type": "consent",
+                "severity": "high",
+                "suggested_action": "EDIT",
+                "ts": TS,
+            }
+        ],
+        "decisions": [
+            {
+                "decision_id": "d0",
+                "rec_id": "r0",
+                "clause_id": "c0",
+                "decision_type": "OVERRIDE",
+                "actor": "Attorney",
+                "ts": TS,
+            }
+        ],
+        "concessions": [
+            {
+                "concession_id": "x0",
+                "clause_id": "c0",
+                "decision_id": "d0",
+                "description": "Accepted cap",
+                "trigger": "counterparty_pressure",
+                "ts": TS,
+            }
+        ],
+    }
+
+
+class SlowGraph:
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def query(self, q, params=None):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+            self.calls.append((q, params))
+
+
+def test_writer_batches_per_label_and_caps_in_flight():
+    graph = SlowGraph()
+    writer = BulkGraphWriter(graph, batch_size=3, concurrency=2)
+    with writer:
+        writer.add_payload(make_payload(10))
+    throughput = writer.throughput()
+
+    assert throughput["Clause"].rows == 10
+    assert throughput["Clause"].batches == 4
+    assert graph.peak <= 2
+    assert all(len(params["rows"]) <= 3 for _, params in graph.calls)
+    clause_rows = [row for q, p in graph.calls if q == WRITE_QUERIES["Clause"] for row in p["rows"]]
+    assert clause_rows[0]["props"]["playbook_flags"] == '{"consent": true}'
+    assert "clause_name" not in clause_rows[0]["props"]
+
+
+def test_write_queries_merge_edges_from_schema():
+    assert "MERGE (n)-[:BELONGS_TO]->(o0)" in WRITE_QUERIES["Clause"]
+    assert "MERGE (o0)-[:HAS_VERSION]->(n)" in WRITE_QUERIES["DocVersion"]
+    assert "TRIGGERS_CONCESSION" in WRITE_QUERIES["Concession"]
+    assert "AFFECTS_CLAUSE" in WRITE_QUERIES["Concession"]
+
+
+def test_ingest_payloads_uses_injected_graph():
+    graph = SlowGraph(delay=0)
+    config = GraphitiConfig(host="localhost", port=6379, api_key=None)
+    payloads = [make_payload(2)]
+
+    assert ingest_payloads(payloads, config, dry_run=True, graph=graph) == {}
+    throughput = ingest_payloads(payloads, config, dry_run=False, batch_size=1, graph=graph)
+
+    assert set(throughput) == {
+        "Document", "DocVersion", "Clause", "AgentRecommendation", "UserDecision", "Concession"
+    }
+    assert summarize_payloads(payloads)["concessions"] == 1
+
+
+def test_writer_rejects_invalid_settings():
+    with pytest.raises(ValueError):
+        BulkGraphWriter(SlowGraph(), batch_size=0)
+
+
+def test_streamed_matter_dir_is_validated_and_counted(tmp_path):
+    (tmp_path / "bundle.json").write_text(json.dumps(make_payload(5)))
+    summary = summarize_payloads([])
+
+    blobs = list(validate_and_count(iter_json_payloads(tmp_path, batch_size=2), summary))
+
+    assert summary["clauses"] == 5
+    assert summary["concessions"] == 1
+    assert max(len(blob["clauses"]) for blob in blobs if "clauses" in blob) == 2
+
+
+class VersionSlowGraph:
+    """Earlier versions write slower, so only draining keeps them first."""
+
+    def __init__(self):
+        self.landed = []
+        self._lock = threading.Lock()
+
+    def query(self, q, params=None):
+        version = int(params["rows"][0]["props"]["version_id"][1:])
+        time.sleep(0.05 / version)
+        with self._lock:
+            self.landed.append(version)
+
+
+def test_matter_versions_land_in_version_order(tmp_path):
+    for version_no in (1, 2, 10):
+        payload = make_payload(4)
+        payload["versions"][0].update(version_id=f"v{version_no}", version_no=version_no)
+        for clause in payload["clauses"]:
+            clause.update(clause_id=f"v{version_no}-{clause['clause_id']}", version_id=f"v{version_no}")
+        bundle = {key: payload[key] for key in ("versions", "clauses")}
+        (tmp_path / f"matter_v{version_no}.json").write_text(json.dumps(bundle))
+
+    assert [path.name for path in matter_files(tmp_path)] == ["matter_v1.json", "matter_v2.json", "matter_v10.json"]
+
+    graph = VersionSlowGraph()
+    config = GraphitiConfig(host="localhost", port=6379, api_key=None)
+    payloads = iter_matter_payloads(tmp_path, 2, summarize_payloads([]), [], file_breaks=True)
+    ingest_payloads(payloads, config, dry_run=False, batch_size=2, concurrency=4, graph=graph)
+
+    assert len(graph.landed) == 9
+    assert graph.landed == sorted(graph.landed)
+
+
+class FailingGraph(SlowGraph):
+    def query(self, q, params=None):
+        super().query(q, params)
+        raise RuntimeError("write failed")
+
+
+def test_failed_batch_surfaces_on_the_next_submit():
+    graph = FailingGraph(delay=0)
+    payload = make_payload(10)
+    writer = BulkGraphWriter(graph, batch_size=1, concurrency=1)
+
+    with pytest.raises(RuntimeError, match="write failed"):
+        with writer:
+            writer.add_payload(payload)
+
+    assert len(graph.calls) < 10
+
+
+def test_writer_forgets_landed_batches():
+    writer = BulkGraphWriter(SlowGraph(delay=0), batch_size=1, concurrency=2)
+    with writer:
+        writer.add_payload(make_payload(50))
+        assert len(writer._futures) < 10
+    assert writer._futures == []
@@ -0,0 +1,56 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from scripts.ingest.json_stream import iter_members, iter_payload_batches, read_member
+
+SAMPLE_FILE = Path("data/ground_truth/synthetic/matter_001_v1.json")
+
+
+def rebuild(members):
+    data = {}
+    for key, value, in_array in members:
+        if in_array:
+            data.setdefault(key, []).append(value)
+        else:
+            data[key] = value
+    return data
+
+
+@pytest.mark.parametrize("read_size", [1, 7, 4096])
+def test_iter_members_matches_json_load(read_size):
+    expected = json.loads(SAMPLE_FILE.read_text())
+    actual = rebuild(iter_members(SAMPLE_FILE, read_size=read_size))
+    expected_non_empty = {k: v for k, v in expected.items() if v != []}
+    assert actual == expected_non_empty
+
+
+def test_numbers_split_across_reads_are_not_truncated():
+    source = io.StringIO('{"version": 12345, "items": [1.5e3, -42, true, null]}')
+    members = list(iter_members(source, read_size=2))
+    assert members == [
+        ("version", 12345, False),
+        ("items", 1500.0, True),
+        ("items", -42, True),
+        ("items", True, True),
+        ("items", None, True),
+    ]
+
+
+def test_payload_batches_are_bounded():
+    blobs = list(iter_payload_batches(SAMPLE_FILE, batch_size=3))
+    clause_blobs = [blob["clauses"] for blob in blobs if "clauses" in blob]
+    expected = json.loads(SAMPLE_FILE.read_text())["clauses"]
+
+    assert all(len(batch) <= 3 for batch in clause_blobs)
+    assert [c for batch in clause_blobs for c in batch] == expected
+    assert read_member(SAMPLE_FILE, "matter_id") == "matter_001"
+
+
+def test_malformed_input_raises():
+    with pytest.raises(ValueError):
+        list(iter_members(io.StringIO('["not", "an", "object"]')))
+    with pytest.raises(ValueError):
+        list(iter_members(io.StringIO('{"clauses": [{"a": 1}')))
@@ -0,0 +1,258 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+from analytics.kpi_engine import (
+    APPLIED_RECOMMENDATIONS_QUERY,
+    CLAUSE_GROUPS_QUERY,
+    ELEMENT_COUNTS_QUERY,
+    LATEST_ISSUE_VERSIONS_QUERY,
+    MATTER_IDS_QUERY,
+    GraphSource,
+    SnapshotSource,
+    clause_linkage,
+    handover_completeness,
+    recommendation_suppression,
+)
+from analytics.snapshot import GraphSnapshot
+
+MATTER_FILES = sorted(Path("data/ground_truth/synthetic").glob("*.json"))
+
+
+def ground_truth_snapshot():
+    return GraphSnapshot.from_matter_files(MATTER_FILES)
+
+
+def clauses(snapshot):
+    return [props for _, props in snapshot.iter_nodes("Clause")]
+
+
+def naive_clause_linkage(snapshot):
+    """The original per-matter / per-clause loops and Clause x Clause self-join."""
+    matter_ids = sorted({props["matter_id"] for _, props in snapshot.iter_nodes("Matter")})
+    tp, details = 0, []
+    for matter_id in matter_ids:
+        numbers = sorted({c["clause_number"] for c in clauses(snapshot) if c["matter_id"] == matter_id})
+        for number in numbers:
+            found = sum(1 for c in clauses(snapshot)
+                        if c["matter_id"] == matter_id and c["clause_number"] == number)
+            if found > 1:
+                tp += found - 1
+            details.append((matter_id, number, found))
+    mismatches = {
+        (c1["matter_id"], c1["clause_number"], c1["title"], c2["title"])
+        for c1 in clauses(snapshot) for c2 in clauses(snapshot)
+        if c1["matter_id"] == c2["matter_id"] and c1["clause_number"] == c2["clause_number"]
+        and c1["version"] != c2["version"] and c1["title"] != c2["title"]
+    }
+    return tp, len(mismatches), details
+
+
+def test_clause_linkage_matches_naive_loops():
+    snapshot = ground_truth_snapshot()
+    # Retitle one clause so the false-positive path is exercised
+    clause = next(props for _, props in snapshot.iter_nodes("Clause") if props["version"] == 2)
+    clause["title"] = "Renamed"
+
+    result = clause_linkage(SnapshotSource(snapshot))
+    tp, fp, details = naive_clause_linkage(snapshot)
+
+    assert result["true_positives"] == tp
+    assert result["false_positives"] == fp > 0
+    assert [(d["matter_id"], d["clause_number"], d["versions_found"]) for d in result["linkage_details"]] == details
+
+
+def test_clause_linkage_ignores_clauses_without_matter_for_true_positives():
+    snapshot = GraphSnapshot(
+        nodes={
+            "Matter": {1: {"matter_id": "m1", "version": 1}},
+            "Clause": {
+                2: {"matter_id": "m1", "clause_number": "1", "version": 1, "title": "A"},
+                3: {"matter_id": "m1", "clause_number": "1", "version": 2, "title": "B"},
+                4: {"matter_id": "orphan", "clause_number": "1", "version": 1, "title": "A"},
+                5: {"matter_id": "orphan", "clause_number": "1", "version": 2, "title": "A"},
+            },
+        },
+        edges={},
+    )
+    result = clause_linkage(SnapshotSource(snapshot))
+
+    assert result["true_positives"] == 1
+    assert result["false_positives"] == 2  # (A, B) and (B, A) in m1
+    assert result["linked_clauses"] == 1
+
+
+def recommendation_paths(snapshot):
+    for clause_id, clause in snapshot.iter_nodes("Clause"):
+        for rec_id in snapshot.targets("HAS_RECOMMENDATION", clause_id):
+            yield clause, rec_id, snapshot.node("Recommendation", rec_id)
+
+
+def naive_recommendation_suppression(snapshot):
+    """The original applied-decision loop with one later-versions lookup each."""
+    matter_ids = sorted({props["matter_id"] for _, props in snapshot.iter_nodes("Matter")})
+    rows = []
+    for matter_id in matter_ids:
+        applied = [
+            (clause, rec)
+            for clause, rec_id, rec in recommendation_paths(snapshot) if clause["matter_id"] == matter_id
+            for decision_id in snapshot.targets("HAS_DECISION", rec_id)
+            if snapshot.node("Decision", decision_id)["decision_type"] == "apply"
+        ]
+        applied.sort(key=lambda pair: (pair[0]["clause_number"], pair[0]["version"]))
+        for clause, rec in applied:
+            repeated = any(
+                later["matter_id"] == matter_id and later["clause_number"] == clause["clause_number"]
+                and later["version"] > clause["version"] and later_rec["issue_type"] == rec["issue_type"]
+                for later, _, later_rec in recommendation_paths(snapshot)
+            )
+            rows.append((matter_id, clause["clause_number"], clause["version"], rec["issue_type"], repeated))
+    return rows
+
+
+def test_recommendation_suppression_matches_naive_loops():
+    snapshot = ground_truth_snapshot()
+    # Re-raise one applied issue on a later version so both outcomes occur
+    applied_rec, later_rec = next(
+        (rec, later_rec)
+        for clause, rec_id, rec in recommendation_paths(snapshot)
+        for decision_id in snapshot.targets("HAS_DECISION", rec_id)
+        if snapshot.node("Decision", decision_id)["decision_type"] == "apply"
+        for later, _, later_rec in recommendation_paths(snapshot)
+        if later["matter_id"] == clause["matter_id"]
+        and later["clause_number"] == clause["clause_number"]
+        and later["version"] > clause["version"]
+    )
+    later_rec["issue_type"] = applied_rec["issue_type"]
+
+    result = recommendation_suppression(SnapshotSource(snapshot))
+    expected = naive_recommendation_suppression(snapshot)
+
+    assert [
+        (d["matter_id"], d["clause_number"], d["version"], d["issue_type"], d["repeated_in_later_versions"])
+        for d in result["suppression_details"]
+    ] == expected
+    assert result["applied_recommendations"] == len(expected)
+    assert result["repeated"] == sum(1 for row in expected if row[-1]) > 0
+    assert result["not_repeated"] == sum(1 for row in expected if not row[-1]) > 0
+
+
+def test_recommendation_suppression_never_repeats_on_null_keys():
+    snapshot = GraphSnapshot(
+        nodes={
+            "Matter": {1: {"matter_id": "m1"}},
+            "Clause": {
+                2: {"matter_id": "m1", "clause_number": "1", "version": 1},
+                3: {"matter_id": "m1", "clause_number": "1", "version": 2},
+            },
+            "Recommendation": {4: {"issue_type": None}, 5: {"issue_type": None}},
+            "Decision": {6: {"decision_type": "apply"}},
+        },
+        edges={"HAS_RECOMMENDATION": [(2, 4), (3, 5)], "HAS_DECISION": [(4, 6)]},
+    )
+    result = recommendation_suppression(SnapshotSource(snapshot))
+
+    assert result["applied_recommendations"] == 1
+    assert result["repeated"] == 0
+
+
+def naive_handover_completeness(snapshot):
+    """The original per-version query: the OPTIONAL MATCH chain, then distinct counts."""
+    versions = sorted((props["matter_id"], props["version"]) for _, props in snapshot.iter_nodes("Matter"))
+    scores = []
+    for matter_id, version in versions:
+        matters = [m for m, props in snapshot.iter_nodes("Matter")
+                   if props["matter_id"] == matter_id and props["version"] == version]
+        parties = [p for p, props in snapshot.iter_nodes("Party") if props["matter_id"] == matter_id]
+        rows = [
+            (m, p, c, r, d, con)
+            for m in matters
+            for p in parties or [None]
+            for c in [c for c, props in snapshot.iter_nodes("Clause")
+                      if props["matter_id"] == matter_id and props["version"] == version] or [None]
+            for r in (snapshot.targets("HAS_RECOMMENDATION", c) if c is not None else []) or [None]
+            for d in (snapshot.targets("HAS_DECISION", r) if r is not None else []) or [None]
+            for con in (snapshot.targets("RESULTED_IN_CONCESSION", d) if d is not None else []) or [None]
+        ]
+        counts = [len({row[i] for row in rows} - {None}) for i in range(6)]
+        present = (counts[0] > 0) + (counts[1] >= 2) + (counts[2] > 0) + 3
+        scores.append((matter_id, version, present / 6, counts))
+    return scores
+
+
+def test_handover_completeness_matches_naive_query():
+    snapshot = ground_truth_snapshot()
+    # One matter left with a single party, and one duplicated Matter node
+    party_ids = [pid for pid, props in snapshot.iter_nodes("Party") if props["matter_id"] == "matter_001"]
+    for party_id in party_ids[1:]:
+        del snapshot.nodes["Party"][party_id]
+    snapshot.nodes["Matter"][10_000] = dict(next(props for _, props in snapshot.iter_nodes("Matter")))
+
+    result = handover_completeness(SnapshotSource(snapshot))
+    expected = naive_handover_completeness(snapshot)
+
+    assert [
+        (s["matter_id"], s["version"], s["completeness"], list(s["elements"].values()))
+        for s in result["completeness_scores"]
+    ] == expected
+    assert result["versions_measured"] == len(expected) == 13
+    assert any(score < 1 for _, _, score, _ in expected)
+    assert result["average_completeness"] == sum(score for _, _, score, _ in expected) / len(expected)
+
+
+def test_handover_completeness_scores_null_keys_on_zero_counts():
+    snapshot = GraphSnapshot(
+        nodes={
+            "Matter": {1: {"matter_id": "m1", "version": None}},
+            "Party": {2: {"matter_id": "m1"}, 3: {"matter_id": "m1"}},
+            "Clause": {4: {"matter_id": "m1", "version": None}},
+        },
+        edges={},
+    )
+    score = handover_completeness(SnapshotSource(snapshot))["completeness_scores"][0]
+
+    assert set(score["elements"].values()) == {0}
+    assert score["completeness"] == 0.5
+
+
+class SnapshotBackedGraph:
+    """Answers the engine's grouped queries from a snapshot, counting round trips."""
+
+    def __init__(self, snapshot):
+        self.local = SnapshotSource(snapshot)
+        self.queries = []
+
+    def ro_query(self, q, params=None):
+        self.queries.append(q)
+        rows = {
+            MATTER_IDS_QUERY: lambda: [[m] for m in self.local.matter_ids()],
+            CLAUSE_GROUPS_QUERY: lambda: [list(row) for row in self.local.clause_groups()],
+            APPLIED_RECOMMENDATIONS_QUERY: lambda: [list(row) for row in self.local.applied_recommendations()],
+            LATEST_ISSUE_VERSIONS_QUERY: lambda: [list(row) for row in self.local.latest_issue_versions()],
+            ELEMENT_COUNTS_QUERY: lambda: [list(row) for row in self.local.element_counts()],
+        }[q]()
+        return SimpleNamespace(result_set=rows)
+
+
+def test_graph_source_uses_one_round_trip_per_fetch():
+    snapshot = ground_truth_snapshot()
+    graph = SnapshotBackedGraph(snapshot)
+
+    assert clause_linkage(GraphSource(graph)) == clause_linkage(SnapshotSource(snapshot))
+    assert len(graph.queries) == 2
+
+    graph.queries.clear()
+    assert recommendation_suppression(GraphSource(graph)) == recommendation_suppression(SnapshotSource(snapshot))
+    assert len(graph.queries) == 3
+
+    graph.queries.clear()
+    assert handover_completeness(GraphSource(graph)) == handover_completeness(SnapshotSource(snapshot))
+    assert len(graph.queries) == 1
+
+
+def test_snapshot_round_trips_through_json(tmp_path):
+    snapshot = ground_truth_snapshot()
+    snapshot.save(tmp_path / "snap.json")
+    loaded = GraphSnapshot.load(tmp_path / "snap.json")
+
+    assert loaded.nodes == snapshot.nodes
+    assert loaded.edges == snapshot.edges
@@ -0,0 +1,72 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from analytics.kpi_queries import build_queries
+from analytics.kpi_runner import execute_query, missing_parameters, result_bytes, stream_executions
+
+
+class RecordingGraph:
+    def __init__(self):
+        self.calls = []
+
+    def ro_query(self, q, params=None):
+        self.calls.append((q, params))
+        if "ReviewSession" in q:
+            raise RuntimeError("unknown label")
+        return SimpleNamespace(result_set=[["v1", "1.1"], ["v2", "1.1"]], run_time_ms=0.25, cached_execution=True)
+
+
+def queries(**params):
+    return {q.name: q for q in build_queries({"since": "2025-01-01T00:00:00", **params})}
+
+
+def test_execute_query_records_latency_rows_and_bytes():
+    record = execute_query(RecordingGraph(), queries()["outstanding_recommendations"], iteration=2)
+
+    assert record["status"] == "ok"
+    assert record["iteration"] == 2
+    assert record["rows"] == 2
+    assert record["bytes"] == result_bytes([["v1", "1.1"], ["v2", "1.1"]])
+    assert record["server_ms"] == 0.25 and record["cached"] is True
+    assert record["latency_ms"] >= 0
+
+
+def test_execute_query_skips_missing_parameters_and_records_errors():
+    graph = RecordingGraph()
+    by_name = queries(session_id="s1")
+
+    skipped = execute_query(graph, by_name["clause_lineage"])
+    failed = execute_query(graph, by_name["handover_snapshot"])
+
+    assert missing_parameters(by_name["clause_lineage"]) == ["canonical_clause_id"]
+    assert skipped["status"] == "skipped" and "canonical_clause_id" in skipped["error"]
+    assert failed["status"] == "error" and failed["error"] == "RuntimeError: unknown label"
+    assert [params for _, params in graph.calls] == [{"session_id": "s1"}]
+
+
+def test_stream_executions_repeats_each_query_with_a_graph_per_thread():
+    graphs = []
+    lock = threading.Lock()
+
+    def connect():
+        graph = RecordingGraph()
+        with lock:
+            graphs.append(graph)
+        return graph
+
+    selected = [queries()["outstanding_recommendations"], queries()["concession_trail"]]
+    records = list(stream_executions(connect, selected, repeat=5, concurrency=3))
+
+    assert len(records) == 10
+    assert sorted((r["query"], r["iteration"]) for r in records) == sorted(
+        (q.name, i) for q in selected for i in range(5)
+    )
+    assert 1 <= len(graphs) <= 3
+    assert sum(len(g.calls) for g in graphs) == 10
+    assert all(params == {"since": "2025-01-01T00:00:00"} for g in graphs for q, params in g.calls
+               if "Concession" in q)
+
+    with pytest.raises(ValueError):
+        list(stream_executions(connect, selected, repeat=0))
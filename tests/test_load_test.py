@@ -0,0 +1,119 @@
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from analytics.load_test import build_mix, run_level, run_load_test, summarize_level, write_report
+
+
+class FakeNL:
+    def execute_query(self, question):
+        time.sleep(0.001)
+        return {"success": question != "unknown"}
+
+
+class FakeGraph:
+    def ro_query(self, q, params=None):
+        time.sleep(0.001)
+        if "BROKEN" in q:
+            raise RuntimeError("syntax error")
+        return SimpleNamespace(result_set=[])
+
+
+def factory(connections=None):
+    def connect():
+        if connections is not None:
+            connections.append(threading.get_ident())
+        return SimpleNamespace(nl=FakeNL(), graph=FakeGraph())
+    return connect
+
+
+def test_build_mix_splits_weights_by_share():
+    ops = build_mix(["a", "b"], [{"name": "k", "query": "RETURN 1"}], nl_share=0.6)
+
+    assert [(op.kind, op.weight) for op in ops] == [("nl", 0.3), ("nl", 0.3), ("kpi", pytest.approx(0.4))]
+    with pytest.raises(ValueError):
+        build_mix(["a"], [], nl_share=1.5)
+
+
+def test_run_level_counts_requests_errors_and_connections():
+    ops = build_mix(["fine", "unknown"], [{"name": "broken", "query": "BROKEN"}], nl_share=0.5)
+    connections = []
+
+    result = run_level(factory(connections), ops, concurrency=4, requests_per_client=25, seed=1)
+
+    assert len(set(connections)) == len(connections) == 4
+    assert result.requests == 100
+    assert result.errors == result.by_operation["unknown"].errors + result.by_operation["broken"].errors
+    assert result.by_operation["fine"].errors == 0
+    assert 0 < result.error_rate < 1
+    assert result.throughput_rps > 0
+    assert dict(result.top_errors)["RuntimeError: syntax error"] == result.by_operation["broken"].requests
+    assert set(result.by_kind) == {"nl", "kpi"}
+
+
+def test_run_level_records_connection_failures():
+    def refuse():
+        raise ConnectionError("refused")
+
+    result = run_level(refuse, build_mix(["fine"], [], nl_share=1.0), concurrency=3, requests_per_client=5)
+
+    assert result.requests == result.errors == 3
+    assert result.top_errors == [["ConnectionError: refused", 3]]
+
+
+def test_run_level_closes_each_client_when_its_loop_finishes():
+    closed = []
+
+    def connect():
+        client = SimpleNamespace(nl=FakeNL(), graph=FakeGraph())
+        client.close = lambda: closed.append(client)
+        return client
+
+    result = run_level(connect, build_mix(["fine"], [], nl_share=1.0), concurrency=3, requests_per_client=2)
+
+    assert result.requests == 6
+    assert len(closed) == len({id(client) for client in closed}) == 3
+
+
+def test_run_level_duration_mode_and_validation():
+    ops = build_mix(["fine"], [], nl_share=1.0)
+    result = run_level(factory(), ops, concurrency=2, duration=0.05)
+
+    assert result.requests > 0 and result.errors == 0
+    with pytest.raises(ValueError):
+        run_level(factory(), ops, concurrency=1)
+
+
+def test_duration_mode_sets_the_deadline_before_releasing_clients():
+    ops = build_mix(["fine"], [], nl_share=1.0)
+    connect = factory()
+    failures = []
+    hook = threading.excepthook
+    threading.excepthook = failures.append
+
+    def slow_connect():
+        time.sleep(0.02)
+        return connect()
+
+    try:
+        results = [run_level(slow_connect, ops, concurrency=6, duration=0.02) for _ in range(5)]
+    finally:
+        threading.excepthook = hook
+
+    assert failures == []
+    assert all(result.requests >= 6 and result.errors == 0 for result in results)
+
+
+def test_load_test_report_has_one_entry_per_level(tmp_path):
+    ops = build_mix(["fine"], [{"name": "k", "query": "RETURN 1"}])
+    seen = []
+    results = run_load_test(factory(), ops, levels=[1, 3], requests_per_client=4, on_level=seen.append)
+    report = write_report(results, ops, tmp_path / "load.json", graph="g")
+
+    assert [r.concurrency for r in seen] == [1, 3]
+    assert json.loads((tmp_path / "load.json").read_text()) == report
+    assert [level["requests"] for level in report["levels"]] == [4, 12]
+    assert summarize_level(1, [], 0.0).throughput_rps == 0.0
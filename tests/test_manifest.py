@@ -0,0 +1,98 @@
+import json
+from types import SimpleNamespace
+
+from conftest import KeyValueGraph
+from graphdb import read_epoch
+from scripts.ingest import load_graphiti
+from scripts.ingest.manifest import (
+    EPISODE_CHECKSUMS_QUERY,
+    EPISODE_QUERY,
+    FileManifest,
+    IngestRecord,
+    file_checksum,
+    manifest_key,
+)
+
+
+class EpisodeGraph(KeyValueGraph):
+    """Records writes and answers the ingestion-episode checksum lookup."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+        self.episodes = {}
+
+    def query(self, q, params=None):
+        self.calls.append((q, params))
+        if q == EPISODE_QUERY:
+            self.episodes[params["episode_id"]] = params["props"]
+        if q == EPISODE_CHECKSUMS_QUERY:
+            return SimpleNamespace(result_set=[[props["checksum"]] for props in self.episodes.values()])
+        return SimpleNamespace(result_set=[])
+
+
+def write_bundle(path, version_no=1):
+    path.write_text(json.dumps({
+        "versions": [{
+            "version_id": f"v{version_no}",
+            "doc_id": "doc",
+            "version_no": version_no,
+            "source": "counterparty",
+            "ts": "2025-01-15T10:00:00Z",
+        }],
+    }))
+
+
+def run_matter(matter_dir, graph, manifest):
+    config = load_graphiti.GraphitiConfig(host="localhost", port=6379, api_key=None)
+    skip = manifest.ingested_files(config.graph_name, graph)
+    result = load_graphiti.ingest_matter_dir(matter_dir, config, False, 10, 1, None, skip)
+    for record in result.detail["ingested"]:
+        manifest.mark_ingested(record, config.graph_name)
+    return result
+
+
+def test_unchanged_files_are_skipped_and_changed_ones_reloaded(tmp_path, monkeypatch):
+    graph = EpisodeGraph()
+    monkeypatch.setattr(load_graphiti, "connect_graph", lambda config: graph)
+    matter_dir = tmp_path / "matter_001"
+    matter_dir.mkdir()
+    write_bundle(matter_dir / "v1.json", 1)
+    manifest = FileManifest.load(tmp_path / "manifest.json")
+
+    first = run_matter(matter_dir, graph, manifest)
+    assert first.files == 1
+    record = first.detail["ingested"][0]
+    assert (record.matter_id, record.version) == ("matter_001", 1)
+
+    episode = graph.episodes[f"ingestion:{record.checksum}"]
+    assert episode["episode_type"] == "ingestion_event"
+    assert episode["checksum"] == file_checksum(matter_dir / "v1.json")
+    assert episode["ingestion_time"] == record.ingested_at.replace("+00:00", "Z")
+
+    manifest.save()
+    manifest = FileManifest.load(tmp_path / "manifest.json")
+    entry = manifest.entries[manifest_key(matter_dir / "v1.json")]
+    assert entry.ingested[load_graphiti.GraphitiConfig.graph_name] == record.ingested_at
+
+    assert read_epoch(graph) == 1
+
+    second = run_matter(matter_dir, graph, manifest)
+    assert second.files == 0
+    assert read_epoch(graph) == 1
+    assert second.detail["skipped"] == [manifest_key(matter_dir / "v1.json")]
+
+    write_bundle(matter_dir / "v1.json", 2)
+    third = run_matter(matter_dir, graph, manifest)
+    assert third.files == 1
+    assert third.detail["ingested"][0].version == 2
+    assert read_epoch(graph) == 2
+
+
+def test_files_missing_from_the_graph_are_not_skipped(tmp_path):
+    manifest = FileManifest.load(tmp_path / "manifest.json")
+    manifest.mark_ingested(IngestRecord(key="a.json", checksum="abc"), "g")
+
+    assert manifest.ingested_files("g") == {"a.json": "abc"}
+    assert manifest.ingested_files("g", EpisodeGraph()) == {}
+    assert manifest.ingested_files("other") == {}
@@ -0,0 +1,135 @@
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from analytics import kpi_engine
+from analytics.kpi_engine import SnapshotSource
+from analytics.snapshot import GraphSnapshot
+from scripts import measure_kpis
+from scripts.measure_kpis import (
+    KPI5_QUERIES,
+    KPI_METHODS,
+    KPIMeasurement,
+    SectionOutput,
+    runnable_kpi5_queries,
+)
+
+MATTER_FILES = sorted(Path("data/ground_truth/synthetic").glob("*.json"))
+SNAPSHOT = GraphSnapshot.from_matter_files(MATTER_FILES)
+
+
+class SnapshotGraph:
+    """Answers the set-based KPI fetches from a snapshot; everything else is empty."""
+
+    def __init__(self):
+        local = SnapshotSource(SNAPSHOT)
+        self.rows = {
+            kpi_engine.MATTER_IDS_QUERY: lambda: [[m] for m in local.matter_ids()],
+            kpi_engine.CLAUSE_GROUPS_QUERY: local.clause_groups,
+            kpi_engine.APPLIED_RECOMMENDATIONS_QUERY: local.applied_recommendations,
+            kpi_engine.LATEST_ISSUE_VERSIONS_QUERY: local.latest_issue_versions,
+            kpi_engine.ELEMENT_COUNTS_QUERY: local.element_counts,
+        }
+
+    def ro_query(self, q, params=None):
+        time.sleep(0.01)
+        rows = self.rows.get(q, list)()
+        return SimpleNamespace(result_set=[list(row) for row in rows], cached_execution=False, run_time_ms=1.0)
+
+    def query(self, q, params=None):
+        time.sleep(0.01)
+        return SimpleNamespace(result_set=[], cached_execution=False, run_time_ms=1.0)
+
+
+class FakeFalkorDB:
+    instances = []
+
+    def __init__(self, host=None, port=None):
+        self.graph = SnapshotGraph()
+        FakeFalkorDB.instances.append(self)
+
+    def select_graph(self, name):
+        return self.graph
+
+
+def test_section_output_buffers_per_thread():
+    stream = SimpleNamespace(lines=[])
+    stream.write = stream.lines.append
+    output = SectionOutput(stream)
+    captured = {}
+
+    def worker(name):
+        with output.capture() as buffer:
+            for i in range(50):
+                output.write(f"{name}{i}\n")
+            captured[name] = buffer.getvalue()
+
+    threads = [threading.Thread(target=worker, args=(name,)) for name in "ab"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    output.write("direct\n")
+
+    assert captured["a"] == "".join(f"a{i}\n" for i in range(50))
+    assert captured["b"] == "".join(f"b{i}\n" for i in range(50))
+    assert stream.lines == ["direct\n"]
+
+
+def test_concurrent_report_matches_sequential(monkeypatch, tmp_path, capsys):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(measure_kpis, "FalkorDB", FakeFalkorDB)
+
+    sequential = KPIMeasurement(warmup=1, repeat=2).generate_report()
+    sequential_out = capsys.readouterr().out
+
+    FakeFalkorDB.instances.clear()
+    measurement = KPIMeasurement(warmup=1, repeat=2)
+    concurrent = measurement.generate_report(concurrent=True)
+    concurrent_out = capsys.readouterr().out
+
+    # One connection for the report plus at most one per worker thread
+    assert 2 <= len(FakeFalkorDB.instances) <= 1 + len(KPI_METHODS)
+    assert not isinstance(sys.stdout, SectionOutput)
+
+    for key, field in (("clause_linkage", "actual_precision"),
+                       ("recommendation_adherence", "actual"),
+                       ("handover_completeness", "actual")):
+        assert concurrent["kpis"][key][field] == sequential["kpis"][key][field]
+
+    # Sections come out whole and in report order
+    headers = [line for line in concurrent_out.splitlines() if line.startswith("KPI #")]
+    assert headers == [line for line in sequential_out.splitlines() if line.startswith("KPI #")]
+    assert len(headers) == len(KPI_METHODS)
+
+    timings = concurrent["timings"]
+    assert timings["mode"] == "concurrent"
+    assert set(timings["kpi_wall_ms"]) == {key for key, _ in KPI_METHODS}
+    assert timings["total_wall_ms"] < sum(timings["kpi_wall_ms"].values())
+    assert measurement.graph.cache_report()
+    assert json.loads((tmp_path / "data/reports/kpi_report.json").read_text())["timings"]["mode"] == "concurrent"
+
+
+class IndexGraph:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def query(self, q, params=None):
+        assert q == "CALL db.indexes()"
+        return SimpleNamespace(result_set=self.rows)
+
+
+def test_precedent_search_falls_back_to_a_scan_without_its_fulltext_index():
+    by_name = {test["name"]: test for test in runnable_kpi5_queries(IndexGraph([]))}
+    precedent = by_name["Cross-Matter Precedent Search"]
+    assert precedent["index_missing"]
+    assert "db.idx.fulltext" not in precedent["query"]
+    assert "CONTAINS 'Liability'" in precedent["query"]
+    assert sum(bool(test.get("index_missing")) for test in by_name.values()) == 1
+
+    indexed = IndexGraph([["Clause", ["title", "category", "text_preview"],
+                           {"title": ["FULLTEXT"], "category": ["FULLTEXT"], "text_preview": ["FULLTEXT"]}]])
+    assert runnable_kpi5_queries(indexed) == KPI5_QUERIES
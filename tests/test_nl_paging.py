@@ -0,0 +1,67 @@
+import pytest
+
+from scripts.nl_paging import (
+    Cursor,
+    Page,
+    decode_token,
+    encode_token,
+    keyset_key_count,
+    keyset_query,
+    node_key,
+)
+
+
+def test_keyset_query_orders_filters_and_limits_by_the_keys():
+    query = keyset_query(
+        """
+        MATCH (c:Clause)
+        OPTIONAL MATCH (c)-[:HAS_RECOMMENDATION]->(r:Recommendation)
+        """,
+        [("c.title", "title"), ("r.classification", "recommendation")],
+        ["coalesce(c.title, '')", node_key("r")],
+        distinct=True,
+    )
+
+    assert query.splitlines() == [
+        "MATCH (c:Clause)",
+        "OPTIONAL MATCH (c)-[:HAS_RECOMMENDATION]->(r:Recommendation)",
+        "WITH DISTINCT c.title AS title, r.classification AS recommendation, coalesce(c.title, '') AS _k0, "
+        "CASE WHEN r IS NULL THEN -1 ELSE ID(r) END AS _k1",
+        "WHERE $after_0 IS NULL OR _k0 > $after_0 OR (_k0 = $after_0 AND (_k1 > $after_1))",
+        "RETURN title, recommendation, _k0, _k1",
+        "ORDER BY _k0, _k1",
+        "LIMIT $limit",
+    ]
+    assert keyset_key_count(query) == 2
+    assert keyset_key_count("MATCH (n) RETURN n") == 0
+
+
+def test_tokens_round_trip_and_are_bound_to_the_question():
+    token = encode_token("clause_search", {"keyword": "liability"}, Cursor(25, ["matter_001", 2]))
+
+    cursor = decode_token(token, "clause_search", {"keyword": "liability"})
+    assert (cursor.offset, cursor.after) == (25, ["matter_001", 2])
+    assert decode_token(None, "clause_search", {}).after is None
+
+    with pytest.raises(ValueError, match="different question"):
+        decode_token(token, "clause_search", {"keyword": "payment"})
+    with pytest.raises(ValueError, match="malformed"):
+        decode_token("not-a-token", "clause_search", {"keyword": "liability"})
+
+
+def test_first_page_cursor_sends_null_keys_and_one_extra_row():
+    assert Cursor(0).query_params(2, 10) == {"after_0": None, "after_1": None, "limit": 11}
+
+
+def test_page_strips_key_columns_and_continues_after_the_last_row():
+    rows = [["a", "x", 1], ["b", "y", 2], ["c", "z", 3]]
+
+    page = Page(rows, key_count=1, page_size=2, cursor=Cursor(4, [0]))
+
+    assert list(page) == [["a", "x"], ["b", "y"]]
+    assert page.count == 2
+    assert page.has_more
+    next_cursor = page.next_cursor()
+    assert (next_cursor.offset, next_cursor.after) == (6, [2])
+
+    assert Page(rows[:2], key_count=1, page_size=2, cursor=Cursor(0)).next_cursor() is None
@@ -0,0 +1,257 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+from conftest import KeyValueGraph
+from graphdb import bump_epoch
+from graphdb.summary import GRAPH_SUMMARY_QUERY
+from scripts import nl_query
+from scripts.nl_paging import keyset_key_count
+
+
+class RedisGraph(KeyValueGraph):
+    """Key/value graph handle that also answers read queries.
+
+    Keyset queries are answered like FalkorDB would: ``rows`` carry their key
+    columns last and are sorted, filtered after the cursor and limited.
+    """
+
+    def __init__(self, rows=None):
+        super().__init__()
+        self.queries = 0
+        self.rows = rows or []
+
+    def ro_query(self, q, params=None):
+        self.queries += 1
+        rows = list(self.rows)
+        key_count = keyset_key_count(q)
+        if key_count:
+            after = [params[f"after_{i}"] for i in range(key_count)]
+            rows = sorted(rows, key=lambda row: row[-key_count:])
+            if after[0] is not None:
+                rows = [row for row in rows if row[-key_count:] > after]
+            rows = rows[:params["limit"]]
+        return SimpleNamespace(result_set=rows, cached_execution=False, run_time_ms=0.1)
+
+
+class AsyncRedisGraph:
+    """falkordb.asyncio-style view of a RedisGraph."""
+
+    def __init__(self, graph):
+        self.sync = graph
+        self.name = graph.name
+        self.closed = False
+        self.client = SimpleNamespace(connection=SimpleNamespace(connection_pool=self))
+
+    async def disconnect(self):
+        self.closed = True
+
+    async def execute_command(self, *args):
+        return self.sync.execute_command(*args)
+
+    async def ro_query(self, q, params=None, timeout=None):
+        return self.sync.ro_query(q, params)
+
+
+def connect(monkeypatch, graph, **kwargs):
+    """NaturalLanguageQueryInterface whose sync and async handles both talk to ``graph``."""
+    monkeypatch.setattr(nl_query, "FalkorDB", lambda host, port: SimpleNamespace(select_graph=lambda name: graph))
+    async_graph = kwargs.pop("async_graph", None) or AsyncRedisGraph(graph)
+    monkeypatch.setattr(nl_query, "connect_async_graph", lambda *args: async_graph)
+    return nl_query.NaturalLanguageQueryInterface(**kwargs)
+
+
+class SlowGraph:
+    """Async graph whose queries sleep, tracking how many overlap."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.timeouts = []
+
+    async def ro_query(self, q, params=None, timeout=None):
+        self.timeouts.append(timeout)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return SimpleNamespace(result_set=[[1]], cached_execution=True, run_time_ms=0.2)
+
+
+def test_repeated_questions_are_served_from_cache_until_ingestion(monkeypatch):
+    graph = RedisGraph(rows=[["con_1", "matter_001", "c_1", "Client", "Net 45", "low", "cash flow", "v2", "v2", 7, 3]])
+    nl = connect(monkeypatch, graph)
+    nl.epoch.refresh_seconds = 0
+
+    first = nl.execute_query("Show me all concessions")
+    second = nl.execute_query("list every concession")
+    assert (first["cached"], second["cached"]) == (False, True)
+    assert first["results"] == second["results"]
+    assert graph.queries == 1
+
+    bump_epoch(graph)
+    assert nl.execute_query("Show me all concessions")["cached"] is False
+    assert graph.queries == 2
+    assert nl.cache.stats()["invalidations"] == 1
+
+
+def test_interface_serves_threads_through_one_pool_and_reports_timeouts(monkeypatch):
+    graph = RedisGraph(rows=[["matter_001", 2, "1.1", "Liability cap", "limitation", -1.5, 7]])
+    nl = connect(monkeypatch, graph, cache_size=0, max_connections=2)
+    answers = []
+
+    threads = [
+        threading.Thread(target=lambda: answers.append(nl.execute_query("Find liability clauses")))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    nl.close()
+
+    assert [a["success"] for a in answers] == [True] * 4
+    assert graph.queries == 4
+    assert nl.async_graph.max_in_flight == 2
+    assert nl.async_graph.cache_report()[0]["calls"] == 4
+    assert nl.async_graph.graph.closed
+
+    slow = connect(monkeypatch, graph, cache_size=0, query_timeout_ms=10, async_graph=SlowGraph(delay=1.0))
+    result = slow.execute_query("Find liability clauses")
+
+    assert result["success"] is False
+    assert result["error"] == "Query timed out after 10ms"
+
+
+def test_list_questions_page_through_every_row_once(monkeypatch):
+    rows = [
+        [f"con_{n}", "matter_001", f"c_{n}", "Client", f"change {n}", "low", "why", f"2025-01-{n:02d}",
+         f"2025-01-{n:02d}", n, 100 + n]
+        for n in range(1, 8)
+    ]
+    graph = RedisGraph(rows=list(reversed(rows)))
+    nl = connect(monkeypatch, graph, cache_size=0)
+
+    pages = [nl.execute_query("Show me all concessions", page_size=3)]
+    while pages[-1]["next_token"]:
+        pages.append(nl.execute_query("Show me all concessions", page_token=pages[-1]["next_token"], page_size=3))
+
+    assert [p["results_count"] for p in pages] == [3, 3, 1]
+    assert [p["page_start"] for p in pages] == [1, 4, 7]
+    text = "".join(p["results"] for p in pages)
+    assert [f"change {n}" in text for n in range(1, 8)] == [True] * 7
+    assert "Found 3 concession(s)" in pages[0]["results"]
+    assert "Concession(s) 4-6" in pages[1]["results"]
+    assert "7. matter_001 - Clause ID: c_7" in pages[2]["results"]
+
+    stray = nl.execute_query("Find liability clauses", page_token=pages[0]["next_token"])
+    assert stray["success"] is False
+    assert "different question" in stray["error"]
+
+
+class IndexedRedisGraph(RedisGraph):
+    """RedisGraph that also answers ``CALL db.indexes()`` on the sync handle."""
+
+    def __init__(self, rows=None, indexes=()):
+        super().__init__(rows)
+        self.indexes = list(indexes)
+
+    def query(self, q, params=None):
+        assert q == "CALL db.indexes()"
+        return SimpleNamespace(result_set=self.indexes)
+
+
+def test_clause_search_scans_until_the_fulltext_index_exists(monkeypatch):
+    graph = IndexedRedisGraph(rows=[["matter_001", 2, "1.1", "Liability cap", "limitation", "matter_001", 2, "1.1", 7]])
+    nl = connect(monkeypatch, graph, cache_size=0)
+
+    scanned = nl.execute_query("Find liability clauses")
+    assert scanned["success"], scanned
+    assert "CONTAINS toLower($keyword)" in scanned["cypher"]
+    assert scanned["params"]["keyword"] == "liability"
+    assert "Liability cap" in scanned["results"]
+
+    graph.indexes = [["Clause", ["title", "category", "text_preview"],
+                      {"title": ["FULLTEXT"], "category": ["FULLTEXT"], "text_preview": ["FULLTEXT"]}]]
+    graph.rows = [["matter_001", 2, "1.1", "Liability cap", "limitation", -1.5, 7]]
+    indexed = nl.execute_query("Find liability clauses")
+    nl.close()
+
+    assert indexed["success"], indexed
+    assert "db.idx.fulltext.queryNodes" in indexed["cypher"]
+    assert "Liability cap" in indexed["results"]
+
+
+class SummaryRedisGraph(RedisGraph):
+    """RedisGraph whose GraphSummary view exists only once ``summary`` is set."""
+
+    def __init__(self, rows=None):
+        super().__init__(rows)
+        self.summary = []
+
+    def ro_query(self, q, params=None):
+        if q == GRAPH_SUMMARY_QUERY:
+            return SimpleNamespace(result_set=self.summary)
+        return super().ro_query(q, params)
+
+
+def test_overview_questions_aggregate_until_the_summary_views_exist(monkeypatch):
+    graph = SummaryRedisGraph(rows=[[2, 4, 30, 12, 9, 3]])
+    nl = connect(monkeypatch, graph, cache_size=0)
+
+    aggregated = nl.execute_query("How many clauses are there?")
+    assert aggregated["success"], aggregated
+    assert "COUNT(c) as clauses" in aggregated["cypher"]
+    assert "Clauses: 30" in aggregated["results"]
+
+    graph.rows = [["APPLY", 6, 67.0], ["OVERRIDE", 3, 33.0]]
+    distribution = nl.execute_query("Show decision breakdown by type")
+    assert distribution["success"], distribution
+    assert "MATCH (d:Decision)" in distribution["cypher"]
+    graph.rows = [[2, 4, 30, 12, 9, 3]]
+
+    graph.summary = [[2, 4, 30, 12, 9, 3]]
+    summarised = nl.execute_query("How many clauses are there?")
+    nl.close()
+
+    assert "MATCH (g:GraphSummary)" in summarised["cypher"]
+    assert summarised["results"] == aggregated["results"]
+
+
+class SnapshotRedisGraph(RedisGraph):
+    """RedisGraph that also serves a GraphSnapshot to GraphSnapshot.from_graph."""
+
+    def __init__(self, snapshot):
+        super().__init__()
+        self.snapshot = snapshot
+
+    def query(self, q, params=None):
+        if q.startswith("MATCH (n:"):
+            label = q.split(":")[1].split(")")[0]
+            return SimpleNamespace(result_set=[[i, props] for i, props in self.snapshot.nodes[label].items()])
+        rel_type = q.split("[:")[1].split("]")[0]
+        return SimpleNamespace(result_set=[list(pair) for pair in self.snapshot.edges[rel_type]])
+
+
+def test_read_model_answers_questions_without_querying_falkordb(monkeypatch):
+    from pathlib import Path
+
+    from analytics.snapshot import GraphSnapshot
+
+    snapshot = GraphSnapshot.from_matter_files(sorted(Path("data/ground_truth/synthetic").glob("*.json")))
+    graph = SnapshotRedisGraph(snapshot)
+    nl = connect(monkeypatch, graph, cache_size=0, read_model=True)
+
+    first = nl.execute_query("What did Jessica Martinez decide?", page_size=2)
+    second = nl.execute_query("What did Jessica Martinez decide?", page_token=first["next_token"], page_size=2)
+    stats = nl.execute_query("How many clauses are there?")
+    nl.close()
+
+    assert first["success"] and second["success"] and stats["success"]
+    assert (first["results_count"], second["page_start"]) == (2, 3)
+    assert f"Clauses: {len(snapshot.nodes['Clause'])}" in stats["results"]
+    assert graph.queries == 0
+    assert nl.replica.loads == 1
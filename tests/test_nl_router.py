@@ -0,0 +1,86 @@
+import pytest
+
+from scripts.nl_router import BENCHMARK_QUESTIONS, QuestionRouter, benchmark, linear_route, load_patterns
+
+PATTERNS = load_patterns()
+ROUTER = QuestionRouter(PATTERNS)
+
+CORPUS = BENCHMARK_QUESTIONS + [
+    "List every concession for matter_002",
+    "Show round 3 changes",
+    "Version 2 decisions please",
+    "Find clauses about indemnity",
+    "search clauses for 'payment'",
+    "termination clause",
+    "Decisions made by Sarah Chen",
+    "Show James Park's decisions",
+    "Any risky terms?",
+    "problem with the warranty clause",
+    "Status of contract alpha",
+    "Summary of matter_003",
+    "How did clause 2.3 evolve?",
+    "clause 4.1 version changes",
+    "total recommendations",
+    "Show override decisions",
+    "stats",
+    "",
+]
+
+
+def intent_of(index):
+    return PATTERNS[index]["intent"]
+
+
+@pytest.mark.parametrize("question", CORPUS)
+def test_router_picks_the_same_intent_as_the_pattern_loop(question):
+    route = ROUTER.route(question)
+    legacy = linear_route(PATTERNS, question)
+
+    assert (route.intent if route else None) == (intent_of(legacy[0]) if legacy else None)
+
+
+def test_router_extracts_typed_parameters():
+    def params(question):
+        return ROUTER.route(question).params
+
+    assert params("What did we agree to in round 2?") == {"version": 2}
+    assert params("Find liability clauses") == {"keyword": "liability"}
+    assert params("What did Sarah Chen decide?") == {"actor": "Sarah Chen"}
+    assert params("Overview of matter_001") == {"matter_id": "matter_001"}
+    # The pattern loop raised ValueError here: the pattern text mentions
+    # "version", so "1.1" was passed through int()
+    assert params("clause 1.1 version changes") == {"clause_number": "1.1"}
+    assert params("Track clause 1.1. history") == {"clause_number": "1.1"}
+    assert params("Show unfavorable terms") == {}
+
+
+@pytest.mark.parametrize("question, intent", [
+    ("Show decision breakdown by type", "decision_distribution"),
+    ("decision types by matter", "decision_distribution"),
+    ("Show decision distribution by version", "decision_distribution"),
+])
+def test_grouping_words_are_not_taken_for_actors(question, intent):
+    assert ROUTER.route(question).intent == intent
+
+
+def test_pronouns_are_not_taken_for_actors():
+    route = ROUTER.route("what did we do in version 3")
+    assert route is None or route.intent != "actor_decisions"
+    assert ROUTER.route("what did they decide?") is None
+    assert ROUTER.route("Reviews by Jessica Martinez").params == {"actor": "Jessica Martinez"}
+
+
+def test_earliest_match_wins_over_pattern_order():
+    patterns = [
+        {"intent": "late", "patterns": [r"totals?"]},
+        {"intent": "early", "patterns": [r"^show"]},
+    ]
+    router = QuestionRouter(patterns)
+
+    assert router.route("show totals").intent == "early"
+    assert router.route("totals").intent == "late"
+    assert linear_route(patterns, "show totals")[0] == 0
+
+
+def test_benchmark_reports_questions_per_second():
+    assert benchmark(ROUTER.route, BENCHMARK_QUESTIONS, 5) > 0
@@ -0,0 +1,43 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from scripts.ingest.basic_ingestion import group_matter_files
+from scripts.ingest.parallel import MatterResult, run_matters, summarize_workers
+
+SYNTHETIC_DIR = Path("data/ground_truth/synthetic")
+
+
+def count_versions(matter, versions):
+    return MatterResult(matter=matter, files=len(versions), rows=sum(versions))
+
+
+def test_run_matters_fans_out_and_keeps_results():
+    jobs = [(f"matter_{i}", [1, 2, 3]) for i in range(4)]
+
+    results = run_matters(count_versions, jobs, workers=2)
+
+    assert [result.matter for result in results] == [f"matter_{i}" for i in range(4)]
+    assert all(result.rows == 6 for result in results)
+    assert all(result.worker != os.getpid() for result in results)
+    summaries = summarize_workers(results)
+    assert sum(summary.matters for summary in summaries) == 4
+    assert sum(summary.rows for summary in summaries) == 24
+
+
+def test_run_matters_serial_runs_in_process():
+    results = run_matters(count_versions, [("m", [5])], workers=1)
+    assert results[0].worker == os.getpid()
+    with pytest.raises(ValueError):
+        run_matters(count_versions, [], workers=0)
+
+
+def test_group_matter_files_orders_versions():
+    groups = group_matter_files([SYNTHETIC_DIR / "matter_002_v2.json", SYNTHETIC_DIR])
+
+    assert list(groups) == ["matter_001", "matter_002", "matter_003"]
+    assert [path.name for path in groups["matter_001"]] == [
+        "matter_001_v1.json", "matter_001_v2.json", "matter_001_v3.json", "matter_001_v4.json"
+    ]
+    assert len(groups["matter_002"]) == 4
@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from models import Clause
+from scripts.ingest.load_graphiti import (
+    PayloadValidationError,
+    collect_validation_issues,
+    iter_matter_payloads,
+    summarize_payloads,
+    validate_payloads,
+)
+from scripts.ingest.manifest import FileManifest, file_checksum, manifest_key
+
+
+def clause(i, **overrides):
+    raw = {
+        "clause_id": f"c{i}",
+        "canonical_clause_id": f"cc{i}",
+        "version_id": "v1",
+        "section_path": str(i),
+        "text": f"Clause {i}",
+    }
+    raw.update(overrides)
+    return raw
+
+
+def test_collects_every_error_with_its_index():
+    blobs = [
+        {"clauses": [clause(0), clause(1, text=None)]},
+        {"clauses": [clause(2), clause(3, section_path=None, version_id=None)]},
+    ]
+
+    issues = collect_validation_issues(blobs, source="bundle.json")
+
+    assert [(issue.index, issue.location) for issue in issues] == [
+        (1, "text"),
+        (3, "version_id"),
+        (3, "section_path"),
+    ]
+    with pytest.raises(PayloadValidationError) as excinfo:
+        validate_payloads(blobs)
+    assert len(excinfo.value.issues) == 3
+
+
+def test_invalid_items_are_skipped_and_valid_ones_kept(tmp_path):
+    (tmp_path / "a.json").write_text(json.dumps({"clauses": [clause(0), clause(1, text=None), clause(2)]}))
+    summary, issues, validated = summarize_payloads([]), [], {}
+
+    blobs = list(iter_matter_payloads(tmp_path, 2, summary, issues, validated=validated))
+
+    assert [c.clause_id for blob in blobs for c in blob["clauses"]] == ["c0", "c2"]
+    assert summary["clauses"] == 3
+    assert [issue.index for issue in issues] == [1]
+    assert validated == {}
+
+
+def test_trusted_files_skip_validation_until_they_change(tmp_path):
+    matter_dir = tmp_path / "matter"
+    matter_dir.mkdir()
+    bundle = matter_dir / "a.json"
+    bundle.write_text(json.dumps({"clauses": [clause(0)]}))
+    manifest = FileManifest.load(tmp_path / "manifest.json")
+
+    validated = {}
+    list(iter_matter_payloads(matter_dir, 10, summarize_payloads([]), [], validated=validated))
+    for key, checksum in validated.items():
+        manifest.mark_validated(key, checksum)
+    manifest.save()
+
+    trusted = FileManifest.load(tmp_path / "manifest.json").validated_checksums()
+    assert trusted == {manifest_key(bundle): file_checksum(bundle)}
+
+    rerun = {}
+    blobs = list(iter_matter_payloads(matter_dir, 10, summarize_payloads([]), [],
+                                      trusted_checksums=trusted, validated=rerun))
+    assert isinstance(blobs[0]["clauses"][0], Clause)
+    assert rerun == {}
+
+    bundle.write_text(json.dumps({"clauses": [clause(0, text="edited")]}))
+    list(iter_matter_payloads(matter_dir, 10, summarize_payloads([]), [],
+                              trusted_checksums=trusted, validated=rerun))
+    assert rerun == {manifest_key(bundle): file_checksum(bundle)}
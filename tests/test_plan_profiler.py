@@ -0,0 +1,78 @@
+import json
+
+from falkordb.execution_plan import ExecutionPlan
+
+from analytics.plan_profiler import fill_parameters, find_issues, plan_tree, profile_query, write_reports
+
+EXPLAIN_LINES = [
+    "Results",
+    "    Project",
+    "        Cartesian Product",
+    "            Filter",
+    "                Node By Label Scan | (c:Clause)",
+    "            All Node Scan | (n)",
+]
+
+PROFILE_LINES = [
+    "Results | Records produced: 2, Execution time: 0.002100 ms",
+    "    Project | Records produced: 2, Execution time: 0.010000 ms",
+    "        Node By Index Scan | (c:Clause) | Records produced: 2, Execution time: 0.300000 ms",
+]
+
+
+class PlanGraph:
+    def __init__(self, explain_lines, profile_lines=None, fail=False):
+        self.explain_lines, self.profile_lines, self.fail = explain_lines, profile_lines, fail
+        self.calls = []
+
+    def explain(self, q, params=None):
+        self.calls.append(("explain", params))
+        if self.fail:
+            raise RuntimeError("Missing parameters")
+        return ExecutionPlan(list(self.explain_lines))
+
+    def profile(self, q, params=None):
+        self.calls.append(("profile", params))
+        return ExecutionPlan(list(self.profile_lines))
+
+
+def test_plan_tree_and_findings_from_explain_output():
+    root = plan_tree(ExecutionPlan(list(EXPLAIN_LINES)))
+    findings = {f.kind: f for f in find_issues(root)}
+
+    assert [node.operator for node, _ in root.walk()] == [
+        "Results", "Project", "Cartesian Product", "Filter", "Node By Label Scan", "All Node Scan",
+    ]
+    assert set(findings) == {"cartesian_product", "label_scan", "all_node_scan"}
+    assert findings["label_scan"].args == "(c:Clause)"
+    assert "filtered" in findings["label_scan"].message
+    assert "2 unconnected" in findings["cartesian_product"].message
+
+
+def test_profile_query_keeps_operator_stats_and_fills_missing_params():
+    graph = PlanGraph(PROFILE_LINES, PROFILE_LINES)
+    cypher = "MATCH (c:Clause {matter_id: $matter_id, version: $version}) RETURN c"
+
+    result = profile_query(graph, "clauses", "nl", cypher, {"matter_id": "m1", "unused": 1})
+
+    assert graph.calls == [("explain", {"matter_id": "m1", "version": None}),
+                           ("profile", {"matter_id": "m1", "version": None})]
+    scan = result.profile.children[0].children[0]
+    assert (scan.operator, scan.records, scan.time_ms) == ("Node By Index Scan", 2, 0.3)
+    assert result.findings == []
+    assert round(result.total_time_ms, 4) == 0.3121
+    assert fill_parameters("RETURN 1", {"a": 1}) == {}
+
+
+def test_profile_errors_are_reported_and_written(tmp_path):
+    failing = profile_query(PlanGraph([], fail=True), "broken", "template", "RETURN $x")
+    scanned = profile_query(PlanGraph(EXPLAIN_LINES), "scan", "template", "MATCH (n) RETURN n", run_profile=False)
+
+    index_path = write_reports([failing, scanned], tmp_path)
+    index = json.loads(index_path.read_text())["queries"]
+    scan_report = json.loads((tmp_path / "template__scan.json").read_text())
+
+    assert failing.error == "RuntimeError: Missing parameters" and failing.explain is None
+    assert index[0]["error"] and index[1]["findings"] == ["all_node_scan", "cartesian_product", "label_scan"]
+    assert scan_report["profile"] is None
+    assert scan_report["explain"]["children"][0]["operator"] == "Project"
@@ -0,0 +1,45 @@
+from types import SimpleNamespace
+
+from graphdb import QueryRunner
+
+
+class FakeGraph:
+    def __init__(self):
+        self.seen = set()
+        self.calls = []
+
+    def _run(self, q, params):
+        self.calls.append((q, params))
+        cached = q in self.seen
+        self.seen.add(q)
+        return SimpleNamespace(result_set=[], cached_execution=cached, run_time_ms=0.5)
+
+    def query(self, q, params=None):
+        return self._run(q, params)
+
+    def ro_query(self, q, params=None):
+        return self._run(q, params)
+
+
+def test_runner_tracks_plan_cache_hits_per_query_text():
+    graph = FakeGraph()
+    runner = QueryRunner(graph)
+
+    for matter_id in ("matter_001", "matter_002", "matter_003"):
+        runner.ro_query("MATCH (m:Matter {matter_id: $matter_id}) RETURN m", params={"matter_id": matter_id})
+    runner.query("MATCH (n) RETURN COUNT(n)")
+
+    report = runner.cache_report()
+    assert runner.distinct_queries == 2
+    assert report[0]["calls"] == 3
+    assert report[0]["cached"] == 2
+    assert runner.hit_rate == 0.5
+    assert graph.calls[0][1] == {"matter_id": "matter_001"}
+
+
+def test_runner_reset_clears_stats():
+    runner = QueryRunner(FakeGraph())
+    runner.query("RETURN 1")
+    runner.reset()
+    assert runner.cache_report() == []
+    assert runner.hit_rate == 0.0
@@ -0,0 +1,139 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+from analytics.clause_index import fulltext_query
+from analytics.read_model import KPI5_HANDLERS, NL_INTENTS, ReadModel, ReadReplica, keyset_page
+from analytics.snapshot import GraphSnapshot
+from conftest import KeyValueGraph
+from graphdb import bump_epoch
+from scripts.measure_kpis import KPI5_QUERIES
+from scripts.nl_paging import Cursor, Page
+
+MATTER_FILES = sorted(Path("data/ground_truth/synthetic").glob("*.json"))
+SNAPSHOT = GraphSnapshot.from_matter_files(MATTER_FILES)
+
+
+def paths(snapshot, *hops):
+    """Every (node, node, ...) path along ``hops`` relationship types, by brute force."""
+    found = [[src, dst] for src, dst in snapshot.edges[hops[0]]]
+    for rel_type in hops[1:]:
+        found = [path + [dst] for path in found for src, dst in snapshot.edges[rel_type] if src == path[-1]]
+    return found
+
+
+class SnapshotGraph(KeyValueGraph):
+    """Graph handle serving ``snapshot`` to GraphSnapshot.from_graph, with a write epoch."""
+
+    def __init__(self, snapshot):
+        super().__init__()
+        self.snapshot = snapshot
+        self.loads = 0
+        self.forwarded = []
+
+    def query(self, q, params=None):
+        if q.startswith("MATCH (n:Matter)"):
+            self.loads += 1
+        if q.startswith("MATCH (n:"):
+            label = q.split(":")[1].split(")")[0]
+            rows = [[node_id, props] for node_id, props in self.snapshot.nodes[label].items()]
+        else:
+            rel_type = q.split("[:")[1].split("]")[0]
+            rows = [list(pair) for pair in self.snapshot.edges[rel_type]]
+        return SimpleNamespace(result_set=rows)
+
+    def ro_query(self, q, params=None):
+        self.forwarded.append(q)
+        return SimpleNamespace(result_set=[["live"]], run_time_ms=1.0)
+
+
+def first_page(key_count, **params):
+    return {**params, **Cursor(0).query_params(key_count, 1000)}
+
+
+def test_nl_intents_follow_the_graph_paths():
+    model = ReadModel(SNAPSHOT)
+
+    concessions = model.concessions(first_page(3))
+    assert len(concessions) == len(SNAPSHOT.edges["RESULTED_IN_CONCESSION"]) == 2
+    assert [row[-3:] for row in concessions] == sorted(row[-3:] for row in concessions)
+
+    jessica = model.actor_decisions(first_page(4, actor="Jessica Martinez"))
+    expected = [p for p in paths(SNAPSHOT, "HAS_RECOMMENDATION", "HAS_DECISION")
+                if SNAPSHOT.nodes["Decision"][p[2]]["actor"] == "Jessica Martinez"]
+    assert len(jessica) == len(expected) > 0
+    assert all(len(row[6]) <= 100 for row in jessica)
+
+    unfavorable = model.unfavorable_terms(first_page(6))
+    flagged = [p for p in paths(SNAPSHOT, "HAS_RECOMMENDATION")
+               if SNAPSHOT.nodes["Recommendation"][p[1]]["classification"] == "unfavorable"]
+    decided = {src for src, _ in SNAPSHOT.edges["HAS_DECISION"]}
+    undecided = sum(1 for _, rec_id in flagged if rec_id not in decided)
+    with_decision = [p for p in paths(SNAPSHOT, "HAS_RECOMMENDATION", "HAS_DECISION") if p[:2] in flagged]
+    assert len(unfavorable) == undecided + len(with_decision) > 0
+    assert sum(row[-1] == -1 for row in unfavorable) == undecided
+
+    liability = model.clause_search(first_page(2, terms=fulltext_query("LIABILITY")))
+    texts = {clause_id: " ".join(str(c.get(f)) for f in ("title", "category", "text_preview")).lower()
+             for clause_id, c in SNAPSHOT.nodes["Clause"].items()}
+    assert len(liability) == sum("liabilit" in text for text in texts.values())
+    assert [row[-2:] for row in liability] == sorted(row[-2:] for row in liability)
+    assert "liability" in (liability[0][3] + liability[0][4]).lower()
+    assert model.clause_search(first_page(2, terms=None)) == []
+
+    round_two = model.round_decisions(first_page(5, version=2))
+    assert round_two and {row[1] for row in round_two} == {2}
+
+    overview = model.matter_overview({"matter_id": "matter_001"})
+    assert [row[1] for row in overview] == sorted(row[1] for row in overview)
+    assert sum(row[4] for row in overview) == sum(
+        1 for c in SNAPSHOT.nodes["Clause"].values() if c["matter_id"] == "matter_001")
+
+    history = model.clause_history(first_page(5, clause_number="1.1"))
+    assert {row[2] for row in history} == {"1.1"}
+
+    assert model.statistics({}) == [[len(SNAPSHOT.nodes[label]) for label in
+                                     ("Matter", "Party", "Clause", "Recommendation", "Decision", "Concession")]]
+    distribution = model.decision_distribution({})
+    assert sum(row[1] for row in distribution) == len(SNAPSHOT.nodes["Decision"])
+    assert all(isinstance(row[2], float) for row in distribution)
+
+
+def test_keyset_pages_cover_every_row_once_in_order():
+    model = ReadModel(SNAPSHOT)
+    everything = model.clause_history(first_page(5, clause_number="1.1"))
+    cursor, seen = Cursor(0), []
+    while cursor is not None:
+        rows = model.clause_history({"clause_number": "1.1", **cursor.query_params(5, 4)})
+        page = Page(rows, 5, 4, cursor)
+        seen += rows[:page.count]
+        cursor = page.next_cursor()
+    assert seen == everything
+    assert keyset_page([[2, 1], [1, 0]], {"after_0": None, "limit": None}) == [[1, 0], [2, 1]]
+
+
+def test_replica_answers_registered_queries_locally_until_the_epoch_changes():
+    graph = SnapshotGraph(SNAPSHOT)
+    replica = ReadReplica(graph, {q["query"]: KPI5_HANDLERS[q["name"]] for q in KPI5_QUERIES})
+    replica.epoch.refresh_seconds = 0
+
+    by_name = {q["name"]: q["query"] for q in KPI5_QUERIES}
+    tracking = replica.ro_query("  " + by_name["Cross-Version Clause Tracking"].strip())
+    assert [row[0] for row in tracking.result_set] == sorted(row[0] for row in tracking.result_set)
+    assert len(replica.ro_query(by_name["All Unfavorable Recommendations"]).result_set) == 10
+    coverage = replica.ro_query(by_name["Recommendation Coverage"]).result_set
+    assert len(coverage) == len(SNAPSHOT.nodes["Matter"])
+    assert graph.loads == 1 and graph.forwarded == []
+
+    assert replica.ro_query("MATCH (n) RETURN count(n)").result_set == [["live"]]
+    assert graph.forwarded == ["MATCH (n) RETURN count(n)"]
+
+    bump_epoch(graph)
+    replica.ro_query(by_name["Decision Type Distribution"])
+    assert graph.loads == 2 and replica.loads == 2
+
+
+def test_every_nl_intent_and_kpi_query_has_a_handler():
+    from scripts.nl_router import load_patterns
+
+    assert {pattern["intent"] for pattern in load_patterns()} == set(NL_INTENTS)
+    assert {q["name"] for q in KPI5_QUERIES} == set(KPI5_HANDLERS)
@@ -0,0 +1,73 @@
+import json
+import random
+
+import pytest
+
+from analytics.regression import (
+    compare_latency,
+    kpi_regressions,
+    mann_whitney_greater,
+    metrics_runs,
+)
+
+
+def brute_force_u(baseline, current):
+    return sum((c > b) + 0.5 * (c == b) for b in baseline for c in current)
+
+
+def test_u_statistic_matches_pair_counting_with_ties():
+    rng = random.Random(3)
+    baseline = [rng.choice([1.0, 2.0, 2.5, 3.0]) for _ in range(20)]
+    current = [rng.choice([2.0, 2.5, 3.0, 4.0]) for _ in range(15)]
+
+    u, p_value = mann_whitney_greater(baseline, current)
+
+    assert u == brute_force_u(baseline, current)
+    assert 0 <= p_value < 0.05
+
+
+def test_p_value_extremes():
+    # Complete separation: exact one-sided p is 1 / C(16, 8)
+    _, separated = mann_whitney_greater(list(range(8)), list(range(10, 18)))
+    _, faster = mann_whitney_greater(list(range(10, 18)), list(range(8)))
+    _, identical = mann_whitney_greater([5.0] * 10, [5.0] * 10)
+
+    assert separated < 0.001
+    assert faster > 0.999
+    assert identical == 1.0
+
+
+def test_compare_latency_requires_significance_and_a_real_slowdown():
+    rng = random.Random(7)
+    baseline = [rng.gauss(10, 0.5) for _ in range(40)]
+
+    slower = compare_latency("q", baseline, [x * 1.5 for x in baseline])
+    tiny = compare_latency("q", baseline, [x + 0.2 for x in baseline])
+    noise = compare_latency("q", baseline, [rng.gauss(10, 0.5) for _ in range(40)])
+    few = compare_latency("q", baseline[:3], [x * 2 for x in baseline[:3]])
+
+    assert slower.regressed and slower.slowdown == pytest.approx(0.5, rel=0.05)
+    assert tiny.p_value < 0.05 and not tiny.regressed
+    assert not noise.regressed
+    assert not few.regressed and few.note
+
+
+def test_kpi_regressions_only_flag_pass_to_fail():
+    baseline = {"clause_linkage": True, "query_performance": True, "handover_completeness": False}
+    current = {"clause_linkage": True, "query_performance": False, "handover_completeness": False}
+
+    assert kpi_regressions(baseline, current) == ["query_performance"]
+
+
+def test_metrics_runs_group_ok_latencies_by_run(tmp_path):
+    path = tmp_path / "metrics.jsonl"
+    records = [
+        {"run_id": "r1", "query": "a", "status": "ok", "latency_ms": 1.0},
+        {"run_id": "r1", "query": "a", "status": "error", "latency_ms": 9.0},
+        {"run_id": "r2", "query": "a", "status": "ok", "latency_ms": 2.0},
+        {"query": "a", "status": "skipped"},
+    ]
+    path.write_text("\n".join(json.dumps(r) for r in records) + "\n")
+
+    assert metrics_runs(path) == {"r1": {"a": [1.0]}, "r2": {"a": [2.0]}}
+    assert metrics_runs(tmp_path / "missing.jsonl") == {}
@@ -0,0 +1,59 @@
+from conftest import KeyValueGraph
+from graphdb import GraphEpoch, QueryRunner, ResultCache, bump_epoch, cache_key, read_epoch
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_key_ignores_parameter_order_and_spacing_but_not_case():
+    assert cache_key("actor_decisions", {"actor": " Sarah  Chen", "version": 2}) == \
+        cache_key("actor_decisions", {"version": 2, "actor": "Sarah Chen"})
+    assert cache_key("actor_decisions", {"actor": "sarah chen"}) != cache_key("actor_decisions", {"actor": "Sarah Chen"})
+    assert cache_key("concessions", None) == cache_key("concessions", {})
+
+
+def test_cache_evicts_least_recently_used_and_expires_entries():
+    clock = Clock()
+    cache = ResultCache(max_entries=2, ttl_seconds=10, clock=clock)
+    cache.put("a", 1, "A")
+    cache.put("b", 1, "B")
+    assert cache.get("a", 1) == (True, "A")
+    cache.put("c", 1, "C")
+
+    assert cache.get("b", 1) == (False, None)
+    assert cache.evictions == 1
+
+    clock.now = 10
+    assert cache.get("a", 1) == (False, None)
+    assert cache.expirations == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_cache_drops_entries_from_an_older_epoch():
+    cache = ResultCache()
+    cache.put("a", 1, "A")
+
+    assert cache.get("a", 2) == (False, None)
+    assert cache.invalidations == 1
+    assert len(cache) == 0
+
+
+def test_epoch_is_bumped_through_a_runner_and_reread_after_refresh():
+    graph = KeyValueGraph()
+    clock = Clock()
+    epoch = GraphEpoch(QueryRunner(graph), refresh_seconds=1.0, clock=clock)
+
+    assert read_epoch(graph) == 0
+    assert epoch.current() == 0
+    assert bump_epoch(QueryRunner(graph)) == 1
+    assert graph.keys == {"negotiation_continuity:write_epoch": "1"}
+    assert epoch.current() == 0
+
+    clock.now = 1.0
+    assert epoch.current() == 1
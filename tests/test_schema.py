@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+from graphdb import SCHEMA_INDEXES, ensure_indexes
+
+
+class IndexGraph:
+    def __init__(self):
+        self.indexes = {}
+        self.statements = []
+
+    def query(self, q, params=None):
+        if q == "CALL db.indexes()":
+            rows = [
+                [label, list(types), dict(types)]
+                for label, types in self.indexes.items()
+            ]
+            return SimpleNamespace(result_set=rows)
+
+        self.statements.append(q)
+        kind = "FULLTEXT" if "FULLTEXT" in q else "RANGE"
+        label = q.split("(n:")[1].split(")")[0]
+        props = [part.strip()[2:] for part in q.split(" ON (")[1].rstrip(")").split(",")]
+        for prop in props:
+            self.indexes.setdefault(label, {}).setdefault(prop, []).append(kind)
+        return SimpleNamespace(result_set=[])
+
+
+def test_ensure_indexes_is_idempotent():
+    graph = IndexGraph()
+
+    created = ensure_indexes(graph)
+    assert "Clause(clause_id)" in created
+    assert "Clause(version)" in created
+    assert "FULLTEXT Clause(title, category, text_preview)" in created
+
+    expected = sum(
+        1 if spec.kind == "fulltext" else len(spec.properties)
+        for spec in SCHEMA_INDEXES
+    )
+    assert len(graph.statements) == expected
+
+    assert ensure_indexes(graph) == []
+    assert len(graph.statements) == expected
+
+
+def test_ensure_indexes_tolerates_concurrent_creation():
+    class RacingGraph(IndexGraph):
+        def query(self, q, params=None):
+            if q.startswith("CREATE INDEX FOR (n:Decision) ON (n.actor)"):
+                raise Exception("Attribute 'actor' is already indexed")
+            return super().query(q, params)
+
+    created = ensure_indexes(RacingGraph())
+    assert "Decision(actor)" not in created
+    assert "Decision(decision_id)" in created
+
+
+def test_ensure_indexes_adds_missing_fulltext_fields():
+    graph = IndexGraph()
+    graph.indexes["Clause"] = {"title": ["FULLTEXT"], "category": ["FULLTEXT"]}
+
+    assert "FULLTEXT Clause(title, category, text_preview)" in ensure_indexes(graph)
+    assert "CREATE FULLTEXT INDEX FOR (n:Clause) ON (n.text_preview)" in graph.statements
@@ -0,0 +1,162 @@
+import json
+from collections import Counter
+from pathlib import Path
+from types import SimpleNamespace
+
+from analytics.read_model import ReadModel
+from analytics.snapshot import GraphSnapshot
+from graphdb import graph_summary, rebuild_summaries, refresh_matter_summary
+from graphdb import summary
+
+MATTER_FILES = sorted(Path("data/ground_truth/synthetic").glob("*.json"))
+
+
+class SummaryGraph:
+    """Answers the summary recount queries from a GraphSnapshot and stores the views."""
+
+    def __init__(self):
+        self.snapshot = GraphSnapshot.from_matter_files([])
+        self.versions = {}
+        self.totals = {}
+        self.graph_totals = {}
+        self.decision_types = {}
+
+    def load(self, paths):
+        self.snapshot = GraphSnapshot.from_matter_files(paths)
+
+    def nodes(self, label, matter_id):
+        return [n for n in self.snapshot.nodes.get(label, {}).values() if n.get("matter_id") == matter_id]
+
+    def query(self, q, params=None):
+        params = params or {}
+        matter_id = params.get("matter_id")
+        if q == summary.VERSION_COUNTS_QUERY:
+            rows = ReadModel(self.snapshot).matter_overview({"matter_id": matter_id})
+        elif q == summary.UNFAVORABLE_COUNTS_QUERY:
+            model = ReadModel(self.snapshot)
+            flagged = {}
+            for clause_id in model.clauses_by_matter.get(matter_id, []):
+                for rec_id in model.linked("HAS_RECOMMENDATION", clause_id, "Recommendation"):
+                    if model.node("Recommendation", rec_id)["classification"] == "unfavorable":
+                        flagged.setdefault(model.node("Clause", clause_id)["version"], set()).add(rec_id)
+            rows = [[version, len(recs)] for version, recs in flagged.items()]
+        elif q == summary.LABEL_COUNTS_QUERY:
+            rows = [[len(self.nodes(label, matter_id)) for label in summary.COUNTED_LABELS]]
+        elif q == summary.DECISION_TYPES_QUERY:
+            rows = list(map(list, Counter(d["decision_type"] for d in self.nodes("Decision", matter_id)).items()))
+        elif q == summary.MATTER_TOTALS_QUERY:
+            rows = [[dict(self.totals[matter_id])]] if matter_id in self.totals else []
+        elif q == summary.WRITE_VERSIONS_QUERY:
+            for row in params["versions"]:
+                self.versions[row["key"]] = dict(row)
+            rows = []
+        elif q == summary.DELETE_STALE_VERSIONS_QUERY:
+            self.versions = {key: row for key, row in self.versions.items()
+                             if row["matter_id"] != matter_id or key in params["keys"]}
+            rows = []
+        elif q == summary.WRITE_TOTALS_QUERY:
+            self.totals[matter_id] = dict(params["totals"])
+            rows = []
+        elif q == summary.APPLY_DELTA_QUERY:
+            for name, delta in params["delta"].items():
+                self.graph_totals[name] = self.graph_totals.get(name, 0) + delta
+            for row in params["decision_types"]:
+                self.decision_types[row["decision_type"]] = self.decision_types.get(row["decision_type"], 0) + row["delta"]
+            rows = []
+        elif q == summary.MATTER_IDS_QUERY:
+            rows = [[m] for m in sorted({n["matter_id"] for n in self.snapshot.nodes["Matter"].values()})]
+        elif q.startswith("MATCH (s:"):
+            self.versions, self.totals, self.graph_totals, self.decision_types = {}, {}, {}, {}
+            rows = []
+        else:
+            raise AssertionError(f"unexpected query: {q}")
+        return SimpleNamespace(result_set=rows)
+
+    def ro_query(self, q, params=None):
+        assert q == summary.GRAPH_SUMMARY_QUERY
+        if not self.graph_totals:
+            return SimpleNamespace(result_set=[])
+        return SimpleNamespace(result_set=[[self.graph_totals[name] for name in summary.COUNTED_LABELS.values()]])
+
+
+def assert_views_match(graph):
+    model = ReadModel(graph.snapshot)
+    assert list(graph_summary(graph).values()) == model.statistics({})[0]
+    histogram = {decision_type: count for decision_type, count, _ in model.decision_distribution({})}
+    assert {t: c for t, c in graph.decision_types.items() if c} == histogram
+    for matter_id in {n["matter_id"] for n in graph.snapshot.nodes["Matter"].values()}:
+        views = sorted((row for row in graph.versions.values() if row["matter_id"] == matter_id),
+                       key=lambda row: row["version"])
+        expected = model.matter_overview({"matter_id": matter_id})
+        assert [[row[k] for k in ("matter_id", "version", "matter_type", "timestamp", "clauses",
+                                  "recommendations", "decisions", "concessions")] for row in views] == expected
+
+
+def test_views_follow_ingestion_as_deltas():
+    graph = SummaryGraph()
+    assert graph_summary(graph) == {}
+
+    for count in range(1, len(MATTER_FILES) + 1):
+        graph.load(MATTER_FILES[:count])
+        matter_id = json.loads(MATTER_FILES[count - 1].read_text())["matter_id"]
+        delta = refresh_matter_summary(graph, matter_id)
+        assert delta["matters"] == 1
+        assert_views_match(graph)
+
+    assert all(row["unfavorable"] <= row["recommendations"] for row in graph.versions.values())
+    assert sum(row["unfavorable"] for row in graph.versions.values()) > 0
+
+
+def test_refreshing_an_unchanged_matter_is_a_no_op_and_rebuild_agrees():
+    graph = SummaryGraph()
+    graph.load(MATTER_FILES)
+    matter_ids = sorted({n["matter_id"] for n in graph.snapshot.nodes["Matter"].values()})
+    for matter_id in matter_ids:
+        refresh_matter_summary(graph, matter_id)
+    totals = dict(graph.graph_totals)
+
+    assert set(refresh_matter_summary(graph, matter_ids[0]).values()) == {0}
+    assert graph.graph_totals == totals
+
+    assert rebuild_summaries(graph) == len(matter_ids)
+    assert graph.graph_totals == totals
+    assert_views_match(graph)
+
+
+def test_totals_delta_tracks_decision_types():
+    old = {"decisions": 3, "decision_types": ["apply", "defer"], "decision_type_counts": [2, 1]}
+    new = {"decisions": 4, "decision_types": ["apply", "override"], "decision_type_counts": [2, 2]}
+
+    delta, types = summary.totals_delta(old, new)
+    assert delta["decisions"] == 1 and delta["matters"] == 0
+    assert types == [{"decision_type": "defer", "delta": -1}, {"decision_type": "override", "delta": 2}]
+
+
+def refreshed(snapshot):
+    graph = SummaryGraph()
+    graph.snapshot = snapshot
+    for matter_id in sorted({n["matter_id"] for n in snapshot.nodes["Matter"].values()}):
+        refresh_matter_summary(graph, matter_id)
+    return graph
+
+
+def test_read_model_leaves_untyped_decisions_out_of_the_distribution():
+    snapshot = GraphSnapshot.from_matter_files(MATTER_FILES)
+    decision = next(iter(snapshot.nodes["Decision"].values()))
+    decision["decision_type"] = None
+
+    graph = refreshed(snapshot)
+    assert None not in graph.decision_types
+    assert None not in {row[0] for row in ReadModel(snapshot).decision_distribution({})}
+    assert_views_match(graph)
+
+
+def test_read_model_counts_only_nodes_of_ingested_matters():
+    snapshot = GraphSnapshot.from_matter_files(MATTER_FILES)
+    next_id = max(max(nodes) for nodes in snapshot.nodes.values() if nodes) + 1
+    snapshot.nodes["Clause"][next_id] = {"clause_id": "stray", "matter_id": "never_ingested"}
+    snapshot.nodes["Party"][next_id + 1] = {"name": "Unscoped", "role": "provider"}
+
+    graph = refreshed(snapshot)
+    assert graph_summary(graph)["Clause"] == len(snapshot.nodes["Clause"]) - 1
+    assert_views_match(graph)
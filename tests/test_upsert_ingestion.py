@@ -0,0 +1,186 @@
+import copy
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+from scripts.ingest.upsert_ingestion import (
+    INSERT_QUERIES,
+    LOOKUP_QUERIES,
+    PROPERTIES_QUERIES,
+    UPDATE_QUERIES,
+    build_upsert_rows,
+    upsert_matter,
+    upsert_matter_file,
+)
+
+SAMPLE_FILE = Path("data/ground_truth/synthetic/matter_001_v1.json")
+
+
+class CanonicalStore:
+    """In-memory graph that understands the upsert statements."""
+
+    def __init__(self):
+        self.nodes = {}
+        self.edges = set()
+        self.writes = 0
+        self.ops = {}
+        for table, op in (
+            (LOOKUP_QUERIES, "lookup"),
+            (PROPERTIES_QUERIES, "properties"),
+            (UPDATE_QUERIES, "update"),
+            (INSERT_QUERIES, "insert"),
+        ):
+            for label, query in table.items():
+                self.ops[query] = (op, label)
+
+    def query(self, q, params=None):
+        op, label = self.ops[q]
+        store = self.nodes.setdefault(label, {})
+        if op == "lookup":
+            rows = [[k, store[k]["content_hash"]] for k in params["keys"] if k in store]
+        elif op == "properties":
+            rows = [[k, dict(store[k])] for k in params["keys"] if k in store]
+        elif op == "update":
+            self.writes += 1
+            for row in params["rows"]:
+                store[row["canonical_id"]].update(row["changes"])
+                if row.get("parent_key"):
+                    self.edges = {
+                        (parent, child) for parent, child in self.edges
+                        if child != row["canonical_id"] or parent == row["parent_key"]
+                    }
+                    self.edges.add((row["parent_key"], row["canonical_id"]))
+            rows = []
+        else:
+            self.writes += 1
+            for row in params["rows"]:
+                store.setdefault(row["canonical_id"], dict(row["props"]))
+                if row["parent_key"]:
+                    self.edges.add((row["parent_key"], row["canonical_id"]))
+            rows = []
+        return SimpleNamespace(result_set=rows)
+
+
+def load_sample():
+    with SAMPLE_FILE.open() as handle:
+        return json.load(handle)
+
+
+def test_canonical_keys_are_unique_and_linked():
+    rows = build_upsert_rows(load_sample())
+    for label, label_rows in rows.items():
+        keys = [row["canonical_id"] for row in label_rows]
+        assert len(keys) == len(set(keys)), label
+
+    clause_keys = {row["canonical_id"] for row in rows["Clause"]}
+    assert all(row["parent_key"] in clause_keys for row in rows["Recommendation"])
+
+
+def test_reingesting_unchanged_file_skips_all_writes():
+    graph = CanonicalStore()
+    data = load_sample()
+
+    first = upsert_matter(graph, data)
+    assert first["Clause"]["inserted"] == len(data["clauses"])
+    writes_after_first = graph.writes
+
+    second = upsert_matter(graph, data)
+    assert graph.writes == writes_after_first
+    assert all(stats["unchanged"] == stats["rows"] for stats in second.values())
+
+
+def test_changed_clause_only_sets_changed_properties():
+    graph = CanonicalStore()
+    data = load_sample()
+    upsert_matter(graph, data)
+
+    edited = copy.deepcopy(data)
+    edited["clauses"][0]["title"] = "Limitation of Liability (revised)"
+    stats = upsert_matter(graph, edited)
+
+    assert stats["Clause"]["updated"] == 1
+    assert stats["Clause"]["inserted"] == 0
+    assert sum(len(nodes) for nodes in graph.nodes.values()) == sum(
+        len(rows) for rows in build_upsert_rows(data).values()
+    )
+    clause = next(
+        node for node in graph.nodes["Clause"].values()
+        if node["clause_id"] == data["clauses"][0]["clause_id"]
+    )
+    assert clause["title"] == "Limitation of Liability (revised)"
+
+
+def test_streamed_file_upsert_matches_parsed_payload(monkeypatch):
+    parsed = CanonicalStore()
+    upsert_matter(parsed, load_sample())
+
+    def no_full_load(*args, **kwargs):
+        raise AssertionError("upsert must not json.load the whole file")
+
+    monkeypatch.setattr(json, "load", no_full_load)
+    streamed = CanonicalStore()
+    first = upsert_matter_file(streamed, SAMPLE_FILE, chunk_size=3)
+    assert streamed.nodes == parsed.nodes
+    assert streamed.edges == parsed.edges
+    assert all(stats["inserted"] == stats["rows"] for stats in first.values())
+
+    writes = streamed.writes
+    second = upsert_matter_file(streamed, SAMPLE_FILE, chunk_size=3)
+    assert streamed.writes == writes
+    assert all(stats["unchanged"] == stats["rows"] for stats in second.values())
+
+
+def test_next_version_adds_parties_and_concessions_alongside_the_previous_one():
+    graph = CanonicalStore()
+    v1 = load_sample()
+    v2 = copy.deepcopy(v1)
+    v2["version"] = 2
+    upsert_matter(graph, v1)
+    stats = upsert_matter(graph, v2)
+
+    assert stats["Party"]["inserted"] == len(graph.nodes["Party"]) // 2 == 2
+    assert stats["Concession"]["inserted"] == len(v1["concessions"])
+    assert len(graph.nodes["Concession"]) == 2 * len(v1["concessions"])
+
+    rows = build_upsert_rows(v2)
+    v2_decisions = {row["canonical_id"] for row in rows["Decision"]}
+    for row in rows["Concession"]:
+        parents = {parent for parent, child in graph.edges if child == row["canonical_id"]}
+        assert parents and parents <= v2_decisions
+
+
+def test_edited_timestamps_update_in_place():
+    graph = CanonicalStore()
+    data = load_sample()
+    upsert_matter(graph, data)
+    nodes = {label: set(store) for label, store in graph.nodes.items()}
+    edges = set(graph.edges)
+
+    edited = copy.deepcopy(data)
+    edited["timestamp"] = "2030-01-01T00:00:00Z"
+    edited["decisions"][0]["timestamp"] = "2030-01-02T00:00:00Z"
+    stats = upsert_matter(graph, edited)
+
+    assert stats["Decision"]["updated"] == 1
+    assert stats["Matter"]["updated"] == 1
+    assert all(entry["inserted"] == 0 for entry in stats.values())
+    assert {label: set(store) for label, store in graph.nodes.items()} == nodes
+    assert graph.edges == edges
+
+
+def test_update_moves_the_parent_relationship():
+    graph = CanonicalStore()
+    data = load_sample()
+    upsert_matter(graph, data)
+
+    moved = copy.deepcopy(data)
+    concession = moved["concessions"][0]
+    other = next(d for d in moved["decisions"] if d["decision_id"] != concession["decision_id"])
+    concession["decision_id"] = other["decision_id"]
+    stats = upsert_matter(graph, moved)
+
+    assert stats["Concession"]["updated"] == 1
+    assert all(entry["inserted"] == 0 for entry in stats.values())
+    row = build_upsert_rows(moved)["Concession"][0]
+    parents = {parent for parent, child in graph.edges if child == row["canonical_id"]}
+    assert parents == {row["parent_key"]}